@@ -1,9 +1,21 @@
 import json
 import os
-from typing import Dict, List
+from typing import Any, Dict, List
 from dataclasses import dataclass
 from datetime import datetime
 
+# 可在界面中调整的设置及其默认值
+DEFAULT_SETTINGS = {
+    # 字符串超过该字节数时使用只读的分块查看模式
+    'large_string_threshold': 1024 * 1024,
+    # 键值缓存的容量（MB）
+    'value_cache_mb': 64,
+    # 连接池：每个数据库的最大连接数、健康检查间隔（秒）、是否开启 TCP keepalive
+    'pool_max_connections': 16,
+    'health_check_interval': 30,
+    'socket_keepalive': True,
+}
+
 @dataclass
 class ConnectionConfig:
     name: str
@@ -18,6 +30,7 @@ class ConfigManager:
         self.config_file = os.path.join(os.path.expanduser("~"), ".redis-gui", "config.json")
         self._ensure_config_dir()
         self.connections: Dict[str, ConnectionConfig] = {}
+        self.settings: Dict[str, Any] = dict(DEFAULT_SETTINGS)
         self.load_config()
 
     def _ensure_config_dir(self):
@@ -29,13 +42,22 @@ class ConfigManager:
                 data = json.load(f)
                 for conn in data.get('connections', []):
                     self.connections[conn['name']] = ConnectionConfig(**conn)
+                self.settings.update(data.get('settings', {}))
 
     def save_config(self):
         with open(self.config_file, 'w') as f:
             json.dump({
-                'connections': [vars(conn) for conn in self.connections.values()]
+                'connections': [vars(conn) for conn in self.connections.values()],
+                'settings': self.settings
             }, f, indent=2)
 
+    def get_setting(self, name: str) -> Any:
+        return self.settings.get(name, DEFAULT_SETTINGS.get(name))
+
+    def set_setting(self, name: str, value: Any):
+        self.settings[name] = value
+        self.save_config()
+
     def add_connection(self, name: str, host: str, port: int, password: str, db: int):
         self.connections[name] = ConnectionConfig(
             name=name,
@@ -0,0 +1,448 @@
+from PyQt6.QtWidgets import *
+from PyQt6.QtCore import *
+import csv
+import os
+
+from src.gui.workers import MemoryAnalysisWorker, RdbAnalysisWorker
+from src.gui.key_tree_model import KeyTreeModel
+from src.utils.formatting import format_bytes, format_ttl
+from src.utils.prefix_stats import PrefixStats, TTL_BUCKET_NAMES, DEFAULT_MAX_DEPTH, DEFAULT_TOP_N
+
+# MEMORY USAGE 的默认 SAMPLES（Redis 自身的默认值也是 5）
+DEFAULT_MEMORY_SAMPLES = 5
+# 每批 SCAN/管道处理的键数量、批次之间的默认休眠（毫秒）
+ANALYSIS_BATCH_SIZE = 500
+DEFAULT_ANALYSIS_PAUSE_MS = 10
+# RDB 分析时放入键树的最大键数量，超出的键只计入前缀统计（保证大文件的内存占用有上限）
+MAX_RDB_TREE_KEYS = 200000
+
+
+class ReportTableModel(QAbstractTableModel):
+    """
+    只读的统计表格模型
+
+    COLUMNS 中每列为 (标题, 取值函数, 显示函数)：排序和导出 CSV 使用取值函数的
+    原始值，显示函数只负责格式化，为 None 时直接显示原始值。
+    """
+
+    COLUMNS = []
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+        self._sort_column = None
+        self._sort_order = Qt.SortOrder.DescendingOrder
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section][0]
+        return section + 1
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        _, value_of, display = self.COLUMNS[index.column()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = value_of(self, self.rows[index.row()])
+            return display(value) if display else str(value)
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() > 0:
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        return None
+
+    def set_rows(self, rows):
+        """替换所有行，保持当前的排序方式"""
+        rows = list(rows)
+        if len(rows) < len(self.rows):
+            self.beginResetModel()
+            self.rows = self._sorted(rows)
+            self.endResetModel()
+            return
+        if len(rows) > len(self.rows):
+            # 先追加行数，再整体按排序重新排列，视图保持当前的滚动位置
+            self.beginInsertRows(QModelIndex(), len(self.rows), len(rows) - 1)
+            self.rows = self.rows + rows[len(self.rows):]
+            self.endInsertRows()
+        self.layoutAboutToBeChanged.emit()
+        self.rows = self._sorted(rows)
+        self.layoutChanged.emit()
+        if self.rows:
+            self.dataChanged.emit(self.index(0, 0),
+                                  self.index(len(self.rows) - 1, len(self.COLUMNS) - 1))
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self._sort_column = column
+        self._sort_order = order
+        self.layoutAboutToBeChanged.emit()
+        self.rows = self._sorted(self.rows)
+        self.layoutChanged.emit()
+
+    def _sorted(self, rows):
+        if self._sort_column is None:
+            return rows
+        value_of = self.COLUMNS[self._sort_column][1]
+        return sorted(rows, key=lambda row: value_of(self, row),
+                      reverse=self._sort_order == Qt.SortOrder.DescendingOrder)
+
+    def export_csv(self, path: str):
+        """按当前顺序导出为 CSV（数值列为原始值）"""
+        with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow([header for header, _, _ in self.COLUMNS])
+            for row in self.rows:
+                writer.writerow([value_of(self, row) for _, value_of, _ in self.COLUMNS])
+
+
+def create_report_table(model, sort_column, first_column_width=260):
+    """创建显示 ReportTableModel 的表格，默认按 sort_column 降序排列"""
+    table = QTableView()
+    table.setModel(model)
+    table.setSortingEnabled(True)
+    table.sortByColumn(sort_column, Qt.SortOrder.DescendingOrder)
+    table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+    table.setWordWrap(False)
+    table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    table.verticalHeader().setDefaultSectionSize(22)
+    table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
+    table.setColumnWidth(0, first_column_width)
+    return table
+
+
+def _percent(value) -> str:
+    return f"{value:.1f}%"
+
+
+class PrefixStatsModel(ReportTableModel):
+    """按前缀汇总的内存占用"""
+
+    COLUMNS = [
+        ("前缀", lambda m, e: e.prefix, None),
+        ("层级", lambda m, e: e.depth, None),
+        ("键数量", lambda m, e: e.keys, None),
+        ("内存", lambda m, e: e.bytes, format_bytes),
+        ("占比", lambda m, e: e.bytes * 100 / m.total_bytes if m.total_bytes else 0.0, _percent),
+        ("平均大小", lambda m, e: round(e.avg_size), format_bytes),
+        ("最大键", lambda m, e: e.max_size, format_bytes),
+        ("主要类型", lambda m, e: e.main_type(), None),
+    ] + [(f"TTL {name}", lambda m, e, name=name: e.ttl_buckets.get(name, 0), None)
+         for name in TTL_BUCKET_NAMES]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.total_bytes = 0
+
+
+class BigKeyModel(ReportTableModel):
+    """占用内存最多的键"""
+
+    COLUMNS = [
+        ("键", lambda m, k: k.key, None),
+        ("类型", lambda m, k: k.key_type, None),
+        ("内存", lambda m, k: k.size, format_bytes),
+        ("TTL", lambda m, k: k.ttl if k.ttl is not None else -1, format_ttl),
+    ]
+
+
+class AnalysisResultView(QWidget):
+    """显示 PrefixStats 快照：汇总信息、前缀表、大键表，可导出 CSV"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        summary_layout = QHBoxLayout()
+        self.summary_label = QLabel("")
+        summary_layout.addWidget(self.summary_label)
+        summary_layout.addStretch()
+        self.export_btn = QPushButton("导出CSV")
+        self.export_btn.clicked.connect(self.export_csv)
+        summary_layout.addWidget(self.export_btn)
+        layout.addLayout(summary_layout)
+
+        self.tabs = QTabWidget()
+        self.prefix_model = PrefixStatsModel(self)
+        self.big_key_model = BigKeyModel(self)
+        self.prefix_table = create_report_table(self.prefix_model, 3)
+        self.big_key_table = create_report_table(self.big_key_model, 2)
+        self.tabs.addTab(self.prefix_table, "按前缀")
+        self.tabs.addTab(self.big_key_table, "大键")
+        layout.addWidget(self.tabs)
+
+    def show_snapshot(self, snapshot):
+        total = snapshot.total
+        self.summary_label.setText(
+            f"键: {total.keys}    内存: {format_bytes(total.bytes)}    前缀: {len(snapshot.prefixes)}")
+        self.prefix_model.total_bytes = total.bytes
+        self.prefix_model.set_rows(snapshot.prefixes)
+        self.big_key_model.set_rows(snapshot.top_keys)
+
+    def clear(self):
+        self.summary_label.setText("")
+        self.prefix_model.set_rows([])
+        self.big_key_model.set_rows([])
+
+    def export_csv(self):
+        """导出当前标签页的表格"""
+        model = self.prefix_model if self.tabs.currentIndex() == 0 else self.big_key_model
+        name = "prefix_stats.csv" if model is self.prefix_model else "big_keys.csv"
+        path, _ = QFileDialog.getSaveFileName(self, "导出CSV", name, "CSV 文件 (*.csv)")
+        if not path:
+            return
+        try:
+            model.export_csv(path)
+        except OSError as e:
+            QMessageBox.warning(self, "错误", f"导出失败: {str(e)}")
+
+
+class MemoryAnalysisDialog(QDialog):
+    """
+    内存分析：按前缀统计键数量和内存占用，并列出最大的键
+
+    在后台线程中分析当前数据库，批次之间按设置休眠，可随时停止。
+    """
+
+    def __init__(self, redis_client, parent=None):
+        super().__init__(parent)
+        self.redis_client = redis_client
+        self.worker = None
+        self.setWindowTitle("内存分析")
+        self.resize(1000, 650)
+
+        layout = QVBoxLayout(self)
+        form = QHBoxLayout()
+        form.addWidget(QLabel("匹配模式:"))
+        self.pattern_input = QLineEdit("*")
+        form.addWidget(self.pattern_input)
+        form.addWidget(QLabel("SAMPLES:"))
+        self.samples_input = QSpinBox()
+        self.samples_input.setRange(0, 100000)
+        self.samples_input.setValue(DEFAULT_MEMORY_SAMPLES)
+        self.samples_input.setToolTip("集合类型抽样的元素数量，0 表示统计全部元素（较慢）")
+        form.addWidget(self.samples_input)
+        form.addWidget(QLabel("前缀层级:"))
+        self.depth_input = QSpinBox()
+        self.depth_input.setRange(1, 10)
+        self.depth_input.setValue(DEFAULT_MAX_DEPTH)
+        form.addWidget(self.depth_input)
+        form.addWidget(QLabel("批次间隔(ms):"))
+        self.pause_input = QSpinBox()
+        self.pause_input.setRange(0, 10000)
+        self.pause_input.setValue(DEFAULT_ANALYSIS_PAUSE_MS)
+        form.addWidget(self.pause_input)
+        self.start_btn = QPushButton("开始")
+        self.start_btn.clicked.connect(self.start)
+        form.addWidget(self.start_btn)
+        self.stop_btn = QPushButton("停止")
+        self.stop_btn.setEnabled(False)
+        self.stop_btn.clicked.connect(self.stop)
+        form.addWidget(self.stop_btn)
+        layout.addLayout(form)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
+        layout.addWidget(self.progress_bar)
+
+        self.result_view = AnalysisResultView()
+        layout.addWidget(self.result_view)
+
+    def start(self):
+        if self.worker is not None:
+            return
+        stats = PrefixStats(max_depth=self.depth_input.value(), top_n=DEFAULT_TOP_N)
+        self.result_view.clear()
+        self.progress_bar.setValue(0)
+        # 固定在开始分析时的数据库上，分析过程中切换数据库不影响采样
+        worker = MemoryAnalysisWorker(
+            self.redis_client.snapshot(), stats, self.pattern_input.text().strip() or '*',
+            self.samples_input.value(), ANALYSIS_BATCH_SIZE,
+            self.pause_input.value() / 1000, self)
+        worker.progress.connect(self.on_progress)
+        worker.stats_updated.connect(self.on_stats_updated)
+        worker.analysis_finished.connect(lambda cancelled, error: self.on_finished(worker, cancelled, error))
+        worker.finished.connect(worker.deleteLater)
+        self.worker = worker
+        self.start_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+        worker.start()
+
+    def stop(self):
+        if self.worker is not None:
+            self.worker.cancel()
+
+    def on_progress(self, analyzed, total):
+        if total:
+            self.progress_bar.setValue(min(100, int(analyzed * 100 / total)))
+
+    def on_stats_updated(self, snapshot):
+        self.result_view.show_snapshot(snapshot)
+
+    def on_finished(self, worker, cancelled, error):
+        if worker is not self.worker:
+            return
+        self.worker = None
+        self.start_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+        if error:
+            QMessageBox.warning(self, "错误", error)
+        elif not cancelled:
+            self.progress_bar.setValue(100)
+
+    def _stop_and_wait(self):
+        if self.worker is not None:
+            worker = self.worker
+            worker.cancel()
+            worker.wait(3000)
+
+    def reject(self):
+        self._stop_and_wait()
+        super().reject()
+
+    def closeEvent(self, event):
+        """关闭时停止分析线程"""
+        self._stop_and_wait()
+        super().closeEvent(event)
+
+
+class SnapshotKeyTreeModel(KeyTreeModel):
+    """RDB 快照的键树：元数据来自文件，TTL 为生成快照时的剩余时间，不随时间递减"""
+
+    COUNTDOWN_TTL = False
+
+
+class RdbAnalysisDialog(QDialog):
+    """
+    离线分析 RDB 快照文件（只读，不需要连接 Redis）
+
+    “键树”页与主窗口的键列表相同，按数据库显示前缀树，类型/TTL/大小来自文件；
+    “统计”页与内存分析相同。大小为值在 RDB 中序列化后的字节数，
+    通常小于在 Redis 中实际占用的内存。
+    """
+
+    def __init__(self, path: str, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.worker = None
+        self.tree_models = {}  # 数据库编号 -> SnapshotKeyTreeModel
+        self.setWindowTitle(f"RDB 分析 - {os.path.basename(path)}")
+        self.resize(1000, 650)
+
+        layout = QVBoxLayout(self)
+        info_layout = QHBoxLayout()
+        self.info_label = QLabel(f"{path}（只读）")
+        info_layout.addWidget(self.info_label)
+        info_layout.addStretch()
+        self.stop_btn = QPushButton("停止")
+        self.stop_btn.clicked.connect(self.stop)
+        info_layout.addWidget(self.stop_btn)
+        layout.addLayout(info_layout)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 1000)
+        layout.addWidget(self.progress_bar)
+
+        self.tabs = QTabWidget()
+        tree_page = QWidget()
+        tree_layout = QVBoxLayout(tree_page)
+        db_layout = QHBoxLayout()
+        db_layout.addWidget(QLabel("数据库:"))
+        self.db_combo = QComboBox()
+        self.db_combo.currentIndexChanged.connect(self._show_db)
+        db_layout.addWidget(self.db_combo)
+        self.tree_label = QLabel("")
+        db_layout.addWidget(self.tree_label)
+        db_layout.addStretch()
+        tree_layout.addLayout(db_layout)
+        self.key_tree = QTreeView()
+        self.key_tree.setUniformRowHeights(True)
+        header = self.key_tree.header()
+        header.setStretchLastSection(False)
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        tree_layout.addWidget(self.key_tree)
+        self.tabs.addTab(tree_page, "键树")
+
+        self.result_view = AnalysisResultView()
+        self.tabs.addTab(self.result_view, "统计")
+        layout.addWidget(self.tabs)
+
+    def start(self, max_depth: int = DEFAULT_MAX_DEPTH):
+        worker = RdbAnalysisWorker(self.path, PrefixStats(max_depth=max_depth, top_n=DEFAULT_TOP_N),
+                                   MAX_RDB_TREE_KEYS, self)
+        worker.progress.connect(self.on_progress)
+        worker.file_info.connect(self.on_file_info)
+        worker.stats_updated.connect(self.result_view.show_snapshot)
+        worker.keys_parsed.connect(self.on_keys_parsed)
+        worker.analysis_finished.connect(self.on_finished)
+        worker.finished.connect(worker.deleteLater)
+        self.worker = worker
+        worker.start()
+
+    def stop(self):
+        if self.worker is not None:
+            self.worker.cancel()
+
+    def on_progress(self, done, total):
+        if total:
+            self.progress_bar.setValue(int(done * 1000 / total))
+
+    def on_file_info(self, version, aux):
+        details = [f"RDB 版本 {version}"]
+        if aux.get('redis-ver'):
+            details.append(f"Redis {aux['redis-ver']}")
+        if aux.get('ctime', '').isdigit():
+            created = QDateTime.fromSecsSinceEpoch(int(aux['ctime'])).toString("yyyy-MM-dd HH:mm:ss")
+            details.append(f"生成于 {created}")
+        if aux.get('used-mem', '').isdigit():
+            details.append(f"生成时内存 {format_bytes(int(aux['used-mem']))}")
+        self.info_label.setText(f"{self.path}（只读）    " + "    ".join(details))
+
+    def on_keys_parsed(self, db, entries):
+        """把一批键及其元数据加入对应数据库的键树"""
+        model = self.tree_models.get(db)
+        if model is None:
+            model = self.tree_models[db] = SnapshotKeyTreeModel(self)
+            self.db_combo.addItem(f"db{db}", db)
+        model.add_keys(key for key, _ in entries)
+        trie = model.trie
+        model.set_metadata({trie.find(key): metadata for key, metadata in entries})
+
+    def _show_db(self, row):
+        model = self.tree_models.get(self.db_combo.itemData(row))
+        if model is not None and self.key_tree.model() is not model:
+            self.key_tree.setModel(model)
+            for column, width in ((1, 55), (2, 80), (3, 80)):
+                self.key_tree.header().resizeSection(column, width)
+
+    def on_finished(self, cancelled, error):
+        worker = self.worker
+        self.worker = None
+        self.stop_btn.setEnabled(False)
+        if self.db_combo.count() == 0:
+            self.tree_label.setText("文件中没有键")
+        elif worker is not None and worker.tree_keys >= MAX_RDB_TREE_KEYS:
+            self.tree_label.setText(f"键树只包含前 {MAX_RDB_TREE_KEYS} 个键，统计页包含全部键")
+        if error:
+            QMessageBox.warning(self, "错误", error)
+
+    def _stop_and_wait(self):
+        if self.worker is not None:
+            worker = self.worker
+            worker.cancel()
+            worker.wait(3000)
+
+    def reject(self):
+        self._stop_and_wait()
+        super().reject()
+
+    def closeEvent(self, event):
+        """关闭时停止解析线程"""
+        self._stop_and_wait()
+        super().closeEvent(event)
@@ -0,0 +1,279 @@
+from PyQt6.QtWidgets import *
+from PyQt6.QtCore import *
+import os
+
+from src.gui.workers import BulkLoadWorker
+from src.utils.bulk_loader import (BulkLoader, LoadMapping, JSONL, CSV, LOAD_TYPES,
+                                   DEFAULT_BATCH_SIZE, DEFAULT_THREADS)
+
+FILE_FILTER = "JSON Lines / CSV (*.jsonl *.ndjson *.json *.csv);;所有文件 (*)"
+# 错误列表中最多显示的行数（完整明细可保存为报告）
+MAX_SHOWN_ERRORS = 1000
+
+
+class BulkLoadDialog(QDialog):
+    """
+    批量导入：把 JSON Lines / CSV 文件按列映射写入当前数据库
+
+    键名由模板生成（如 user:{id}），在后台线程中按批通过管道写入，
+    可先试运行检查映射和数据，出错的行可导出为报告。
+    """
+
+    load_completed = pyqtSignal()  # 实际写入（非试运行）结束后发出，用于刷新键列表
+
+    def __init__(self, redis_client, parent=None):
+        super().__init__(parent)
+        self.redis_client = redis_client
+        self.worker = None
+        self.report = None
+        self.setWindowTitle("批量导入")
+        self.resize(760, 620)
+
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+
+        file_row = QHBoxLayout()
+        self.path_input = QLineEdit()
+        file_row.addWidget(self.path_input)
+        browse_btn = QPushButton("浏览...")
+        browse_btn.clicked.connect(self.browse)
+        file_row.addWidget(browse_btn)
+        form.addRow("文件:", file_row)
+
+        self.format_combo = QComboBox()
+        self.format_combo.addItem("JSON Lines", JSONL)
+        self.format_combo.addItem("CSV", CSV)
+        form.addRow("格式:", self.format_combo)
+
+        self.key_input = QLineEdit()
+        self.key_input.setPlaceholderText("如 user:{id}，花括号中为列名")
+        form.addRow("键模板:", self.key_input)
+
+        self.type_combo = QComboBox()
+        self.type_combo.addItems(LOAD_TYPES)
+        self.type_combo.currentTextChanged.connect(self._update_fields)
+        form.addRow("类型:", self.type_combo)
+
+        self.value_input = QLineEdit()
+        form.addRow("值字段:", self.value_input)
+        self.fields_input = QLineEdit()
+        self.fields_input.setPlaceholderText("逗号分隔，留空表示所有列")
+        form.addRow("哈希字段:", self.fields_input)
+        self.score_input = QLineEdit()
+        form.addRow("分数字段:", self.score_input)
+
+        ttl_row = QHBoxLayout()
+        self.ttl_input = QSpinBox()
+        self.ttl_input.setRange(0, 2 ** 31 - 1)
+        self.ttl_input.setSpecialValueText("不过期")
+        self.ttl_input.setSuffix(" 秒")
+        ttl_row.addWidget(self.ttl_input)
+        ttl_row.addWidget(QLabel("TTL 字段:"))
+        self.ttl_field_input = QLineEdit()
+        self.ttl_field_input.setPlaceholderText("可选，优先于固定 TTL")
+        ttl_row.addWidget(self.ttl_field_input)
+        form.addRow("TTL:", ttl_row)
+
+        batch_row = QHBoxLayout()
+        self.batch_input = QSpinBox()
+        self.batch_input.setRange(1, 100000)
+        self.batch_input.setValue(DEFAULT_BATCH_SIZE)
+        batch_row.addWidget(self.batch_input)
+        batch_row.addWidget(QLabel("并行连接:"))
+        self.threads_input = QSpinBox()
+        self.threads_input.setRange(1, 32)
+        self.threads_input.setValue(DEFAULT_THREADS)
+        batch_row.addWidget(self.threads_input)
+        batch_row.addStretch()
+        form.addRow("每批记录数:", batch_row)
+
+        self.dry_run_check = QCheckBox("试运行（只解析和校验，不写入）")
+        self.dry_run_check.setChecked(True)
+        form.addRow("", self.dry_run_check)
+        self.target_label = QLabel()
+        form.addRow("目标数据库:", self.target_label)
+        layout.addLayout(form)
+
+        buttons = QHBoxLayout()
+        self.start_btn = QPushButton("开始")
+        self.start_btn.clicked.connect(self.start)
+        buttons.addWidget(self.start_btn)
+        self.stop_btn = QPushButton("停止")
+        self.stop_btn.setEnabled(False)
+        self.stop_btn.clicked.connect(self.stop)
+        buttons.addWidget(self.stop_btn)
+        buttons.addStretch()
+        self.save_errors_btn = QPushButton("保存错误报告...")
+        self.save_errors_btn.setEnabled(False)
+        self.save_errors_btn.clicked.connect(self.save_errors)
+        buttons.addWidget(self.save_errors_btn)
+        layout.addLayout(buttons)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.setTextVisible(False)
+        layout.addWidget(self.progress_bar)
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+
+        self.error_table = QTableWidget(0, 3)
+        self.error_table.setHorizontalHeaderLabels(["行号", "键", "原因"])
+        self.error_table.horizontalHeader().setStretchLastSection(True)
+        self.error_table.verticalHeader().setVisible(False)
+        self.error_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        layout.addWidget(self.error_table)
+
+        self._update_fields(self.type_combo.currentText())
+
+    def update_target(self):
+        """显示写入的目标：导入中为开始时的数据库，否则为主窗口当前选中的数据库"""
+        client = self.worker.loader.redis_client if self.worker is not None else self.redis_client
+        info = client.connection_info
+        self.target_label.setText(
+            f"{info['host']}:{info['port']} / db{info['db']}" if client.client and info else "未连接")
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_target()
+
+    def _update_fields(self, key_type):
+        """只启用当前类型用到的字段"""
+        self.value_input.setEnabled(key_type != 'hash')
+        self.value_input.setPlaceholderText(
+            "留空表示整行以 JSON 保存" if key_type == 'string' else "元素所在的列")
+        self.fields_input.setEnabled(key_type == 'hash')
+        self.score_input.setEnabled(key_type == 'zset')
+
+    def browse(self):
+        path, _ = QFileDialog.getOpenFileName(self, "选择文件", "", FILE_FILTER)
+        if not path:
+            return
+        self.path_input.setText(path)
+        self.format_combo.setCurrentIndex(
+            self.format_combo.findData(CSV if path.lower().endswith('.csv') else JSONL))
+
+    def _mapping(self) -> LoadMapping:
+        key_type = self.type_combo.currentText()
+        fields = [name.strip() for name in self.fields_input.text().split(',') if name.strip()]
+        return LoadMapping(
+            key_template=self.key_input.text().strip(),
+            key_type=key_type,
+            value_field=self.value_input.text().strip() if key_type != 'hash' else '',
+            fields=fields if key_type == 'hash' else (),
+            score_field=self.score_input.text().strip() if key_type == 'zset' else '',
+            ttl=self.ttl_input.value() or None,
+            ttl_field=self.ttl_field_input.text().strip(),
+        )
+
+    def start(self):
+        if self.worker is not None:
+            return
+        path = self.path_input.text().strip()
+        if not os.path.isfile(path):
+            QMessageBox.warning(self, "错误", "请选择要导入的文件")
+            return
+        dry_run = self.dry_run_check.isChecked()
+        try:
+            # 固定在当前数据库上，导入过程中切换数据库不影响写入目标
+            loader = BulkLoader(self.redis_client.snapshot(), self._mapping(), self.batch_input.value(),
+                                self.threads_input.value(), dry_run)
+        except ValueError as e:
+            QMessageBox.warning(self, "错误", str(e))
+            return
+        if not dry_run and not self.redis_client.client:
+            QMessageBox.warning(self, "错误", "请先连接 Redis")
+            return
+
+        self.report = None
+        self.error_table.setRowCount(0)
+        self.save_errors_btn.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.status_label.clear()
+        worker = BulkLoadWorker(loader, path, self.format_combo.currentData(), self)
+        worker.progress.connect(lambda rows, written, errors, fraction:
+                                self.on_progress(worker, rows, written, errors, fraction))
+        worker.load_finished.connect(lambda report, cancelled, error:
+                                     self.on_finished(worker, report, cancelled, error))
+        worker.finished.connect(worker.deleteLater)
+        self.worker = worker
+        self.update_target()
+        self._started = QElapsedTimer()
+        self._started.start()
+        self.start_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+        worker.start()
+
+    def stop(self):
+        if self.worker is not None:
+            self.worker.cancel()
+
+    def on_progress(self, worker, rows, written, errors, fraction):
+        if worker is not self.worker:
+            return
+        self.progress_bar.setValue(int(fraction * 1000))
+        elapsed = max(self._started.elapsed() / 1000, 1e-3)
+        verb = "有效" if worker.loader.dry_run else "写入"
+        self.status_label.setText(
+            f"已读取 {rows} 行，{verb} {written} 条，错误 {errors} 行，{rows / elapsed:.0f} 行/秒")
+
+    def on_finished(self, worker, report, cancelled, error):
+        if worker is not self.worker:
+            return
+        self.worker = None
+        self.start_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+        self.update_target()
+        if error:
+            QMessageBox.warning(self, "错误", error)
+            return
+        self.report = report
+        self._show_errors(report)
+        if worker.loader.dry_run:
+            types = "，".join(f"{key_type} {count} 条" for key_type, count in report.keys_by_type.items())
+            summary = f"试运行完成：{report.rows} 行中 {report.written} 条有效（{types or '无'}），" \
+                      f"{report.error_count} 行有错误"
+        else:
+            summary = f"{'导入已取消' if cancelled else '导入完成'}：读取 {report.rows} 行，" \
+                      f"写入 {report.written} 条，{report.error_count} 行有错误，" \
+                      f"用时 {report.elapsed:.1f} 秒"
+            self.load_completed.emit()
+        if not cancelled:
+            self.progress_bar.setValue(1000)
+        self.status_label.setText(summary)
+
+    def _show_errors(self, report):
+        errors = report.errors[:MAX_SHOWN_ERRORS]
+        self.error_table.setRowCount(len(errors))
+        for row, (line, key, message) in enumerate(errors):
+            self.error_table.setItem(row, 0, QTableWidgetItem(str(line)))
+            self.error_table.setItem(row, 1, QTableWidgetItem(key))
+            self.error_table.setItem(row, 2, QTableWidgetItem(message))
+        self.error_table.resizeColumnsToContents()
+        self.save_errors_btn.setEnabled(bool(report.errors))
+
+    def save_errors(self):
+        if not self.report or not self.report.errors:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "保存错误报告", "bulk_load_errors.csv",
+                                              "CSV 文件 (*.csv)")
+        if not path:
+            return
+        try:
+            self.report.save_csv(path)
+        except OSError as e:
+            QMessageBox.warning(self, "错误", f"保存失败: {str(e)}")
+
+    def _stop_and_wait(self):
+        if self.worker is not None:
+            worker = self.worker
+            worker.cancel()
+            worker.wait(3000)
+
+    def reject(self):
+        self._stop_and_wait()
+        super().reject()
+
+    def closeEvent(self, event):
+        """关闭时停止导入线程"""
+        self._stop_and_wait()
+        super().closeEvent(event)
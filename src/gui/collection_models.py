@@ -0,0 +1,321 @@
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from typing import Any, List, Optional
+
+from src.utils.value_diff import ValueDelta, diff_list, diff_mapping, diff_members
+from src.utils.decoding import RENDERERS
+
+
+class PagedValueSource:
+    """按页从 Redis 读取集合类型的值，供表格模型在滚动时拉取"""
+
+    def __init__(self, redis_client, key: str, key_type: str, cursor: int, total: int):
+        self.redis_client = redis_client
+        self.key = key
+        self.key_type = key_type
+        self.cursor = cursor
+        self.total = total
+
+    def can_fetch_more(self) -> bool:
+        return self.cursor != 0
+
+    def fetch_next(self) -> Optional[Any]:
+        """读取下一页（未解码的字节），失败时停止继续拉取"""
+        page = self.redis_client.get_value_page(
+            self.key, self.key_type, self.cursor, total=self.total, raw=True)
+        if page is None:
+            self.cursor = 0
+            return None
+        self.cursor = page.cursor
+        return page.items
+
+
+class CollectionTableModel(QAbstractTableModel):
+    """
+    集合类型值的表格模型基类
+
+    每行是一个 Python 列表，只有视图可见的行才会被渲染；滚动到底部时
+    通过 canFetchMore/fetchMore 从 PagedValueSource 追加下一页。
+    加载时记录原始值快照，保存时只把与快照不同的部分写回 Redis。
+    成员/字段/值以原始字节保存，只有视图请求的单元格才按当前显示方式转换为文本。
+    """
+
+    HEADERS: List[str] = []
+    # 可编辑的列
+    EDITABLE_COLUMNS = ()
+    # 保存原始字节的列
+    BYTES_COLUMNS = ()
+
+    def __init__(self, items, source: PagedValueSource = None, parent=None):
+        super().__init__(parent)
+        self.source = source
+        self.renderer = RENDERERS['utf-8']
+        self.rows: List[list] = []
+        self._append_items(items)
+
+    def set_renderer(self, name: str):
+        """切换字节列的显示方式（utf-8 / hex / base64）"""
+        self.renderer = RENDERERS[name]
+        if self.rows:
+            self.dataChanged.emit(self.index(0, 0),
+                                  self.index(len(self.rows) - 1, len(self.HEADERS) - 1))
+
+    # ---- 子类实现 ----
+
+    def _rows_from_items(self, items) -> List[list]:
+        raise NotImplementedError
+
+    def new_row(self) -> list:
+        """添加行时的默认内容"""
+        raise NotImplementedError
+
+    def to_value(self) -> Any:
+        """把当前所有行转换为保存用的值"""
+        raise NotImplementedError
+
+    def delta(self) -> ValueDelta:
+        """当前行相对已加载快照的增量修改"""
+        raise NotImplementedError
+
+    # ---- 数据维护 ----
+
+    def _append_items(self, items):
+        self.rows.extend(self._rows_from_items(items))
+
+    def is_fully_loaded(self) -> bool:
+        return self.source is None or not self.source.can_fetch_more()
+
+    def total(self) -> int:
+        return self.source.total if self.source else len(self.rows)
+
+    def insert_row(self) -> QModelIndex:
+        """在末尾添加一行，返回其第一个可编辑单元格"""
+        row = len(self.rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.rows.append(self.new_row())
+        self.endInsertRows()
+        return self.index(row, self.EDITABLE_COLUMNS[0])
+
+    def remove_rows(self, rows: List[int]):
+        """删除指定的行"""
+        for row in sorted(set(rows), reverse=True):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self.rows[row]
+            self.endRemoveRows()
+
+    def _convert(self, column: int, value):
+        """编辑后的文本转换为列对应的类型"""
+        if column in self.BYTES_COLUMNS:
+            return self.renderer.parse(value)
+        return value
+
+    # ---- QAbstractTableModel 接口 ----
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.is_fully_loaded()
+
+    def fetchMore(self, parent=QModelIndex()):
+        items = self.source.fetch_next()
+        if not items:
+            return
+        rows = self._rows_from_items(items)
+        if not rows:
+            return
+        start = len(self.rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self.rows.extend(rows)
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            value = self.rows[index.row()][index.column()]
+            if index.column() in self.BYTES_COLUMNS:
+                return self.renderer.render(value)
+            return value if role == Qt.ItemDataRole.EditRole else str(value)
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole or index.column() not in self.EDITABLE_COLUMNS:
+            return False
+        try:
+            value = self._convert(index.column(), value)
+        except (TypeError, ValueError):
+            return False
+        self.rows[index.row()][index.column()] = value
+        self.dataChanged.emit(index, index)
+        return True
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.column() in self.EDITABLE_COLUMNS:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return section + 1
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """对已加载的行排序"""
+        self.layoutAboutToBeChanged.emit()
+        self.rows.sort(key=lambda row: row[column],
+                       reverse=order == Qt.SortOrder.DescendingOrder)
+        self.layoutChanged.emit()
+
+
+class HashTableModel(CollectionTableModel):
+    """哈希：字段 / 值"""
+
+    HEADERS = ["字段", "值"]
+    EDITABLE_COLUMNS = (0, 1)
+    BYTES_COLUMNS = (0, 1)
+
+    def __init__(self, items, source=None, parent=None):
+        self.original = {}  # 已加载的字段 -> 值（HSCAN 可能返回重复字段）
+        super().__init__(items, source, parent)
+
+    def _rows_from_items(self, items):
+        rows = []
+        for field, value in items.items():
+            if field not in self.original:
+                self.original[field] = value
+                rows.append([field, value])
+        return rows
+
+    def new_row(self):
+        return [b"", b""]
+
+    def to_value(self):
+        return {field: value for field, value in self.rows}
+
+    def delta(self):
+        return diff_mapping(self.original, self.rows)
+
+
+class ListTableModel(CollectionTableModel):
+    """
+    列表：索引 / 值。排序只改变显示顺序，保存时仍按索引顺序；
+    新增的行没有原索引（显示为 +），保存时追加到列表末尾
+    """
+
+    HEADERS = ["索引", "值"]
+    EDITABLE_COLUMNS = (1,)
+    BYTES_COLUMNS = (1,)
+
+    def __init__(self, items, source=None, parent=None):
+        self.original = {}  # 已加载的原索引 -> 值
+        super().__init__(items, source, parent)
+
+    def _rows_from_items(self, items):
+        start = len(self.original)
+        rows = []
+        for i, value in enumerate(items):
+            self.original[start + i] = value
+            rows.append([start + i, value])
+        return rows
+
+    def new_row(self):
+        return [None, b""]
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if (index.isValid() and index.column() == 0 and role == Qt.ItemDataRole.DisplayRole
+                and self.rows[index.row()][0] is None):
+            return "+"
+        return super().data(index, role)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        if column != 0:
+            return super().sort(column, order)
+        self.layoutAboutToBeChanged.emit()
+        self.rows.sort(key=self._index_order, reverse=order == Qt.SortOrder.DescendingOrder)
+        self.layoutChanged.emit()
+
+    @staticmethod
+    def _index_order(row):
+        # 新增的行排在原有元素之后
+        return (row[0] is None, row[0] or 0)
+
+    def to_value(self):
+        return [value for _, value in sorted(self.rows, key=self._index_order)]
+
+    def delta(self):
+        return diff_list(self.original, self.rows)
+
+
+class SetTableModel(CollectionTableModel):
+    """集合：成员"""
+
+    HEADERS = ["成员"]
+    EDITABLE_COLUMNS = (0,)
+    BYTES_COLUMNS = (0,)
+
+    def __init__(self, items, source=None, parent=None):
+        self.original = set()  # 已加载的成员（SSCAN 可能返回重复成员）
+        super().__init__(items, source, parent)
+
+    def _rows_from_items(self, items):
+        rows = []
+        for member in items:
+            if member not in self.original:
+                self.original.add(member)
+                rows.append([member])
+        return rows
+
+    def new_row(self):
+        return [b""]
+
+    def to_value(self):
+        return [row[0] for row in self.rows]
+
+    def delta(self):
+        return diff_members(self.original, self.to_value())
+
+
+class ZSetTableModel(CollectionTableModel):
+    """有序集合：成员 / 分数"""
+
+    HEADERS = ["成员", "分数"]
+    EDITABLE_COLUMNS = (0, 1)
+    BYTES_COLUMNS = (0,)
+
+    def __init__(self, items, source=None, parent=None):
+        self.original = {}  # 已加载的成员 -> 分数
+        super().__init__(items, source, parent)
+
+    def _rows_from_items(self, items):
+        rows = []
+        for member, score in items:
+            self.original[member] = score
+            rows.append([member, score])
+        return rows
+
+    def new_row(self):
+        return [b"", 0.0]
+
+    def _convert(self, column, value):
+        return float(value) if column == 1 else super()._convert(column, value)
+
+    def to_value(self):
+        return [(member, score) for member, score in self.rows]
+
+    def delta(self):
+        return diff_mapping(self.original, self.rows)
+
+
+# 数据类型 -> 表格模型
+COLLECTION_MODELS = {
+    'hash': HashTableModel,
+    'list': ListTableModel,
+    'set': SetTableModel,
+    'zset': ZSetTableModel,
+}
@@ -6,6 +6,18 @@ import json
 import sys
 from PyQt6.QtCore import QTimer
 
+from src.gui.collection_models import COLLECTION_MODELS, PagedValueSource
+from src.gui.large_value_model import LargeValueModel
+from src.gui.workers import StringDownloadWorker, BulkWriteWorker, KeyDetailWorker
+from src.utils.large_value import LargeValueBuffer
+from src.utils.formatting import format_bytes
+from src.utils.decoding import RENDERERS
+
+# 大字符串预览读取的字节数
+LARGE_STRING_PREVIEW_BYTES = 4096
+# 添加键对话框中的类型 -> Redis 数据类型
+ADD_KEY_TYPES = {'哈希': 'hash', '列表': 'list', '集合': 'set', '有序集合': 'zset'}
+
 class LoadingDialog(QDialog):
     """自定义加载对话框"""
     def __init__(self, parent=None):
@@ -34,6 +46,14 @@ class DataViewer(QWidget):
         self.main_window = main_window  # 保存MainWindow的引用
         self.current_key = None  # 当前键
         self.current_type = None  # 当前数据类型
+        self.current_model = None  # 集合类型的表格模型（按页加载）
+        self.large_buffer = None    # 大字符串的磁盘缓冲区
+        self.large_download = None  # 正在下载大字符串的线程
+        self.loaded_ttl = -1        # 加载时的 TTL，保存时只在改动后写入
+        self.detail_worker = None   # 正在获取键详情的线程
+        self.detail_request = 0     # 最新一次详情请求的编号，旧请求的结果被丢弃
+        self.detail_cache_version = 0   # 最新一次详情请求发出前的值缓存版本号
+        self.pending_detail = None  # 等待当前线程结束后再获取的键
         self.setup_ui()
 
     def setup_ui(self):
@@ -47,6 +67,10 @@ class DataViewer(QWidget):
         # 数据类型显示
         self.type_label = QLabel("类型: -")
         self.toolbar.addWidget(self.type_label)
+
+        # 分页加载进度
+        self.page_label = QLabel("")
+        self.toolbar.addWidget(self.page_label)
         
         self.toolbar.addStretch()  # 添加弹性空间
         
@@ -93,6 +117,27 @@ class DataViewer(QWidget):
         self.create_list_input()
         self.create_set_input()
         self.create_zset_input()
+        self.create_large_string_input()
+
+        # 集合类型的行操作
+        self.row_toolbar = QWidget()
+        row_layout = QHBoxLayout(self.row_toolbar)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+        self.add_row_btn = QPushButton("添加行")
+        self.add_row_btn.clicked.connect(self.add_row)
+        row_layout.addWidget(self.add_row_btn)
+        self.delete_row_btn = QPushButton("删除行")
+        self.delete_row_btn.clicked.connect(self.delete_rows)
+        row_layout.addWidget(self.delete_row_btn)
+        row_layout.addStretch()
+        row_layout.addWidget(QLabel("显示为:"))
+        self.renderer_combo = QComboBox()
+        for name, renderer in RENDERERS.items():
+            self.renderer_combo.addItem(renderer.name, name)
+        self.renderer_combo.currentIndexChanged.connect(self.on_renderer_changed)
+        row_layout.addWidget(self.renderer_combo)
+        self.row_toolbar.hide()
+        self.layout.addWidget(self.row_toolbar)
 
         # 应用样式
         self.apply_styles()
@@ -109,119 +154,344 @@ class DataViewer(QWidget):
         """创建哈希输入区域"""
         self.hash_widget = QWidget()
         hash_layout = QVBoxLayout(self.hash_widget)
-        self.hash_text = QTextEdit()
-        hash_layout.addWidget(self.hash_text)
+        self.hash_table = self.create_value_table()
+        hash_layout.addWidget(self.hash_table)
         self.data_area.addWidget(self.hash_widget)
 
     def create_list_input(self):
         """创建列表输入区域"""
         self.list_widget = QWidget()
         list_layout = QVBoxLayout(self.list_widget)
-        self.list_text = QTextEdit()
-        list_layout.addWidget(self.list_text)
+        self.list_table = self.create_value_table()
+        list_layout.addWidget(self.list_table)
         self.data_area.addWidget(self.list_widget)
 
     def create_set_input(self):
         """创建集合输入区域"""
         self.set_widget = QWidget()
         set_layout = QVBoxLayout(self.set_widget)
-        self.set_text = QTextEdit()
-        set_layout.addWidget(self.set_text)
+        self.set_table = self.create_value_table()
+        set_layout.addWidget(self.set_table)
         self.data_area.addWidget(self.set_widget)
 
     def create_zset_input(self):
         """创建有序集合输入区域"""
         self.zset_widget = QWidget()
         zset_layout = QVBoxLayout(self.zset_widget)
-        self.zset_text = QTextEdit()
-        zset_layout.addWidget(self.zset_text)
+        self.zset_table = self.create_value_table()
+        zset_layout.addWidget(self.zset_table)
         self.data_area.addWidget(self.zset_widget)
 
-    def show_key_data(self, key):
-        """显示指定键的数据"""
+    def create_large_string_input(self):
+        """创建大字符串的只读查看区域"""
+        self.large_string_widget = QWidget()
+        large_layout = QVBoxLayout(self.large_string_widget)
+
+        info_layout = QHBoxLayout()
+        self.large_info_label = QLabel("")
+        info_layout.addWidget(self.large_info_label)
+        self.large_progress = QProgressBar()
+        self.large_progress.setRange(0, 100)
+        info_layout.addWidget(self.large_progress)
+        info_layout.addStretch()
+        self.large_mode_combo = QComboBox()
+        self.large_mode_combo.addItem("十六进制", LargeValueModel.HEX)
+        self.large_mode_combo.addItem("文本", LargeValueModel.TEXT)
+        self.large_mode_combo.currentIndexChanged.connect(self.on_large_mode_changed)
+        info_layout.addWidget(self.large_mode_combo)
+        self.save_to_file_btn = QPushButton("保存到文件")
+        self.save_to_file_btn.clicked.connect(self.save_large_string_to_file)
+        info_layout.addWidget(self.save_to_file_btn)
+        large_layout.addLayout(info_layout)
+
+        self.large_preview = QPlainTextEdit()
+        self.large_preview.setReadOnly(True)
+        self.large_preview.setMaximumHeight(120)
+        large_layout.addWidget(self.large_preview)
+
+        self.large_table = QTableView()
+        self.large_table.setWordWrap(False)
+        self.large_table.verticalHeader().hide()
+        self.large_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.large_table.verticalHeader().setDefaultSectionSize(20)
+        self.large_table.horizontalHeader().setStretchLastSection(True)
+        large_layout.addWidget(self.large_table)
+        self.data_area.addWidget(self.large_string_widget)
+
+    def create_value_table(self):
+        """创建集合类型的表格视图，只渲染可见行"""
+        table = QTableView()
+        table.setSortingEnabled(True)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        table.setWordWrap(False)
+        table.horizontalHeader().setStretchLastSection(True)
+        table.horizontalHeader().setSortIndicatorShown(False)
+        # 固定行高，避免视图为计算行高遍历所有行
+        table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        table.verticalHeader().setDefaultSectionSize(24)
+        return table
+
+    def value_tables(self):
+        return {'hash': self.hash_table, 'list': self.list_table,
+                'set': self.set_table, 'zset': self.zset_table}
+
+    def show_key_data(self, key, use_cache=True):
+        """显示指定键的数据；最近查看过的键直接从缓存显示，否则在后台获取"""
         if not key:
             self.show_error("键名为空")
             return
             
         self.current_key = key
+        # 之前尚未返回的请求作废
+        self.detail_request += 1
+        self.pending_detail = None
         
         # 先清空当前显示
         self.clear_current_display()
-        
-        # 显示加载对话框
-        loading_dialog = LoadingDialog(self)
-        loading_dialog.show()
-        QApplication.processEvents()  # 确保加载对话框显示出来
-    
+
+        if use_cache:
+            cached = self.redis_client.get_cached_value(key, self.main_window.value_cache_max_age())
+            # 预取的字符串可能超过（调小后的）大字符串阈值，此时仍按大字符串处理
+            if cached is not None and not (cached.key_type == 'string'
+                                           and len(cached.value) > self.large_string_threshold()):
+                self.display_entry(key, cached)
+                return
+
+        self.type_label.setText("类型: 加载中...")
+        if self.detail_worker is None:
+            self.start_detail_worker(key)
+        else:
+            # 同一时刻只有一个请求在执行，连续切换键时只保留最新的一个等待执行
+            self.pending_detail = key
+
+    def start_detail_worker(self, key):
+        """在后台通过一个管道获取键的类型、TTL、长度和第一页值"""
+        self.detail_cache_version = self.redis_client.cache_version()
+        worker = KeyDetailWorker(self.redis_client.snapshot(), key, self.detail_request,
+                                 self.large_string_threshold(), self)
+        worker.detail_ready.connect(self.on_detail_ready)
+        worker.finished.connect(lambda: self._on_detail_worker_finished(worker))
+        worker.finished.connect(worker.deleteLater)
+        self.detail_worker = worker
+        worker.start()
+
+    def _on_detail_worker_finished(self, worker):
+        if worker is not self.detail_worker:
+            return
+        self.detail_worker = None
+        if self.pending_detail is not None:
+            key = self.pending_detail
+            self.pending_detail = None
+            self.start_detail_worker(key)
+
+    def on_detail_ready(self, request_id, key, detail):
+        """显示后台获取的键详情，已被更新的请求取代的结果直接丢弃"""
+        if request_id != self.detail_request:
+            return
+        if detail is None:
+            self.show_error(f"错误: 无法获取键 {key} 的数据")
+            return
+        if detail.key_type == 'none':
+            self.show_error(f"错误: 键 {key} 不存在")
+            return
+
+        # 大字符串分块读取到磁盘（不进入缓存）
+        if detail.truncated:
+            self.current_type = detail.key_type
+            self.type_label.setText(f"类型: {detail.key_type}")
+            self.loaded_ttl = detail.ttl
+            self.ttl_input.setValue(detail.ttl)
+            self.show_large_string(key, detail.length, detail.value[:LARGE_STRING_PREVIEW_BYTES])
+            return
+        if detail.value is None:
+            self.show_error(f"错误: 无法获取键 {key} 的值（类型 {detail.key_type}）")
+            return
+
+        entry = detail.cache_entry()
+        self.redis_client.cache_value(key, entry, self.detail_cache_version)
         try:
-            # 获取数据类型
-            self.current_type = self.redis_client.get_type(key)
-            if not self.current_type:
-                raise Exception(f"无法获取键 {key} 的数据类型")
-            
-            # 更新类型显示
-            self.type_label.setText(f"类型: {self.current_type}")
-            QApplication.processEvents()
-            
-            # 获取TTL
-            ttl = self.redis_client.get_ttl(key)
-            self.ttl_input.setValue(ttl if ttl is not None else -1)
-            
-            # 切换到正确的显示界面
-            type_index = self.get_type_index(self.current_type)
-            self.data_area.setCurrentIndex(type_index)
-            QApplication.processEvents()
-            
-            # 获取值
-            value = self.redis_client.get_value(key)
-            if value is None:
-                raise Exception(f"无法获取键 {key} 的值")
-            
-            # 根据数据类型显示数据
-            self.display_value(value)
-            
+            self.display_entry(key, entry)
         except Exception as e:
-            error_msg = f"错误: {str(e)}"
-            print(f"显示键 {key} 的数据时出错: {str(e)}")  # 添加控制台输出
-            self.show_error(error_msg)
-        finally:
-            loading_dialog.close()
-            QApplication.processEvents()  # 确保界面更新
+            print(f"显示键 {key} 的数据时出错: {str(e)}")
+            self.show_error(f"错误: {str(e)}")
+
+    def stop_workers(self, timeout=3000):
+        """关闭窗口前等待后台线程结束"""
+        self.detail_request += 1
+        self.pending_detail = None
+        workers = [self.detail_worker, self.large_download]
+        self.stop_large_string()
+        for worker in workers:
+            if worker is not None:
+                worker.wait(timeout)
+
+    def display_entry(self, key, entry):
+        """显示获取到（或缓存中）的键值"""
+        self.current_type = entry.key_type
+        self.type_label.setText(f"类型: {entry.key_type}")
+        self.loaded_ttl = entry.remaining_ttl()
+        self.ttl_input.setValue(self.loaded_ttl)
+
+        # 切换到正确的显示界面
+        self.data_area.setCurrentIndex(self.get_type_index(entry.key_type))
+        source = None
+        if entry.key_type in COLLECTION_MODELS:
+            source = PagedValueSource(self.redis_client, key, entry.key_type,
+                                      entry.cursor, entry.total)
+        self.display_value(entry.value, source)
+        self.update_page_label()
     
+    def large_string_threshold(self) -> int:
+        return self.main_window.config_manager.get_setting('large_string_threshold')
+
+    def show_large_string(self, key, length, preview):
+        """只读显示大字符串：先显示开头的预览，后台下载完成后按需解码可见行"""
+        self.data_area.setCurrentWidget(self.large_string_widget)
+        self.large_info_label.setText(f"大小: {format_bytes(length)}（只读）")
+        self.large_preview.setPlainText(preview.decode('utf-8', errors='replace'))
+        self.large_progress.setValue(0)
+        self.large_progress.show()
+
+        self.large_buffer = LargeValueBuffer()
+        worker = StringDownloadWorker(self.redis_client.snapshot(), key, self.large_buffer, self)
+        worker.progress.connect(self._on_large_progress)
+        worker.download_finished.connect(
+            lambda written, cancelled: self._on_large_download_finished(worker, written, cancelled))
+        worker.finished.connect(worker.deleteLater)
+        self.large_download = worker
+        worker.start()
+
+    def _on_large_progress(self, done, total):
+        if total:
+            self.large_progress.setValue(int(done * 100 / total))
+
+    def _on_large_download_finished(self, worker, written, cancelled):
+        if worker is not self.large_download:
+            return
+        self.large_download = None
+        self.large_progress.hide()
+        if cancelled:
+            return
+        if written < 0:
+            self.large_info_label.setText(self.large_info_label.text() + " 读取失败")
+            return
+        self.large_buffer.finish()
+        model = LargeValueModel(self.large_buffer, self.large_mode_combo.currentData())
+        self.large_table.setModel(model)
+        self.large_table.resizeColumnToContents(0)
+
+    def on_large_mode_changed(self):
+        model = self.large_table.model()
+        if model is not None:
+            model.set_mode(self.large_mode_combo.currentData())
+            self.large_table.resizeColumnToContents(0)
+
+    def stop_large_string(self):
+        """停止下载并释放大字符串的缓冲区"""
+        worker = self.large_download
+        self.large_download = None
+        buffer = self.large_buffer
+        self.large_buffer = None
+        self.large_table.setModel(None)
+        self.large_preview.clear()
+        if worker is not None:
+            worker.cancel()
+        if buffer is not None:
+            if worker is not None and worker.isRunning():
+                # 线程仍在写入，结束后再关闭
+                worker.finished.connect(buffer.close)
+            else:
+                buffer.close()
+
+    def save_large_string_to_file(self):
+        """把大字符串保存到文件：已下载时复制缓冲区，否则从 Redis 分块读取"""
+        if not self.current_key:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "保存到文件", self.current_key.replace(':', '_'))
+        if not path:
+            return
+        if self.large_download is None and self.large_table.model() is not None:
+            try:
+                self.large_buffer.save_to(path)
+                QMessageBox.information(self, "成功", "已保存到文件")
+            except OSError as e:
+                QMessageBox.warning(self, "错误", f"保存文件时出错: {str(e)}")
+            return
+
+        try:
+            output = open(path, 'wb')
+        except OSError as e:
+            QMessageBox.warning(self, "错误", f"保存文件时出错: {str(e)}")
+            return
+        progress = QProgressDialog("正在保存到文件...", "取消", 0, 100, self)
+        progress.setWindowTitle("保存到文件")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+        worker = StringDownloadWorker(self.redis_client.snapshot(), self.current_key, output, self)
+
+        def on_progress(done, total):
+            if total:
+                progress.setValue(int(done * 100 / total))
+
+        def on_finished(written, cancelled):
+            output.close()
+            progress.close()
+            if cancelled:
+                return
+            if written < 0:
+                QMessageBox.warning(self, "错误", "读取键值失败")
+            else:
+                QMessageBox.information(self, "成功", f"已保存 {format_bytes(written)} 到文件")
+
+        worker.progress.connect(on_progress)
+        worker.download_finished.connect(on_finished)
+        progress.canceled.connect(worker.cancel)
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
+
+    def update_page_label(self):
+        """显示集合类型的加载进度"""
+        model = self.current_model
+        if model is None:
+            self.page_label.setText("")
+        elif model.is_fully_loaded():
+            self.page_label.setText(f"共 {model.rowCount()} 项")
+        else:
+            self.page_label.setText(f"已加载 {model.rowCount()} / {model.total()}（滚动加载更多）")
+
+    def clear_tables(self):
+        """移除集合类型表格的模型"""
+        for table in self.value_tables().values():
+            table.setModel(None)
+        self.current_model = None
+        self.row_toolbar.hide()
+
     def clear_current_display(self):
         """清空当前显示"""
         self.string_text.clear()
-        self.hash_text.clear()
-        self.list_text.clear()
-        self.set_text.clear()
-        self.zset_text.clear()
+        self.clear_tables()
+        self.stop_large_string()
         self.type_label.setText("类型: -")
         self.ttl_input.setValue(-1)
+        self.page_label.setText("")
     
-    def display_value(self, value):
-        """显示数据值"""
+    def display_value(self, value, source=None):
+        """显示数据值；集合类型由 source 在滚动时继续分页加载"""
         try:
             if self.current_type == 'string':
                 self.string_text.setText(str(value))
-                
-            elif self.current_type == 'hash':
-                formatted_value = json.dumps(value, indent=2, ensure_ascii=False)
-                self.hash_text.setText(formatted_value)
-                
-            elif self.current_type == 'list':
-                formatted_value = json.dumps(value, indent=2, ensure_ascii=False)
-                self.list_text.setText(formatted_value)
-                
-            elif self.current_type == 'set':
-                formatted_value = json.dumps(list(value), indent=2, ensure_ascii=False)
-                self.set_text.setText(formatted_value)
-                
-            elif self.current_type == 'zset':
-                formatted_value = json.dumps(value, indent=2, ensure_ascii=False)
-                self.zset_text.setText(formatted_value)
-                
-            QApplication.processEvents()  # 确保数据显示更新
-            
+
+            elif self.current_type in COLLECTION_MODELS:
+                model = COLLECTION_MODELS[self.current_type](value, source)
+                model.set_renderer(self.renderer_combo.currentData())
+                model.rowsInserted.connect(self.update_page_label)
+                model.rowsRemoved.connect(self.update_page_label)
+                table = self.value_tables()[self.current_type]
+                table.setModel(model)
+                table.horizontalHeader().setSortIndicatorShown(False)
+                self.current_model = model
+                self.row_toolbar.show()
+
         except Exception as e:
             raise Exception(f"格式化数据时出错: {str(e)}")
     
@@ -229,8 +499,9 @@ class DataViewer(QWidget):
         """显示错误信息"""
         self.type_label.setText("类型: 错误")
         self.data_area.setCurrentIndex(0)  # 切换到字符串显示
+        self.clear_tables()
         self.string_text.setText(error_msg)
-        QApplication.processEvents()
+
     def get_type_index(self, data_type):
         """根据数据类型返回对应的索引"""
         if data_type == 'string':
@@ -317,52 +588,79 @@ class DataViewer(QWidget):
         if not key:
             QMessageBox.warning(self, "错误", "键名不能为空")
             return
+
+        if data_type in ADD_KEY_TYPES:
+            try:
+                value = json.loads(value_text)
+            except json.JSONDecodeError:
+                QMessageBox.warning(self, "错误", "无效的JSON格式")
+                return
+            # 集合类型可能很大，在后台分块写入
+            self.start_bulk_write(key, ADD_KEY_TYPES[data_type], value,
+                                  lambda success: self.on_key_added(key, success))
+            return
+        if data_type != '字符串':
+            QMessageBox.warning(self, "错误", f"不支持的数据类型: {data_type}")
+            return
     
         loading_dialog = LoadingDialog(self)  # 显示加载对话框
         loading_dialog.show()
     
         try:
-            if data_type == '字符串':
-                success = self.redis_client.set_string(key, value_text)
-            elif data_type == '哈希':
-                value = json.loads(value_text)  # 确保解析为字典
-                success = self.redis_client.set_hash(key, value)
-            elif data_type == '列表':
-                value = json.loads(value_text)  # 确保解析为列表
-                success = self.redis_client.set_list(key, value)
-            elif data_type == '集合':
-                value = json.loads(value_text)  # 确保解析为列表
-                success = self.redis_client.set_set(key, value)
-            elif data_type == '有序集合':
-                value = json.loads(value_text)  # 确保解析为列表
-                success = self.redis_client.set_zset(key, value)
-            else:
-                QMessageBox.warning(self, "错误", f"不支持的数据类型: {data_type}")
-                return
-    
-            if success:
-                QMessageBox.information(self, "成功", "键添加成功")
-                self.refresh_data()  # 刷新显示
-                self.refresh_key_list()  # 刷新当前库的键列表
-                self.new_key_input.clear()
-                self.new_value_input.clear()
-                self.new_type_combo.setCurrentIndex(0)
-                self.add_dialog.accept()  # 正确关闭添加键对话框
-            else:
-                QMessageBox.warning(self, "错误", "键添加失败")
-                
-        except json.JSONDecodeError:
-            QMessageBox.warning(self, "错误", "无效的JSON格式")
+            success = self.redis_client.set_string(key, value_text)
+            loading_dialog.close()
+            self.on_key_added(key, success)
         except Exception as e:
             QMessageBox.warning(self, "错误", f"添加键时出错: {str(e)}")
         finally:
             loading_dialog.close()  # 关闭加载对话框
+
+    def on_key_added(self, key, success):
+        """添加键完成"""
+        if success:
+            QMessageBox.information(self, "成功", "键添加成功")
+            self.refresh_data()  # 刷新显示
+            self.main_window.apply_key_changes(added=[key])  # 增量加入键列表
+            self.new_key_input.clear()
+            self.new_value_input.clear()
+            self.new_type_combo.setCurrentIndex(0)
+            self.add_dialog.accept()  # 正确关闭添加键对话框
+        else:
+            QMessageBox.warning(self, "错误", "键添加失败")
+
+    def start_bulk_write(self, key, key_type, value, callback):
+        """在后台分块写入集合类型的值，显示进度并支持取消"""
+        progress = QProgressDialog("正在写入...", "取消", 0, 100, self)
+        progress.setWindowTitle("写入数据")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
+        worker = BulkWriteWorker(self.redis_client.snapshot(), key, key_type, value, self)
+
+        def on_progress(written, total):
+            if total:
+                progress.setValue(int(written * 100 / total))
+
+        def on_finished(success, cancelled):
+            progress.close()
+            if cancelled:
+                QMessageBox.information(self, "已取消", "写入已取消，原有的值未被修改")
+                return
+            callback(success)
+
+        worker.progress.connect(on_progress)
+        worker.write_finished.connect(on_finished)
+        progress.canceled.connect(worker.cancel)
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
    
     def save_data(self):
         """保存数据"""
         if not self.current_key:
             QMessageBox.warning(self, "错误", "没有选中的键")
             return
+        if self.large_buffer is not None:
+            QMessageBox.warning(self, "错误", "大字符串为只读，请使用“保存到文件”导出")
+            return
             
         # 显示加载对话框
         loading_dialog = LoadingDialog(self)
@@ -374,35 +672,23 @@ class DataViewer(QWidget):
     def perform_save(self, loading_dialog):
         """执行保存操作"""
         try:
-            # 获取当前文本
-            text = ''
+            # 获取当前内容
             if self.current_type == 'string':
                 text = self.string_text.toPlainText().strip()
                 success = self.redis_client.set_string(self.current_key, text)
-            elif self.current_type == 'hash':
-                text = self.hash_text.toPlainText().strip()
-                data = json.loads(text)
-                success = self.redis_client.set_hash(self.current_key, data)
-            elif self.current_type == 'list':
-                text = self.list_text.toPlainText().strip()
-                data = json.loads(text)
-                success = self.redis_client.set_list(self.current_key, data)
-            elif self.current_type == 'set':
-                text = self.set_text.toPlainText().strip()
-                data = json.loads(text)
-                success = self.redis_client.set_set(self.current_key, data)
-            elif self.current_type == 'zset':
-                text = self.zset_text.toPlainText().strip()
-                data = json.loads(text)
-                success = self.redis_client.set_zset(self.current_key, data)
+                # 设置TTL
+                ttl = self.ttl_input.value()
+                if success and ttl >= 0:
+                    self.redis_client.set_ttl(self.current_key, ttl)
+            elif self.current_type in COLLECTION_MODELS:
+                # 只写入修改过的元素，TTL 有变化时在同一事务中修改
+                ttl = self.ttl_input.value()
+                success = self.redis_client.apply_delta(
+                    self.current_key, self.current_type, self.current_model.delta(),
+                    ttl if ttl != self.loaded_ttl else None)
             else:
                 QMessageBox.warning(self, "错误", f"不支持的数据类型: {self.current_type}")
                 return
-            
-            # 设置TTL
-            ttl = self.ttl_input.value()
-            if ttl >= 0:
-                self.redis_client.set_ttl(self.current_key, ttl)
 
             loading_dialog.close()  # 关闭加载对话框
 
@@ -416,19 +702,34 @@ class DataViewer(QWidget):
             loading_dialog.close()  # 关闭加载对话框
             QMessageBox.warning(self, "错误", f"保存数据时出错: {str(e)}")
 
-    def refresh_data(self):
-        """刷新当前数据"""
-        loading_dialog = LoadingDialog(self)  # 显示加载对话框
-        loading_dialog.show()
+    def on_renderer_changed(self):
+        """切换集合元素的显示方式"""
+        if self.current_model is not None:
+            self.current_model.set_renderer(self.renderer_combo.currentData())
 
-        # 使用 QTimer 来模拟耗时操作
-        QTimer.singleShot(0, lambda: self.perform_refresh(loading_dialog))
+    def add_row(self):
+        """在当前集合末尾添加一行并开始编辑"""
+        if self.current_model is None:
+            return
+        table = self.value_tables()[self.current_type]
+        index = self.current_model.insert_row()
+        table.scrollTo(index)
+        table.setCurrentIndex(index)
+        table.edit(index)
+
+    def delete_rows(self):
+        """删除表格中选中的行（保存后生效）"""
+        if self.current_model is None:
+            return
+        table = self.value_tables()[self.current_type]
+        rows = [index.row() for index in table.selectionModel().selectedRows()]
+        if rows:
+            self.current_model.remove_rows(rows)
 
-    def perform_refresh(self, loading_dialog):
-        """执行刷新操作"""
+    def refresh_data(self):
+        """刷新当前数据（跳过缓存，在后台重新获取）"""
         if self.current_key:
-            self.show_key_data(self.current_key)
-        loading_dialog.close()  # 关闭加载对话框
+            self.show_key_data(self.current_key, use_cache=False)
 
     def delete_key(self):
         """删除当前键"""
@@ -448,8 +749,9 @@ class DataViewer(QWidget):
             success = self.redis_client.delete_key(self.current_key)
             if success:
                 QMessageBox.information(self, "成功", "键删除成功")
+                deleted_key = self.current_key
                 self.clear_data()  # 清空数据显示
-                self.refresh_key_list()  # 刷新键列表
+                self.main_window.apply_key_changes(removed=[deleted_key])  # 从键列表中移除
             else:
                 QMessageBox.warning(self, "错误", "键删除失败")
         except Exception as e:
@@ -461,14 +763,15 @@ class DataViewer(QWidget):
         """清空数据显示"""
         self.current_key = None
         self.current_type = None
+        self.detail_request += 1
+        self.pending_detail = None
         self.type_label.setText("类型: -")
         self.data_area.setCurrentIndex(0)  # 默认显示字符串输入区域
         self.string_text.clear()
-        self.hash_text.clear()
-        self.list_text.clear()
-        self.set_text.clear()
-        self.zset_text.clear()
+        self.clear_tables()
+        self.stop_large_string()
         self.ttl_input.setValue(-1)
+        self.page_label.setText("")
 
     def apply_styles(self):
         """应用样式"""
@@ -0,0 +1,359 @@
+from PyQt6.QtCore import QAbstractItemModel, QModelIndex, Qt
+from PyQt6.QtWidgets import QApplication, QStyle
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import time
+
+from src.utils.key_trie import KeyTrie, ROOT
+from src.utils.key_index import KeySearchIndex
+from src.utils.formatting import format_bytes, format_ttl
+
+
+class KeyTreeModel(QAbstractItemModel):
+    """
+    基于 KeyTrie 的懒加载键树模型
+
+    节点的子项只有在视图展开该节点时才通过 fetchMore 排序并分块插入，
+    QModelIndex 的 internalId 即前缀树中的节点 id。
+    """
+
+    # 每次 fetchMore 插入的最大行数
+    FETCH_CHUNK = 2000
+    # 列：名称、类型、TTL、大小
+    HEADERS = ["键列表", "类型", "TTL", "大小"]
+    # 元数据缓存的有效期（秒），过期后可见时重新获取
+    METADATA_EXPIRY = 10
+    # 显示的 TTL 是否按获取后经过的时间递减（离线快照中的 TTL 是固定的）
+    COUNTDOWN_TTL = True
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.trie = KeyTrie()
+        self.search_index = KeySearchIndex()  # 与前缀树同步构建的子串索引
+        # 已展开节点的有序子节点列表及对应名称（用于二分查找行号）
+        self._child_ids: Dict[int, List[int]] = {}
+        self._child_labels: Dict[int, List[str]] = {}
+        # 已插入视图的子节点行数
+        self._fetched: Dict[int, int] = {}
+        # 过滤后可见的节点及其父节点，None 表示不过滤
+        self._visible: Optional[Set[int]] = None
+        self._visible_parents: Set[int] = set()
+        # 键节点 -> (KeyMetadata, 获取时间)
+        self._metadata: Dict[int, Tuple[object, float]] = {}
+        self._folder_icon = QApplication.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon)
+
+    # ---- 数据维护 ----
+
+    def clear(self):
+        """清空所有键"""
+        self.beginResetModel()
+        self.trie.clear()
+        self.search_index.clear()
+        self._metadata.clear()
+        self._visible = None
+        self._visible_parents = set()
+        self._reset_materialized()
+        self.endResetModel()
+
+    def _reset_materialized(self):
+        self._child_ids.clear()
+        self._child_labels.clear()
+        self._fetched.clear()
+
+    def set_filter(self, key_nodes: Optional[Iterable[int]]):
+        """只显示给定的键节点及其祖先；传入 None 取消过滤。结果一次性应用到视图"""
+        self.beginResetModel()
+        if key_nodes is None:
+            self._visible = None
+            self._visible_parents = set()
+        else:
+            visible = set()
+            parent_of = self.trie.parent
+            for node in key_nodes:
+                while node > ROOT and node not in visible:
+                    visible.add(node)
+                    node = parent_of(node)
+            self._visible = visible
+            self._visible_parents = {parent_of(node) for node in visible}
+        self._reset_materialized()
+        self.endResetModel()
+        if ROOT not in self._child_ids and self.canFetchMore(QModelIndex()):
+            self.fetchMore(QModelIndex())
+
+    def is_filtered(self) -> bool:
+        return self._visible is not None
+
+    def add_keys(self, keys):
+        """批量插入键，只通知已经展开过的父节点"""
+        trie = self.trie
+        index = self.search_index
+        for key in keys:
+            node, created = trie.add(key)
+            if node >= 0:
+                index.add(node, key)
+            if created >= 0:
+                self._insert_materialized(created)
+        if ROOT not in self._child_ids:
+            self.fetchMore(QModelIndex())
+        self._refresh_counts()
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, 0)
+
+    def remove_keys(self, keys):
+        """批量删除键，已展开的父节点下对应的行同步移除"""
+        trie = self.trie
+        for key in keys:
+            node, pruned = trie.remove(key)
+            if node < 0:
+                continue
+            self.search_index.discard(node)
+            self._metadata.pop(node, None)
+            if not pruned:
+                continue
+            for child in pruned:
+                # 被裁剪的节点不会再被使用，丢弃其展开状态
+                self._child_ids.pop(child, None)
+                self._child_labels.pop(child, None)
+                self._fetched.pop(child, None)
+            self._remove_materialized(pruned[-1])
+            trie.release(pruned)
+        self._refresh_counts()
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, 0)
+
+    # ---- 元数据 ----
+
+    def stale_metadata_keys(self, indexes) -> List[Tuple[int, str]]:
+        """返回给定行中缺少元数据或元数据已过期的键 (节点 id, 键名)"""
+        now = time.monotonic()
+        result = []
+        for index in indexes:
+            node = self.node_of(index)
+            if not self.trie.is_key(node):
+                continue
+            cached = self._metadata.get(node)
+            if cached is None or now - cached[1] > self.METADATA_EXPIRY:
+                result.append((node, self.trie.full_key(node)))
+        return result
+
+    def set_metadata(self, entries: Dict[int, object]):
+        """写入元数据并刷新对应行"""
+        now = time.monotonic()
+        last = len(self.HEADERS) - 1
+        for node, metadata in entries.items():
+            if not self.trie.is_key(node):
+                continue
+            self._metadata[node] = (metadata, now)
+            parent = self.trie.parent(node)
+            if parent in self._child_labels:
+                index = self._index_of(node)
+                if index.row() < self._fetched[parent]:
+                    self.dataChanged.emit(index.siblingAtColumn(1), index.siblingAtColumn(last))
+
+    def invalidate_metadata(self, keys):
+        """键被修改后丢弃其元数据"""
+        for key in keys:
+            node = self.trie.find(key)
+            if node >= 0:
+                self._metadata.pop(node, None)
+
+    def _metadata_text(self, node: int, column: int):
+        cached = self._metadata.get(node)
+        if cached is None:
+            return "" if self.trie.is_key(node) else None
+        metadata, fetched_at = cached
+        if column == 1:
+            return metadata.key_type
+        if column == 2:
+            ttl = metadata.ttl
+            if ttl > 0 and self.COUNTDOWN_TTL:
+                # 按获取后经过的时间推算剩余 TTL
+                ttl = max(0, ttl - int(time.monotonic() - fetched_at))
+            return format_ttl(ttl)
+        if metadata.size is None or metadata.size_in_bytes or metadata.key_type == 'string':
+            return format_bytes(metadata.size)
+        return f"{metadata.size} 项"
+
+    def _remove_materialized(self, node: int):
+        """从已展开的父节点中移除节点对应的行"""
+        parent = self.trie.parent(node)
+        labels = self._child_labels.get(parent)
+        if labels is None:
+            return
+        label = self.trie.label(node)
+        row = bisect_left(labels, label)
+        if row >= len(labels) or self._child_ids[parent][row] != node:
+            return
+        fetched = self._fetched[parent]
+        if row < fetched:
+            self.beginRemoveRows(self._index_of(parent), row, row)
+            del labels[row]
+            del self._child_ids[parent][row]
+            self._fetched[parent] = fetched - 1
+            self.endRemoveRows()
+        else:
+            del labels[row]
+            del self._child_ids[parent][row]
+
+    def _insert_materialized(self, node: int):
+        """新建节点的父节点若已展开，则按顺序插入"""
+        parent = self.trie.parent(node)
+        labels = self._child_labels.get(parent)
+        if labels is None:
+            return
+        if self._visible is not None and node not in self._visible:
+            return
+        label = self.trie.label(node)
+        row = bisect_left(labels, label)
+        fetched = self._fetched[parent]
+        if row < fetched:
+            self.beginInsertRows(self._index_of(parent), row, row)
+            labels.insert(row, label)
+            self._child_ids[parent].insert(row, node)
+            self._fetched[parent] = fetched + 1
+            self.endInsertRows()
+        else:
+            # 尚未插入视图的部分，等待 fetchMore
+            labels.insert(row, label)
+            self._child_ids[parent].insert(row, node)
+
+    def _refresh_counts(self):
+        """已展开节点下的文件夹键数量可能变化，通知视图重绘"""
+        for parent, fetched in self._fetched.items():
+            if fetched:
+                parent_index = self._index_of(parent)
+                self.dataChanged.emit(self.index(0, 0, parent_index),
+                                      self.index(fetched - 1, 0, parent_index),
+                                      [Qt.ItemDataRole.DisplayRole])
+
+    def _materialize(self, node: int):
+        """排序节点的子项，准备分块插入视图"""
+        children = self.trie.children(node)
+        if self._visible is not None:
+            visible = self._visible
+            children = {label: child for label, child in children.items() if child in visible}
+        labels = sorted(children)
+        self._child_labels[node] = labels
+        self._child_ids[node] = [children[label] for label in labels]
+        self._fetched[node] = 0
+
+    # ---- 辅助方法 ----
+
+    def node_of(self, index: QModelIndex) -> int:
+        return index.internalId() if index.isValid() else ROOT
+
+    def _index_of(self, node: int) -> QModelIndex:
+        if node == ROOT:
+            return QModelIndex()
+        parent = self.trie.parent(node)
+        row = bisect_left(self._child_labels[parent], self.trie.label(node))
+        return self.createIndex(row, 0, node)
+
+    def full_key(self, index: QModelIndex) -> str:
+        return self.trie.full_key(self.node_of(index))
+
+    def is_key(self, index: QModelIndex) -> bool:
+        return index.isValid() and self.trie.is_key(self.node_of(index))
+
+    def is_folder(self, index: QModelIndex) -> bool:
+        return index.isValid() and self.trie.has_children(self.node_of(index))
+
+    def folder_keys(self, index: QModelIndex):
+        """文件夹子树中的所有键"""
+        return self.trie.iter_keys(self.node_of(index))
+
+    def sibling_keys(self, index: QModelIndex, count: int) -> List[Tuple[int, str]]:
+        """
+        已显示的同级节点中，index 前后各最多 count 个键 (节点 id, 键名)
+
+        按距离由近到远交替排列（下一个、上一个、下下个……），跳过文件夹。
+        """
+        parent = self.trie.parent(self.node_of(index))
+        ids = self._child_ids.get(parent)
+        if ids is None:
+            return []
+        fetched = self._fetched[parent]
+        row = index.row()
+        after = (node for node in ids[row + 1:fetched] if self.trie.is_key(node))
+        before = (node for node in reversed(ids[:row]) if self.trie.is_key(node))
+        result = []
+        for _ in range(count):
+            for node in (next(after, None), next(before, None)):
+                if node is not None:
+                    result.append((node, self.trie.full_key(node)))
+        return result
+
+    # ---- QAbstractItemModel 接口 ----
+
+    def index(self, row, column, parent=QModelIndex()):
+        node = self.node_of(parent)
+        ids = self._child_ids.get(node)
+        if ids is None or row < 0 or row >= self._fetched[node]:
+            return QModelIndex()
+        return self.createIndex(row, column, ids[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        return self._index_of(self.trie.parent(index.internalId()))
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return self._fetched.get(self.node_of(parent), 0)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self.node_of(parent)
+        if self._visible is not None:
+            return node in self._visible_parents
+        return self.trie.has_children(node)
+
+    def canFetchMore(self, parent):
+        node = self.node_of(parent)
+        if not self.hasChildren(parent):
+            return False
+        ids = self._child_ids.get(node)
+        return ids is None or self._fetched[node] < len(ids)
+
+    def fetchMore(self, parent):
+        node = self.node_of(parent)
+        if node not in self._child_ids:
+            self._materialize(node)
+        start = self._fetched[node]
+        end = min(start + self.FETCH_CHUNK, len(self._child_ids[node]))
+        if end <= start:
+            return
+        self.beginInsertRows(parent, start, end - 1)
+        self._fetched[node] = end
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalId()
+        trie = self.trie
+        if index.column() > 0:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self._metadata_text(node, index.column())
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            if trie.has_children(node):
+                return f"{trie.label(node)} ({trie.key_count_of(node)})"
+            return trie.label(node)
+        if role == Qt.ItemDataRole.DecorationRole:
+            if trie.has_children(node):
+                return self._folder_icon
+            return None
+        if role == Qt.ItemDataRole.ToolTipRole or role == Qt.ItemDataRole.UserRole:
+            if trie.is_key(node):
+                return trie.full_key(node)
+            return None
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            if section == 0:
+                return f"键列表 ({len(self.trie)})"
+            return self.HEADERS[section]
+        return None
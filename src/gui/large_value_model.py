@@ -0,0 +1,67 @@
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QFontDatabase
+
+
+class LargeValueModel(QAbstractTableModel):
+    """
+    大字符串的只读表格模型
+
+    每行对应缓冲区中固定长度的一段字节，只有视图请求的行才会从
+    LargeValueBuffer 读取并解码，因此显示开销与值的大小无关。
+    """
+
+    HEX = 'hex'
+    TEXT = 'text'
+    # 每行显示的字节数
+    BYTES_PER_ROW = {HEX: 16, TEXT: 128}
+
+    def __init__(self, buffer, mode: str = HEX, parent=None):
+        super().__init__(parent)
+        self.buffer = buffer
+        self.mode = mode
+        self._font = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
+
+    def set_mode(self, mode: str):
+        """切换十六进制 / 文本显示"""
+        self.beginResetModel()
+        self.mode = mode
+        self.endResetModel()
+
+    def row_size(self) -> int:
+        return self.BYTES_PER_ROW[self.mode]
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        row_size = self.row_size()
+        return (self.buffer.size + row_size - 1) // row_size
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return 3 if self.mode == self.HEX else 2
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or orientation != Qt.Orientation.Horizontal:
+            return None
+        if self.mode == self.HEX:
+            return ["偏移", "十六进制", "文本"][section]
+        return ["偏移", "文本"][section]
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.FontRole:
+            return self._font
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        offset = index.row() * self.row_size()
+        if index.column() == 0:
+            return f"{offset:08x}"
+        chunk = self.buffer.read(offset, self.row_size())
+        if self.mode == self.HEX and index.column() == 1:
+            return chunk.hex(' ')
+        if self.mode == self.HEX:
+            return ''.join(chr(b) if 32 <= b < 127 else '.' for b in chunk)
+        # 文本模式：行边界可能截断多字节字符，无法解码的字节以替换字符显示
+        return chunk.decode('utf-8', errors='replace').replace('\n', '↵').replace('\r', '')
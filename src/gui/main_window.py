@@ -3,23 +3,72 @@ from PyQt6.QtCore import *
 from PyQt6.QtGui import *
 import sys
 import os
-from collections import defaultdict
+import time
 
 # 添加项目根目录到Python路径
 current_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, current_dir)
 
 # 导入其他模块
-from src.redis_client import RedisClient
+from src.redis_client import RedisClient, to_match_pattern, escape_pattern
+from src.config_manager import ConfigManager
 from src.gui.connection_dialog import ConnectionDialog
 from src.gui.data_viewer import DataViewer
+from src.gui.workers import (KeyLoadWorker, KeyFilterWorker, KeyspaceWatcher, MetadataWorker,
+                             KeyspaceInfoWorker, BulkDeleteWorker, PrefetchWorker,
+                             KeyExportWorker, KeyImportWorker)
+from src.utils.formatting import format_ttl, format_bytes
+from src.gui.key_tree_model import KeyTreeModel
+from src.gui.analysis_views import MemoryAnalysisDialog, RdbAnalysisDialog
+from src.gui.bulk_load_dialog import BulkLoadDialog
+from src.gui.monitor_panel import MonitorPanel
+from src.gui.slowlog_panel import SlowlogPanel
+
+# 键数量不超过该值时加载完成后自动展开所有节点
+AUTO_EXPAND_LIMIT = 2000
+# 搜索框输入停止多少毫秒后才执行过滤
+FILTER_DEBOUNCE_MS = 250
+# 服务端模式搜索时 SCAN 的 COUNT（大部分键不匹配，加大步长减少往返）
+SERVER_SEARCH_SCAN_COUNT = 5000
+# 滚动/展开停止多少毫秒后获取可见键的元数据
+METADATA_DEBOUNCE_MS = 150
+# 数据库列表键统计的刷新间隔
+KEYSPACE_REFRESH_MS = 10000
+# 批量删除时每个管道之间的休眠（秒），避免挤占线上流量
+BULK_DELETE_PAUSE = 0.005
+# 未开启实时更新时，值缓存的有效期（秒）；开启后依赖键事件使缓存失效
+VALUE_CACHE_MAX_AGE = 30
+# 选中键后预取前后各多少个同级键、预取的总字节预算、单个值超过多少字节不预取
+PREFETCH_SIBLINGS = 5
+PREFETCH_BYTE_BUDGET = 8 * 1024 * 1024
+PREFETCH_MAX_VALUE_BYTES = 256 * 1024
+# 导出文件的扩展名和文件对话框过滤器
+DUMP_FILE_SUFFIX = ".rdump.gz"
+DUMP_FILE_FILTER = "Redis 导出文件 (*.rdump.gz);;所有文件 (*)"
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Redis GUI")
         self.setMinimumSize(1200, 800)
-        self.redis_client = RedisClient()
+        self.config_manager = ConfigManager()
+        self.redis_client = RedisClient(
+            max_connections=self.config_manager.get_setting('pool_max_connections'),
+            health_check_interval=self.config_manager.get_setting('health_check_interval'),
+            socket_keepalive=self.config_manager.get_setting('socket_keepalive'))
+        self.redis_client.value_cache.max_bytes = self.config_manager.get_setting('value_cache_mb') * 1024 * 1024
+        self.key_loader = None      # 当前正在运行的键加载线程
+        self.filter_worker = None   # 当前正在运行的过滤线程
+        self.keyspace_watcher = None  # 实时更新模式下的键事件订阅线程
+        self.metadata_worker = None   # 当前正在获取元数据的线程
+        self._metadata_pending = False
+        self.keyspace_info = {}       # 数据库编号 -> INFO keyspace 统计
+        self.keyspace_info_worker = None
+        self.prefetch_worker = None   # 当前正在预取同级键的线程
+        self.memory_dialog = None     # 内存分析窗口
+        self.bulk_load_dialog = None  # 批量导入窗口
+        self.monitor_panel = None     # 监控面板
+        self.slowlog_panel = None     # 慢查询分析窗口
         self.setup_ui()
 
     def setup_ui(self):
@@ -47,6 +96,11 @@ class MainWindow(QMainWindow):
         self.db_list.setMinimumHeight(200)  # 设置最小高度
         self.db_list.itemClicked.connect(self.on_db_selected)
         db_layout.addWidget(self.db_list)
+
+        # 后台定期刷新各数据库的键统计
+        self._keyspace_timer = QTimer(self)
+        self._keyspace_timer.setInterval(KEYSPACE_REFRESH_MS)
+        self._keyspace_timer.timeout.connect(self.refresh_keyspace_info)
         left_layout.addWidget(db_group)
 
         # 键列表组
@@ -60,8 +114,18 @@ class MainWindow(QMainWindow):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("搜索键...")
         self.search_input.textChanged.connect(self.filter_keys)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._run_filter)
         self.search_input.setMinimumHeight(30)
         tools_layout.addWidget(self.search_input)
+
+        # 服务端搜索模式：搜索文本作为 SCAN MATCH 模式在服务器上匹配
+        self.server_search_check = QCheckBox("服务端")
+        self.server_search_check.setToolTip("在服务器端使用 SCAN MATCH 搜索，支持 * ? [] 通配符")
+        self.server_search_check.toggled.connect(self.on_search_mode_changed)
+        tools_layout.addWidget(self.server_search_check)
         
         # 删除按钮
         delete_btn = QPushButton("删除选中")
@@ -71,20 +135,50 @@ class MainWindow(QMainWindow):
         
         keys_layout.addLayout(tools_layout)
         
-        # 树形键列表
-        self.key_tree = QTreeWidget()
-        self.key_tree.setHeaderLabel("键列表")
+        # 树形键列表（懒加载模型，节点展开时才生成子项）
+        self.key_model = KeyTreeModel(self)
+        self.key_tree = QTreeView()
+        self.key_tree.setModel(self.key_model)
+        self.key_tree.setUniformRowHeights(True)
         self.key_tree.setMinimumHeight(400)
-        self.key_tree.setSelectionMode(QTreeWidget.SelectionMode.ExtendedSelection)
-        self.key_tree.itemClicked.connect(self.on_tree_item_selected)
+        self.key_tree.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        # 点击和方向键移动都会改变当前项
+        self.key_tree.selectionModel().currentChanged.connect(
+            lambda current, previous: self.on_tree_item_selected(current))
         self.key_tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.key_tree.customContextMenuRequested.connect(self.show_context_menu)
+        header = self.key_tree.header()
+        header.setStretchLastSection(False)
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for column, width in ((1, 55), (2, 65), (3, 70)):
+            header.resizeSection(column, width)
         keys_layout.addWidget(self.key_tree)
+
+        # 只为视口中可见的键获取类型/TTL/大小，滚动停止后合并成一个管道
+        self._metadata_timer = QTimer(self)
+        self._metadata_timer.setSingleShot(True)
+        self._metadata_timer.setInterval(METADATA_DEBOUNCE_MS)
+        self._metadata_timer.timeout.connect(self._fetch_visible_metadata)
+        self.key_tree.verticalScrollBar().valueChanged.connect(self._metadata_timer.start)
+        self.key_tree.expanded.connect(self._metadata_timer.start)
+        self.key_model.rowsInserted.connect(self._metadata_timer.start)
+        self.key_model.modelReset.connect(self._metadata_timer.start)
+
+        # 加载进度与取消按钮
+        load_layout = QHBoxLayout()
+        self.load_status_label = QLabel("")
+        load_layout.addWidget(self.load_status_label)
+        self.cancel_load_btn = QPushButton("取消")
+        self.cancel_load_btn.setMinimumHeight(24)
+        self.cancel_load_btn.clicked.connect(self.cancel_key_loading)
+        self.cancel_load_btn.hide()
+        load_layout.addWidget(self.cancel_load_btn)
+        keys_layout.addLayout(load_layout)
         
         left_layout.addWidget(keys_group)
 
         # 设置左侧面板的固定宽度
-        left_panel.setFixedWidth(300)
+        left_panel.setFixedWidth(460)
         layout.addWidget(left_panel)
 
         # 创建右侧数据显示区
@@ -140,25 +234,46 @@ class MainWindow(QMainWindow):
         self.connect_btn.setStyleSheet(button_style)
 
     def filter_keys(self, text):
-        """过滤键列表"""
-        def filter_items(item):
-            # 如果是文件夹，检查所有子项
-            if item.childCount() > 0:
-                show_children = False
-                for i in range(item.childCount()):
-                    if filter_items(item.child(i)):
-                        show_children = True
-                item.setHidden(not show_children)
-                return show_children
-            else:
-                # 如果是键，检查是否匹配
-                matches = text.lower() in self._get_full_key(item).lower()
-                item.setHidden(not matches)
-                return matches
+        """过滤键列表（防抖，停止输入后再执行）"""
+        self._filter_timer.start()
+
+    def on_search_mode_changed(self, checked):
+        """切换本地过滤 / 服务端搜索后重新加载键列表"""
+        if self.redis_client.client:
+            self.refresh_key_list()
 
-        # 从根节点开始过滤
-        for i in range(self.key_tree.topLevelItemCount()):
-            filter_items(self.key_tree.topLevelItem(i))
+    def _is_server_search(self) -> bool:
+        return self.server_search_check.isChecked() and bool(self.search_input.text())
+
+    def _run_filter(self):
+        """在后台线程中查询子串索引，结果一次性应用到树"""
+        if self.server_search_check.isChecked():
+            # 服务端模式：新的查询会中止正在进行的扫描
+            if self.redis_client.client:
+                self.refresh_key_list()
+            return
+
+        text = self.search_input.text()
+        if not text:
+            self.filter_worker = None
+            if self.key_model.is_filtered():
+                self.key_model.set_filter(None)
+            return
+
+        worker = KeyFilterWorker(self.key_model.search_index.snapshot(), text, self)
+        worker.filter_ready.connect(lambda text, ids: self._on_filter_ready(worker, text, ids))
+        worker.finished.connect(worker.deleteLater)
+        self.filter_worker = worker
+        worker.start()
+
+    def _on_filter_ready(self, worker, text, ids):
+        if worker is not self.filter_worker or text != self.search_input.text():
+            return  # 过期的查询结果
+        self.filter_worker = None
+        self.key_model.set_filter(ids)
+        if len(ids) <= AUTO_EXPAND_LIMIT:
+            self.key_tree.expandAll()
+        self.statusBar().showMessage(f"匹配 {len(ids)} 个键", 5000)
 
     def show_connection_dialog(self):
         dialog = ConnectionDialog(self)
@@ -167,6 +282,9 @@ class MainWindow(QMainWindow):
             conn_info = dialog.get_connection_info()
             if self.redis_client.connect(**conn_info):  # 使用解包操作符传递参数
                 self.refresh_db_list()  # 只在连接成功后刷新
+                self._restart_keyspace_watcher()
+                if self.bulk_load_dialog is not None:
+                    self.bulk_load_dialog.update_target()
                 QMessageBox.information(self, "成功", "Redis连接成功！")
             else:
                 QMessageBox.warning(self, "错误", "无法连接到Redis服务器，请检查连接信息。")
@@ -176,115 +294,266 @@ class MainWindow(QMainWindow):
             return
         
         self.db_list.clear()
-        for i in range(16):  # Redis默认16个数据库
-            item = QListWidgetItem(f"db{i}")
+        self.keyspace_info = self.redis_client.get_keyspace_info()
+        for i in range(self.redis_client.get_database_count()):
+            item = QListWidgetItem()
+            item.setData(Qt.ItemDataRole.UserRole, i)
             item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
             self.db_list.addItem(item)
+        self._update_db_items()
+        self._keyspace_timer.start()
+
+    def refresh_keyspace_info(self):
+        """在后台线程中刷新各数据库的键统计"""
+        if not self.redis_client.client or self.keyspace_info_worker:
+            return
+        worker = KeyspaceInfoWorker(self.redis_client, self)
+        worker.info_ready.connect(self._on_keyspace_info)
+        worker.finished.connect(worker.deleteLater)
+        self.keyspace_info_worker = worker
+        worker.start()
+
+    def _on_keyspace_info(self, info):
+        self.keyspace_info_worker = None
+        self.keyspace_info = info
+        self._update_db_items()
+
+    def _update_db_items(self):
+        """根据 INFO keyspace 更新数据库列表的文字"""
+        for row in range(self.db_list.count()):
+            item = self.db_list.item(row)
+            db = item.data(Qt.ItemDataRole.UserRole)
+            stats = self.keyspace_info.get(db)
+            if stats:
+                item.setText(f"db{db} ({stats['keys']})")
+                avg_ttl = format_ttl(stats['avg_ttl'] // 1000) if stats['avg_ttl'] else "-"
+                item.setToolTip(f"键: {stats['keys']}\n设置过期: {stats['expires']}\n平均TTL: {avg_ttl}")
+            else:
+                item.setText(f"db{db}")
+                item.setToolTip("空数据库")
+
+    def _refresh_db_size(self, db: int) -> int:
+        """用 DBSIZE 更新当前数据库在列表中的键数量，返回键数量"""
+        size = self.redis_client.get_db_size()
+        stats = self.keyspace_info.get(db)
+        cached = stats['keys'] if stats else 0
+        if size != cached:
+            if size:
+                self.keyspace_info[db] = dict(stats or {'expires': 0, 'avg_ttl': 0}, keys=size)
+            else:
+                self.keyspace_info.pop(db, None)
+            self._update_db_items()
+            # 过期键数量和平均 TTL 也已过时，在后台重新获取
+            self.refresh_keyspace_info()
+        return size
 
     def on_db_selected(self, item):
         if not self.redis_client.client:  # 检查是否已连接
             QMessageBox.warning(self, "错误", "请先连接到Redis服务器")
             return
         
-        db_num = int(item.text().replace("db", ""))
+        db_num = item.data(Qt.ItemDataRole.UserRole)
         if self.redis_client.select_db(db_num):  # 检查数据库选择是否成功
-            self.refresh_key_list()
+            # keyspace_info 可能已过时，先用一次 DBSIZE 确认键数量，空数据库无需扫描
+            if self._refresh_db_size(db_num):
+                self.refresh_key_list()
+            else:
+                self._stop_key_loader()
+                self.key_model.clear()
+                self.load_status_label.setText("空数据库")
+            self._restart_keyspace_watcher()
+            if self.bulk_load_dialog is not None:
+                self.bulk_load_dialog.update_target()
         else:
             QMessageBox.warning(self, "错误", f"无法切换到数据库 {db_num}")
 
     def refresh_key_list(self):
-        """刷新键列表为树形结构"""
-        self.key_tree.clear()
-        keys = self.redis_client.get_all_keys()
-        
-        # 创建树形结构
-        tree = defaultdict(dict)
-        for key in sorted(keys):
-            parts = key.split(':')
-            current = tree
-            for i, part in enumerate(parts):
-                if i == len(parts) - 1:
-                    current[part] = None  # 叶子节点
-                else:
-                    if part not in current:
-                        current[part] = defaultdict(dict)
-                    current = current[part]
-        
-        # 递归构建树形界面
-        self._build_tree(tree, self.key_tree)
-        self.key_tree.expandAll()  # 展开所有节点
-
-    def _build_tree(self, tree_dict, parent_item):
-        """递归构建树形结构"""
-        for key, value in tree_dict.items():
-            if value is None:  # 叶子节点（实际的键）
-                item = QTreeWidgetItem(parent_item)
-                item.setText(0, key)
-                item.setData(0, Qt.ItemDataRole.UserRole, self._get_full_key(item))
-            else:  # 文件夹节点
-                folder = QTreeWidgetItem(parent_item)
-                folder.setText(0, key)
-                folder.setIcon(0, self.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon))
-                self._build_tree(value, folder)
-
-    def _get_full_key(self, item):
-        """获取完整的键名"""
-        parts = []
-        while item is not None:
-            parts.insert(0, item.text(0))
-            item = item.parent()
-        return ':'.join(parts)
-
-    def on_tree_item_selected(self, item, column):
+        """在后台线程中刷新键列表，结果分批填充到树形结构"""
+        self._stop_key_loader()
+        self.key_model.clear()
+
+        if self._is_server_search():
+            pattern = to_match_pattern(self.search_input.text())
+            worker = KeyLoadWorker(self.redis_client.snapshot(), pattern,
+                                   count=SERVER_SEARCH_SCAN_COUNT, parent=self)
+        else:
+            worker = KeyLoadWorker(self.redis_client.snapshot(), parent=self)
+        worker.keys_loaded.connect(lambda keys: self._on_keys_loaded(worker, keys))
+        worker.progress.connect(
+            lambda seen, total, cursor: self._on_load_progress(worker, seen, total, cursor))
+        worker.load_finished.connect(lambda cancelled: self._on_load_finished(worker, cancelled))
+        worker.finished.connect(worker.deleteLater)
+        self.key_loader = worker
+
+        self.load_status_label.setText("正在加载键...")
+        self.cancel_load_btn.show()
+        worker.start()
+
+    def cancel_key_loading(self):
+        """取消正在进行的键加载"""
+        if self.key_loader:
+            self.key_loader.cancel()
+
+    def _stop_key_loader(self):
+        """中止旧的加载线程，其后续发出的信号将被忽略"""
+        if self.key_loader:
+            self.key_loader.cancel()
+            self.key_loader = None
+        self.cancel_load_btn.hide()
+
+    def _on_keys_loaded(self, worker, keys):
+        """把一批键加入树中"""
+        if worker is not self.key_loader:
+            return  # 过期的加载结果
+        self.key_model.add_keys(keys)
+
+    def _on_load_progress(self, worker, keys_seen, total, cursor):
+        if worker is not self.key_loader:
+            return
+        if worker.pattern != '*':
+            self.load_status_label.setText(f"已匹配 {len(self.key_model.trie)} 个键")
+            self.statusBar().showMessage(f"正在搜索 {worker.pattern}（游标 {cursor}）")
+        else:
+            self.load_status_label.setText(f"已加载 {len(self.key_model.trie)} / {total}")
+            self.statusBar().showMessage(f"正在加载键: {keys_seen} / {total}（游标 {cursor}）")
+
+    def _on_load_finished(self, worker, cancelled):
+        if worker is not self.key_loader:
+            return
+        self.key_loader = None
+        self.cancel_load_btn.hide()
+        count = len(self.key_model.trie)
+        if cancelled:
+            self.load_status_label.setText(f"已取消，已加载 {count} 个键")
+        else:
+            self.load_status_label.setText(f"共 {count} 个键")
+            if self.search_input.text() and not self.server_search_check.isChecked():
+                self._run_filter()
+            elif count <= AUTO_EXPAND_LIMIT:
+                self.key_tree.expandAll()
+        self.statusBar().showMessage(f"共加载 {count} 个键", 5000)
+
+    def _visible_indexes(self):
+        """视口中当前可见的行"""
+        view = self.key_tree
+        height = view.viewport().height()
+        indexes = []
+        index = view.indexAt(QPoint(1, 1))
+        while index.isValid() and view.visualRect(index).top() < height:
+            indexes.append(index)
+            index = view.indexBelow(index)
+        return indexes
+
+    def _fetch_visible_metadata(self):
+        """为可见且没有（或已过期）元数据的键发起一次管道查询"""
+        if not self.redis_client.client:
+            return
+        if self.metadata_worker:
+            self._metadata_pending = True
+            return
+        entries = self.key_model.stale_metadata_keys(self._visible_indexes())
+        if not entries:
+            return
+        worker = MetadataWorker(self.redis_client.snapshot(), entries, self)
+        worker.metadata_ready.connect(self.key_model.set_metadata)
+        worker.finished.connect(self._on_metadata_finished)
+        worker.finished.connect(worker.deleteLater)
+        self.metadata_worker = worker
+        worker.start()
+
+    def _on_metadata_finished(self):
+        self.metadata_worker = None
+        if self._metadata_pending:
+            self._metadata_pending = False
+            self._metadata_timer.start()
+
+    def on_tree_item_selected(self, index):
         """处理树节点选择"""
-        if not item.childCount():  # 只处理叶子节点
-            full_key = self._get_full_key(item)
-            self.data_viewer.show_key_data(full_key)
+        if self.key_model.is_key(index):  # 只处理真实存在的键
+            self.data_viewer.show_key_data(self.key_model.full_key(index))
+            self._prefetch_siblings(index)
+
+    def _prefetch_siblings(self, index):
+        """在后台预取选中键前后的同级键，方向键浏览时可直接从缓存显示"""
+        if self.prefetch_worker:
+            self.prefetch_worker.cancel()
+            self.prefetch_worker = None
+        entries = self.key_model.sibling_keys(index, PREFETCH_SIBLINGS)
+        if not entries or not self.redis_client.client:
+            return
+        worker = PrefetchWorker(self.redis_client.snapshot(), entries, PREFETCH_BYTE_BUDGET,
+                                PREFETCH_MAX_VALUE_BYTES, self)
+        worker.metadata_ready.connect(
+            lambda metadata: self._on_prefetch_metadata(worker, metadata))
+        worker.finished.connect(worker.deleteLater)
+        self.prefetch_worker = worker
+        worker.start()
+
+    def _on_prefetch_metadata(self, worker, metadata):
+        if worker is self.prefetch_worker:
+            self.key_model.set_metadata(metadata)
 
     def show_context_menu(self, position):
         """显示右键菜单"""
-        items = self.key_tree.selectedItems()
-        if not items:
+        indexes = self.key_tree.selectionModel().selectedRows()
+        if not indexes:
             return
 
         menu = QMenu()
         delete_action = menu.addAction("删除")
         delete_action.triggered.connect(self.delete_selected)
+        export_action = menu.addAction("导出...")
+        export_action.triggered.connect(self.export_selected)
         
-        if len(items) == 1 and items[0].childCount() > 0:
+        if len(indexes) == 1 and self.key_model.is_folder(indexes[0]):
             # 如果选中的是文件夹，添加展开/折叠选项
+            folder = indexes[0]
             expand_action = menu.addAction("展开所有")
-            expand_action.triggered.connect(lambda: self._expand_folder(items[0], True))
+            expand_action.triggered.connect(lambda: self.key_tree.expandRecursively(folder))
             collapse_action = menu.addAction("折叠所有")
-            collapse_action.triggered.connect(lambda: self._expand_folder(items[0], False))
+            collapse_action.triggered.connect(lambda: self._collapse_folder(folder))
 
         menu.exec(self.key_tree.viewport().mapToGlobal(position))
 
-    def _expand_folder(self, item, expand=True):
-        """展开或折叠文件夹"""
-        item.setExpanded(expand)
-        for i in range(item.childCount()):
-            self._expand_folder(item.child(i), expand)
+    def _collapse_folder(self, index):
+        """折叠文件夹及其已加载的子文件夹"""
+        self.key_tree.collapse(index)
+        for row in range(self.key_model.rowCount(index)):
+            child = self.key_model.index(row, 0, index)
+            if self.key_tree.isExpanded(child):
+                self._collapse_folder(child)
 
-    def delete_selected(self):
-        """删除选中的键或文件夹"""
-        items = self.key_tree.selectedItems()
-        if not items:
-            return
+    def _selected_keys_and_patterns(self):
+        """
+        把树中选中的项转换为 (键列表, SCAN 模式列表, 预计键数量)
 
-        keys_to_delete = []
-        for item in items:
-            if item.childCount() > 0:  # 文件夹
-                keys_to_delete.extend(self._get_folder_keys(item))
-            else:  # 单个键
-                keys_to_delete.append(self._get_full_key(item))
+        文件夹转换为前缀模式，在服务器端遍历；文件夹自身对应的键单独列出。
+        """
+        keys = []
+        patterns = []
+        estimated = 0
+        for index in self.key_tree.selectionModel().selectedRows():
+            if self.key_model.is_folder(index):  # 文件夹：前缀 + 文件夹自身对应的键
+                prefix = self.key_model.full_key(index)
+                patterns.append(escape_pattern(prefix) + ':*')
+                if self.key_model.is_key(index):
+                    keys.append(prefix)
+                estimated += self.key_model.trie.key_count_of(self.key_model.node_of(index))
+            elif self.key_model.is_key(index):  # 单个键
+                keys.append(self.key_model.full_key(index))
+                estimated += 1
+        return list(dict.fromkeys(keys)), list(dict.fromkeys(patterns)), estimated
 
-        if not keys_to_delete:
+    def delete_selected(self):
+        """删除选中的键或文件夹（文件夹在服务器端按前缀流式删除）"""
+        keys_to_delete, patterns, estimated = self._selected_keys_and_patterns()
+        if not keys_to_delete and not patterns:
             return
 
-        msg = f"确定要删除以下 {len(keys_to_delete)} 个键吗？\n" + "\n".join(keys_to_delete[:10])
-        if len(keys_to_delete) > 10:
-            msg += f"\n... 等 {len(keys_to_delete)} 个键"
+        names = [f"{pattern}（文件夹）" for pattern in patterns] + keys_to_delete
+        msg = f"确定要删除以下约 {estimated} 个键吗？\n" + "\n".join(names[:10])
+        if len(names) > 10:
+            msg += f"\n... 等 {len(names)} 项"
 
         reply = QMessageBox.question(
             self,
@@ -293,35 +562,123 @@ class MainWindow(QMainWindow):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No
         )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
 
-        if reply == QMessageBox.StandardButton.Yes:
-            success_count = 0
-            for key in keys_to_delete:
-                if self.redis_client.delete_key(key):
-                    success_count += 1
-
-            # 清空右侧数据显示
-            self.data_viewer.clear_data()
-            
-            # 刷新键列表
-            self.refresh_key_list()
-            
-            QMessageBox.information(
-                self,
-                "删除完成",
-                f"成功删除 {success_count} 个键，失败 {len(keys_to_delete) - success_count} 个"
-            )
+        # 清空右侧数据显示
+        self.data_viewer.clear_data()
+
+        progress = QProgressDialog("正在删除...", "取消", 0, max(estimated, 1), self)
+        progress.setWindowTitle("批量删除")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+
+        worker = BulkDeleteWorker(self.redis_client.snapshot(), keys_to_delete, patterns,
+                                  pause=BULK_DELETE_PAUSE, parent=self)
+        progress.canceled.connect(worker.cancel)
+
+        def on_keys_deleted(keys, deleted):
+            # 已删除的键立即从键列表中移除
+            self.apply_key_changes(removed=keys)
+            if deleted > progress.maximum():
+                progress.setMaximum(deleted)
+            progress.setValue(deleted)
+            progress.setLabelText(f"已删除 {deleted} 个键...")
+
+        def on_finished(deleted, cancelled):
+            progress.close()
+            title = "删除已取消" if cancelled else "删除完成"
+            QMessageBox.information(self, title, f"成功删除 {deleted} 个键")
+
+        worker.keys_deleted.connect(on_keys_deleted)
+        worker.delete_finished.connect(on_finished)
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
+
+    def export_selected(self):
+        """导出选中的键或文件夹"""
+        keys, patterns, estimated = self._selected_keys_and_patterns()
+        if keys or patterns:
+            self._start_export(keys, patterns, estimated)
+
+    def export_current_db(self):
+        """导出当前数据库的所有键"""
+        if not self.redis_client.client:
+            QMessageBox.warning(self, "错误", "请先连接 Redis")
+            return
+        self._start_export([], ['*'], self.redis_client.get_db_size())
 
-    def _get_folder_keys(self, folder_item):
-        """获取文件夹中所有键"""
-        keys = []
-        for i in range(folder_item.childCount()):
-            child = folder_item.child(i)
-            if child.childCount() > 0:  # 子文件夹
-                keys.extend(self._get_folder_keys(child))
-            else:  # 叶子节点
-                keys.append(self._get_full_key(child))
-        return keys
+    def _start_export(self, keys, patterns, estimated):
+        """选择文件后在后台导出（DUMP + PTTL），显示进度和吞吐量"""
+        path, _ = QFileDialog.getSaveFileName(self, "导出", "redis_export" + DUMP_FILE_SUFFIX,
+                                              DUMP_FILE_FILTER)
+        if not path:
+            return
+        worker = KeyExportWorker(self.redis_client.snapshot(), path, keys, patterns, estimated, self)
+        self._run_transfer(worker, "导出", "导出")
+
+    def import_keys(self):
+        """从导出文件恢复键（RESTORE）到当前数据库"""
+        if not self.redis_client.client:
+            QMessageBox.warning(self, "错误", "请先连接 Redis")
+            return
+        path, _ = QFileDialog.getOpenFileName(self, "导入", "", DUMP_FILE_FILTER)
+        if not path:
+            return
+        box = QMessageBox(QMessageBox.Icon.Question, "导入", "当前库中已存在同名的键时：",
+                          parent=self)
+        replace_btn = box.addButton("覆盖", QMessageBox.ButtonRole.AcceptRole)
+        skip_btn = box.addButton("跳过", QMessageBox.ButtonRole.AcceptRole)
+        box.addButton("取消", QMessageBox.ButtonRole.RejectRole)
+        box.exec()
+        if box.clickedButton() not in (replace_btn, skip_btn):
+            return
+        worker = KeyImportWorker(self.redis_client.snapshot(), path, box.clickedButton() is replace_btn, self)
+        self._run_transfer(worker, "导入", "导入", on_done=self.refresh_key_list)
+
+    def _run_transfer(self, worker, title, verb, on_done=None):
+        """运行导出/导入线程，进度框中显示键/秒和 MB/秒"""
+        progress = QProgressDialog(f"正在{verb}...", "取消", 0, 1000, self)
+        progress.setWindowTitle(title)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.setValue(0)
+        started = time.monotonic()
+        transferred = [0]  # 最近一次进度中的字节数
+
+        def throughput(count, size):
+            elapsed = max(time.monotonic() - started, 1e-6)
+            return f"{count / elapsed:.0f} 键/秒，{size / elapsed / 1024 / 1024:.1f} MB/秒"
+
+        def status(count, failed):
+            return f"{count} 个键" + (f"，失败 {failed} 个" if failed else "")
+
+        def on_progress(count, failed, size, fraction):
+            if fraction >= 0:
+                progress.setValue(int(fraction * 1000))
+            # 速率按已处理（成功 + 失败）的键数计算
+            progress.setLabelText(f"已{verb} {status(count, failed)}（{format_bytes(size)}）\n"
+                                  f"{throughput(count + failed, size)}")
+            transferred[0] = size
+
+        def on_finished(count, failed, failures, cancelled, error):
+            progress.close()
+            if error:
+                QMessageBox.warning(self, "错误", f"{verb}失败: {error}")
+            else:
+                msg = f"成功{verb} {status(count, failed)}，{throughput(count + failed, transferred[0])}"
+                if failures:
+                    msg += "\n失败的键例如:\n" + "\n".join(
+                        f"{key}: {reason}" for key, reason in failures[:10])
+                QMessageBox.information(self, f"{verb}已取消" if cancelled else f"{verb}完成", msg)
+            if on_done:
+                on_done()
+
+        worker.progress.connect(on_progress)
+        worker.transfer_finished.connect(on_finished)
+        progress.canceled.connect(worker.cancel)
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
 
     def create_menu_bar(self):
         menubar = self.menuBar()
@@ -332,6 +689,10 @@ class MainWindow(QMainWindow):
         new_conn_action = QAction("新建连接", self)
         new_conn_action.triggered.connect(self.show_connection_dialog)
         file_menu.addAction(new_conn_action)
+
+        open_rdb_action = QAction("打开RDB文件...", self)
+        open_rdb_action.triggered.connect(self.open_rdb_file)
+        file_menu.addAction(open_rdb_action)
         
         # 添加数据库操作菜单
         db_menu = menubar.addMenu("数据库")
@@ -343,11 +704,62 @@ class MainWindow(QMainWindow):
         flush_all_action = QAction("清空所有库", self)
         flush_all_action.triggered.connect(self.flush_all_dbs)
         db_menu.addAction(flush_all_action)
+
+        db_menu.addSeparator()
+        export_db_action = QAction("导出当前库...", self)
+        export_db_action.triggered.connect(self.export_current_db)
+        db_menu.addAction(export_db_action)
+
+        import_action = QAction("导入...", self)
+        import_action.triggered.connect(self.import_keys)
+        db_menu.addAction(import_action)
+
+        db_menu.addSeparator()
+        self.live_update_action = QAction("实时更新键列表", self)
+        self.live_update_action.setCheckable(True)
+        self.live_update_action.toggled.connect(self.toggle_live_update)
+        db_menu.addAction(self.live_update_action)
+
+        # 工具菜单
+        tools_menu = menubar.addMenu("工具")
+
+        memory_action = QAction("内存分析...", self)
+        memory_action.triggered.connect(self.show_memory_analysis)
+        tools_menu.addAction(memory_action)
+
+        bulk_load_action = QAction("批量导入 (JSON/CSV)...", self)
+        bulk_load_action.triggered.connect(self.show_bulk_load)
+        tools_menu.addAction(bulk_load_action)
+
+        tools_menu.addSeparator()
+        monitor_action = QAction("监控...", self)
+        monitor_action.triggered.connect(self.show_monitor)
+        tools_menu.addAction(monitor_action)
+
+        slowlog_action = QAction("慢查询分析...", self)
+        slowlog_action.triggered.connect(self.show_slowlog)
+        tools_menu.addAction(slowlog_action)
+        
+        # 设置菜单
+        settings_menu = menubar.addMenu("设置")
+
+        threshold_action = QAction("大字符串阈值...", self)
+        threshold_action.triggered.connect(self.set_large_string_threshold)
+        settings_menu.addAction(threshold_action)
         
         exit_action = QAction("退出", self)
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
 
+    def set_large_string_threshold(self):
+        """设置使用分块只读查看的字符串大小"""
+        current = self.config_manager.get_setting('large_string_threshold') // 1024
+        value, ok = QInputDialog.getInt(
+            self, "大字符串阈值", "超过该大小（KB）的字符串使用分块只读查看：",
+            current, 1, 1024 * 1024)
+        if ok:
+            self.config_manager.set_setting('large_string_threshold', value * 1024)
+
     def flush_current_db(self):
         """清空当前数据库"""
         reply = QMessageBox.question(
@@ -388,6 +800,167 @@ class MainWindow(QMainWindow):
             else:
                 QMessageBox.warning(self, "错误", "清空数据库失败")
 
+    def toggle_live_update(self, enabled):
+        """开启/关闭基于键事件通知的实时更新"""
+        if not enabled:
+            self._stop_keyspace_watcher()
+            return
+        if not self.redis_client.client:
+            QMessageBox.warning(self, "错误", "请先连接到Redis服务器")
+            self.live_update_action.setChecked(False)
+            return
+        if not self.redis_client.keyspace_events_enabled():
+            reply = QMessageBox.question(
+                self,
+                "开启键事件通知",
+                "服务器未开启键事件通知（notify-keyspace-events），是否现在开启？\n"
+                "这会修改服务器配置，并带来少量额外开销。",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No
+            )
+            if reply != QMessageBox.StandardButton.Yes or not self.redis_client.enable_keyspace_events():
+                if reply == QMessageBox.StandardButton.Yes:
+                    QMessageBox.warning(self, "错误", "无法修改 notify-keyspace-events 配置")
+                self.live_update_action.setChecked(False)
+                return
+        self._restart_keyspace_watcher()
+
+    def _restart_keyspace_watcher(self):
+        """按当前数据库重新订阅键事件"""
+        self._stop_keyspace_watcher()
+        if not self.live_update_action.isChecked() or not self.redis_client.client:
+            return
+        watcher = KeyspaceWatcher(self.redis_client.snapshot(), self.redis_client.connection_info['db'], self)
+        watcher.keys_changed.connect(
+            lambda added, removed: self._on_keyspace_changed(watcher, added, removed))
+        watcher.watch_failed.connect(lambda error: self._on_watch_failed(watcher, error))
+        watcher.finished.connect(watcher.deleteLater)
+        self.keyspace_watcher = watcher
+        watcher.start()
+
+    def _stop_keyspace_watcher(self):
+        if self.keyspace_watcher:
+            self.keyspace_watcher.cancel()
+            self.keyspace_watcher = None
+
+    def _on_keyspace_changed(self, watcher, added, removed):
+        if watcher is not self.keyspace_watcher:
+            return
+        if self._is_server_search():
+            # 新键未必匹配服务端搜索模式，只同步删除
+            added = []
+        self.apply_key_changes(added, removed)
+
+    def _on_watch_failed(self, watcher, error):
+        if watcher is not self.keyspace_watcher:
+            return
+        self.keyspace_watcher = None
+        self.live_update_action.setChecked(False)
+        QMessageBox.warning(self, "错误", f"键事件订阅失败: {error}")
+
+    def apply_key_changes(self, added=(), removed=()):
+        """把新增/删除的键增量应用到键树和搜索索引"""
+        # 键事件同时用于修改，新增的键也可能是被修改过的键
+        self.redis_client.invalidate_cached(added)
+        self.redis_client.invalidate_cached(removed)
+        if added:
+            self.key_model.add_keys(added)
+            self.key_model.invalidate_metadata(added)
+            self._metadata_timer.start()
+        if removed:
+            self.key_model.remove_keys(removed)
+        if self.key_loader is None:
+            self.load_status_label.setText(f"共 {len(self.key_model.trie)} 个键")
+        if self.key_model.is_filtered():
+            self._filter_timer.start()
+
+    def value_cache_max_age(self):
+        """值缓存的有效期：订阅了键事件时缓存会被及时失效，不需要限制"""
+        return None if self.keyspace_watcher is not None else VALUE_CACHE_MAX_AGE
+
+    def closeEvent(self, event):
+        """关闭窗口前停止后台线程"""
+        self._stop_keyspace_watcher()
+        self.data_viewer.stop_workers()
+        if self.memory_dialog is not None:
+            self.memory_dialog.close()
+        if self.bulk_load_dialog is not None:
+            self.bulk_load_dialog.close()
+        if self.monitor_panel is not None:
+            self.monitor_panel.shutdown()
+        if self.slowlog_panel is not None:
+            self.slowlog_panel.shutdown()
+        for dialog in self.findChildren(RdbAnalysisDialog):
+            dialog.close()
+        if self.key_loader:
+            self._stop_key_loader()
+        # 其余后台线程（键事件订阅、预取、元数据、键统计、批量删除、导出/导入等）
+        # 先全部取消，再等待结束，之后才能断开连接池
+        workers = self.findChildren(QThread)
+        for worker in workers:
+            if hasattr(worker, 'cancel'):
+                worker.cancel()
+        for worker in workers:
+            worker.wait(3000)
+        self.redis_client.close_pools()
+        super().closeEvent(event)
+
+    def open_rdb_file(self):
+        """离线分析 RDB 快照文件，每个文件一个独立的只读窗口"""
+        path, _ = QFileDialog.getOpenFileName(self, "打开RDB文件", "", "RDB 文件 (*.rdb);;所有文件 (*)")
+        if not path:
+            return
+        dialog = RdbAnalysisDialog(path, self)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.show()
+        dialog.start()
+
+    def show_memory_analysis(self):
+        """打开内存分析窗口（非模态，可与主窗口同时使用）"""
+        if not self.redis_client.client:
+            QMessageBox.warning(self, "错误", "请先连接 Redis")
+            return
+        if self.memory_dialog is None:
+            self.memory_dialog = MemoryAnalysisDialog(self.redis_client, self)
+        self.memory_dialog.show()
+        self.memory_dialog.raise_()
+
+    def show_bulk_load(self):
+        """打开批量导入窗口，写入完成后刷新键列表"""
+        if not self.redis_client.client:
+            QMessageBox.warning(self, "错误", "请先连接 Redis")
+            return
+        if self.bulk_load_dialog is None:
+            self.bulk_load_dialog = BulkLoadDialog(self.redis_client, self)
+            self.bulk_load_dialog.load_completed.connect(self.refresh_key_list)
+        self.bulk_load_dialog.show()
+        self.bulk_load_dialog.raise_()
+
     def show_monitor(self):
-        # 实现监控面板（将在后续代码中添加）
-        pass
\ No newline at end of file
+        """打开监控面板（非模态），默认监控当前连接的服务器，可添加其他服务器"""
+        if self.monitor_panel is None:
+            self.monitor_panel = MonitorPanel(self.redis_client, self)
+        self.monitor_panel.show()
+        self.monitor_panel.raise_()
+
+    def show_slowlog(self):
+        """打开当前服务器的慢查询分析窗口；切换过服务器时为新服务器重新创建"""
+        if not self.redis_client.client:
+            QMessageBox.warning(self, "错误", "请先连接 Redis")
+            return
+        info = self.redis_client.connection_info
+        panel = self.slowlog_panel
+        if panel is not None and panel.server != (info['host'], info['port'], info.get('password')):
+            panel.close()
+            panel.shutdown()
+            panel.deleteLater()
+            panel = self.slowlog_panel = None
+        if panel is None:
+            panel = SlowlogPanel(info, self)
+            if not panel.is_connected():
+                panel.deleteLater()
+                QMessageBox.warning(self, "错误", "无法连接到 Redis 服务器")
+                return
+            self.slowlog_panel = panel
+        panel.show()
+        panel.raise_()
\ No newline at end of file
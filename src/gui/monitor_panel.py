@@ -0,0 +1,373 @@
+from PyQt6.QtWidgets import *
+from PyQt6.QtCore import *
+from PyQt6.QtGui import *
+from bisect import bisect_left
+from itertools import islice
+import math
+import time
+
+from src.redis_client import RedisClient
+from src.gui.connection_dialog import ConnectionDialog
+from src.gui.workers import InfoPoller
+from src.utils.formatting import format_bytes, format_ttl
+from src.utils.server_metrics import MetricHistory, METRICS, DEFAULT_HISTORY_SIZE
+
+# 默认采样间隔（秒）
+DEFAULT_POLL_INTERVAL = 1
+# 可选的图表时间窗口：(显示名称, 秒数)
+TIME_WINDOWS = [
+    ("1 分钟", 60),
+    ("5 分钟", 300),
+    ("15 分钟", 900),
+    ("1 小时", 3600),
+]
+DEFAULT_TIME_WINDOW = 300
+# 无法获取屏幕刷新率时使用的重绘频率
+DEFAULT_REFRESH_RATE = 60
+# 每个服务器在图表中的颜色（按添加顺序循环使用）
+SERIES_COLORS = ['#1f77b4', '#d62728', '#2ca02c', '#ff7f0e',
+                 '#9467bd', '#8c564b', '#e377c2', '#17becf']
+CHART_COLUMNS = 3
+
+
+def format_metric(value: float, unit: str) -> str:
+    """按指标单位格式化数值"""
+    if value is None or math.isnan(value):
+        return "-"
+    if unit == 'bytes':
+        return format_bytes(value)
+    if unit == 'percent':
+        return f"{value:.1f}%"
+    if unit == 'ratio':
+        return f"{value:.2f}"
+    if unit == 'rate':
+        return f"{value:.0f}/s" if value >= 10 else f"{value:.1f}/s"
+    return f"{value:.0f}"
+
+
+class MonitoredServer:
+    """一个被监控的服务器：独立的 RedisClient、采样线程和指标历史"""
+
+    def __init__(self, name: str, client: RedisClient, color: QColor):
+        self.name = name
+        self.client = client
+        self.color = color
+        self.history = MetricHistory(DEFAULT_HISTORY_SIZE)
+        self.poller = None
+        self.error = ""
+
+    def stop(self, wait: bool = True):
+        if self.poller is not None:
+            poller = self.poller
+            self.poller = None
+            poller.cancel()
+            if wait:
+                poller.wait(3000)
+
+
+class MetricChart(QWidget):
+    """
+    单项指标的折线图，每个服务器一条线
+
+    只绘制时间窗口内的采样点，同一像素列上的多个点合并为最小值到最大值的竖线，
+    绘制开销与窗口宽度成正比，而与保留的采样数量无关。
+    """
+
+    MARGIN_LEFT = 8
+    MARGIN_RIGHT = 8
+    MARGIN_TOP = 22
+    MARGIN_BOTTOM = 16
+
+    def __init__(self, name: str, label: str, unit: str, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.label = label
+        self.unit = unit
+        self.servers = []
+        self.window = DEFAULT_TIME_WINDOW
+        self.setMinimumSize(240, 140)
+
+    def _buckets(self, history, start: float, left: float, width: float):
+        """把窗口内的采样点按像素列合并，返回线段列表，每段为 [(x, 最小值, 最大值)]"""
+        times = history.times
+        first = bisect_left(times, start)
+        segments = []
+        current = []
+        for t, value in zip(islice(times, first, None),
+                            islice(history.series[self.name], first, None)):
+            if math.isnan(value):
+                if current:
+                    segments.append(current)
+                    current = []
+                continue
+            x = int(left + (t - start) / self.window * width)
+            if current and current[-1][0] == x:
+                _, low, high = current[-1]
+                current[-1] = (x, min(low, value), max(high, value))
+            else:
+                current.append((x, value, value))
+        if current:
+            segments.append(current)
+        return segments
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        palette = self.palette()
+        painter.fillRect(self.rect(), palette.color(QPalette.ColorRole.Base))
+        plot = QRectF(self.rect()).adjusted(self.MARGIN_LEFT, self.MARGIN_TOP,
+                                            -self.MARGIN_RIGHT, -self.MARGIN_BOTTOM)
+        text_color = palette.color(QPalette.ColorRole.Text)
+        painter.setPen(text_color)
+        painter.drawText(QRectF(self.MARGIN_LEFT, 2, plot.width(), self.MARGIN_TOP - 4),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, self.label)
+
+        start = time.monotonic() - self.window
+        lines = []
+        peak = 0.0
+        for server in self.servers:
+            segments = self._buckets(server.history, start, plot.left(), plot.width())
+            for segment in segments:
+                peak = max(peak, max(high for _, _, high in segment))
+            lines.append((server, segments))
+        if self.unit == 'percent':
+            peak = 100.0
+        # 纵轴从 0 开始，顶部留出一点空白
+        top = peak * 1.1 if peak > 0 else 1.0
+
+        # 右上角显示各服务器的最新值
+        right = plot.right()
+        metrics = painter.fontMetrics()
+        for server, _ in reversed(lines):
+            text = format_metric(server.history.latest(self.name), self.unit)
+            text_width = metrics.horizontalAdvance(text)
+            painter.setPen(server.color)
+            painter.drawText(QRectF(right - text_width, 2, text_width, self.MARGIN_TOP - 4),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, text)
+            right -= text_width + 10
+
+        grid_color = palette.color(QPalette.ColorRole.Mid)
+        painter.setPen(QPen(grid_color, 1, Qt.PenStyle.DotLine))
+        painter.drawLine(plot.topLeft(), plot.topRight())
+        painter.drawLine(plot.bottomLeft(), plot.bottomRight())
+        painter.setPen(grid_color)
+        painter.drawText(QRectF(plot.left(), plot.bottom(), plot.width(), self.MARGIN_BOTTOM),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         f"最大 {format_metric(peak, self.unit)}")
+
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        scale = plot.height() / top
+        for server, segments in lines:
+            painter.setPen(QPen(server.color, 1.5))
+            for segment in segments:
+                polyline = QPolygonF()
+                for x, low, high in segment:
+                    polyline.append(QPointF(x, plot.bottom() - low * scale))
+                    if high != low:
+                        polyline.append(QPointF(x, plot.bottom() - high * scale))
+                if polyline.count() == 1:
+                    painter.drawPoint(polyline[0])
+                else:
+                    painter.drawPolyline(polyline)
+        painter.end()
+
+
+class MonitorPanel(QDialog):
+    """
+    服务器监控面板
+
+    每个服务器一个后台线程定时执行 INFO all，计算出的指标存入定长的环形缓冲区，
+    长时间运行内存不增长。图表只在收到新采样后、按屏幕刷新率节流重绘。
+    面板关闭时停止采样，再次打开时继续（中间的空白在图表中显示为断开）。
+    """
+
+    SERVER_COLUMNS = ["服务器", "版本", "角色", "运行时间", "状态"]
+
+    def __init__(self, redis_client, parent=None):
+        super().__init__(parent)
+        self.redis_client = redis_client
+        self.servers = []
+        self._dirty = False
+        self._color_index = 0
+        self.setWindowTitle("监控")
+        self.resize(1100, 760)
+
+        layout = QVBoxLayout(self)
+        toolbar = QHBoxLayout()
+        add_btn = QPushButton("添加服务器...")
+        add_btn.clicked.connect(self.add_server_dialog)
+        toolbar.addWidget(add_btn)
+        self.remove_btn = QPushButton("移除")
+        self.remove_btn.clicked.connect(self.remove_selected)
+        toolbar.addWidget(self.remove_btn)
+        toolbar.addStretch()
+        toolbar.addWidget(QLabel("采样间隔:"))
+        self.interval_input = QSpinBox()
+        self.interval_input.setRange(1, 60)
+        self.interval_input.setSuffix(" 秒")
+        self.interval_input.setValue(DEFAULT_POLL_INTERVAL)
+        self.interval_input.valueChanged.connect(self._on_interval_changed)
+        toolbar.addWidget(self.interval_input)
+        toolbar.addWidget(QLabel("时间范围:"))
+        self.window_combo = QComboBox()
+        for label, seconds in TIME_WINDOWS:
+            self.window_combo.addItem(label, seconds)
+        self.window_combo.setCurrentIndex(self.window_combo.findData(DEFAULT_TIME_WINDOW))
+        self.window_combo.currentIndexChanged.connect(self._on_window_changed)
+        toolbar.addWidget(self.window_combo)
+        layout.addLayout(toolbar)
+
+        self.server_table = QTableWidget(0, len(self.SERVER_COLUMNS))
+        self.server_table.setHorizontalHeaderLabels(self.SERVER_COLUMNS)
+        self.server_table.horizontalHeader().setStretchLastSection(True)
+        self.server_table.verticalHeader().setVisible(False)
+        self.server_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.server_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.server_table.setMaximumHeight(140)
+        layout.addWidget(self.server_table)
+
+        grid = QGridLayout()
+        self.charts = []
+        for i, (name, label, unit) in enumerate(METRICS):
+            chart = MetricChart(name, label, unit, self)
+            chart.servers = self.servers
+            grid.addWidget(chart, i // CHART_COLUMNS, i % CHART_COLUMNS)
+            self.charts.append(chart)
+        layout.addLayout(grid, 1)
+
+        # 新采样只标记需要重绘，由该定时器按屏幕刷新率统一重绘
+        self._frame_timer = QTimer(self)
+        self._frame_timer.timeout.connect(self._redraw)
+
+        info = redis_client.connection_info
+        if redis_client.client and info:
+            self.add_server(info['host'], info['port'], info.get('password'))
+
+    def _frame_interval(self) -> int:
+        screen = self.screen()
+        rate = screen.refreshRate() if screen is not None else 0
+        return max(1, int(1000 / (rate or DEFAULT_REFRESH_RATE)))
+
+    def add_server_dialog(self):
+        dialog = ConnectionDialog(self)
+        if dialog.exec():
+            info = dialog.get_connection_info()
+            self.add_server(info['host'], info['port'], info.get('password'))
+
+    def add_server(self, host: str, port: int, password: str = None) -> bool:
+        name = f"{host}:{port}"
+        if any(server.name == name for server in self.servers):
+            QMessageBox.information(self, "提示", f"{name} 已在监控列表中")
+            return False
+        # 每个服务器单独的客户端和连接池，采样不会占用浏览数据的连接
+        client = RedisClient(max_connections=1)
+        if not client.connect(host, port, password, 0):
+            QMessageBox.warning(self, "错误", f"无法连接到 {name}")
+            return False
+        color = QColor(SERIES_COLORS[self._color_index % len(SERIES_COLORS)])
+        self._color_index += 1
+        server = MonitoredServer(name, client, color)
+        self.servers.append(server)
+        self.server_table.insertRow(self.server_table.rowCount())
+        self._update_server_row(server)
+        if self.isVisible():
+            self._start_poller(server)
+        return True
+
+    def remove_selected(self):
+        rows = sorted({index.row() for index in self.server_table.selectedIndexes()}, reverse=True)
+        for row in rows:
+            server = self.servers.pop(row)
+            server.stop()
+            server.client.close_pools()
+            self.server_table.removeRow(row)
+        if rows:
+            self._dirty = True
+
+    def _start_poller(self, server):
+        if server.poller is not None:
+            return
+        poller = InfoPoller(server.client, self.interval_input.value(), self)
+        poller.info_ready.connect(lambda timestamp, info: self._on_info(server, poller, timestamp, info))
+        poller.poll_failed.connect(lambda error: self._on_poll_failed(server, poller, error))
+        poller.finished.connect(poller.deleteLater)
+        server.poller = poller
+        poller.start()
+
+    def _on_info(self, server, poller, timestamp, info):
+        if server.poller is not poller:
+            return
+        server.history.add(timestamp, info)
+        server.error = ""
+        self._update_server_row(server)
+        self._dirty = True
+
+    def _on_poll_failed(self, server, poller, error):
+        if server.poller is not poller:
+            return
+        server.error = error
+        self._update_server_row(server)
+
+    def _update_server_row(self, server):
+        row = self.servers.index(server)
+        summary = server.history.summary
+        uptime = summary.get('uptime')
+        values = [
+            server.name,
+            summary.get('version', ''),
+            summary.get('role', ''),
+            format_ttl(uptime) if uptime is not None else '',
+            server.error or ("正常" if server.poller is not None else "已暂停"),
+        ]
+        for column, text in enumerate(values):
+            item = self.server_table.item(row, column)
+            if item is None:
+                item = QTableWidgetItem()
+                self.server_table.setItem(row, column, item)
+            item.setText(text)
+        self.server_table.item(row, 0).setData(Qt.ItemDataRole.DecorationRole, server.color)
+
+    def _on_interval_changed(self, value):
+        for server in self.servers:
+            if server.poller is not None:
+                server.poller.interval = value
+
+    def _on_window_changed(self):
+        window = self.window_combo.currentData()
+        for chart in self.charts:
+            chart.window = window
+        self._dirty = True
+
+    def _redraw(self):
+        if not self._dirty:
+            return
+        self._dirty = False
+        for chart in self.charts:
+            chart.update()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        for server in self.servers:
+            self._start_poller(server)
+            self._update_server_row(server)
+        self._frame_timer.start(self._frame_interval())
+
+    def _stop_polling(self):
+        self._frame_timer.stop()
+        for server in self.servers:
+            server.stop()
+            self._update_server_row(server)
+
+    def reject(self):
+        self._stop_polling()
+        super().reject()
+
+    def closeEvent(self, event):
+        """关闭时停止采样（最小化时继续）"""
+        self._stop_polling()
+        super().closeEvent(event)
+
+    def shutdown(self):
+        """主窗口关闭时调用：停止采样并断开所有监控连接"""
+        self._stop_polling()
+        for server in self.servers:
+            server.client.close_pools()
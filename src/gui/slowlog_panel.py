@@ -0,0 +1,260 @@
+from PyQt6.QtWidgets import *
+from PyQt6.QtCore import *
+from collections import deque
+from datetime import datetime
+
+from src.redis_client import RedisClient
+from src.gui.analysis_views import ReportTableModel, create_report_table
+from src.gui.workers import SlowlogWorker
+from src.utils.formatting import format_duration
+from src.utils.slowlog_stats import SlowlogStats
+
+# 默认自动刷新间隔（秒）
+DEFAULT_REFRESH_SECONDS = 5
+# “最近慢查询”中保留的记录数量
+RECENT_ENTRIES = 1000
+# 明细中命令文本最多显示的字符数
+MAX_COMMAND_TEXT = 200
+
+
+def _format_time(timestamp) -> str:
+    return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S') if timestamp else "-"
+
+
+def _format_ms(milliseconds) -> str:
+    return format_duration(milliseconds * 1000)
+
+
+def _command_text(args) -> str:
+    text = ' '.join(args)
+    return text if len(text) <= MAX_COMMAND_TEXT else text[:MAX_COMMAND_TEXT] + '...'
+
+
+class SlowlogGroupModel(ReportTableModel):
+    """按命令和键前缀汇总的慢查询"""
+
+    COLUMNS = [
+        ("命令", lambda m, g: g.command, None),
+        ("键前缀", lambda m, g: g.prefix, None),
+        ("次数", lambda m, g: g.count, None),
+        ("总耗时", lambda m, g: g.total, format_duration),
+        ("平均", lambda m, g: g.average, format_duration),
+        ("P50", lambda m, g: g.percentile(50), format_duration),
+        ("P99", lambda m, g: g.percentile(99), format_duration),
+        ("最大", lambda m, g: g.max_duration, format_duration),
+        ("最近一次", lambda m, g: g.last_seen, _format_time),
+    ]
+
+
+class SlowlogEntryModel(ReportTableModel):
+    """最近的慢查询记录"""
+
+    COLUMNS = [
+        ("命令", lambda m, e: _command_text(e.args), None),
+        ("ID", lambda m, e: e.id, None),
+        ("时间", lambda m, e: e.timestamp, _format_time),
+        ("耗时", lambda m, e: e.duration, format_duration),
+        ("客户端", lambda m, e: e.client_name or e.client, None),
+    ]
+
+
+class LatencyEventModel(ReportTableModel):
+    """LATENCY LATEST 中的事件"""
+
+    COLUMNS = [
+        ("事件", lambda m, e: e.name, None),
+        ("最近发生", lambda m, e: e.timestamp, _format_time),
+        ("最近延迟", lambda m, e: e.latest, _format_ms),
+        ("最大延迟", lambda m, e: e.max_latency, _format_ms),
+        ("历史记录数", lambda m, e: len(e.history), None),
+    ]
+
+
+class SlowlogPanel(QDialog):
+    """
+    慢查询与延迟分析
+
+    使用独立的 RedisClient 定时增量读取 SLOWLOG（只下载上次之后的新记录），
+    按命令和归一化的键前缀汇总次数、总耗时和 P50/P99；同时显示 LATENCY LATEST
+    中的事件，选中事件时显示其 LATENCY HISTORY。
+    """
+
+    def __init__(self, connection_info: dict, parent=None):
+        super().__init__(parent)
+        self.server = (connection_info['host'], connection_info['port'], connection_info.get('password'))
+        # 独立的连接池，刷新时不占用浏览数据的连接
+        self.client = RedisClient(max_connections=1)
+        self.client.connect(self.server[0], self.server[1], self.server[2], 0)
+        self.stats = SlowlogStats()
+        self.recent = deque(maxlen=RECENT_ENTRIES)
+        self.last_id = None
+        self.missed = 0  # 两次读取之间被新记录挤出 SLOWLOG 的记录数
+        self.worker = None
+        self.latency_supported = True
+        self.setWindowTitle(f"慢查询分析 - {self.server[0]}:{self.server[1]}")
+        self.resize(1100, 650)
+
+        layout = QVBoxLayout(self)
+        toolbar = QHBoxLayout()
+        self.auto_refresh_check = QCheckBox("自动刷新")
+        self.auto_refresh_check.setChecked(True)
+        self.auto_refresh_check.toggled.connect(self._update_timer)
+        toolbar.addWidget(self.auto_refresh_check)
+        self.interval_input = QSpinBox()
+        self.interval_input.setRange(1, 3600)
+        self.interval_input.setSuffix(" 秒")
+        self.interval_input.setValue(DEFAULT_REFRESH_SECONDS)
+        self.interval_input.valueChanged.connect(self._update_timer)
+        toolbar.addWidget(self.interval_input)
+        refresh_btn = QPushButton("立即刷新")
+        refresh_btn.clicked.connect(self.refresh)
+        toolbar.addWidget(refresh_btn)
+        clear_btn = QPushButton("清空统计")
+        clear_btn.setToolTip("清空已汇总的数据，之后只统计新的慢查询")
+        clear_btn.clicked.connect(self.clear_stats)
+        toolbar.addWidget(clear_btn)
+        toolbar.addStretch()
+        export_btn = QPushButton("导出CSV")
+        export_btn.clicked.connect(self.export_csv)
+        toolbar.addWidget(export_btn)
+        layout.addLayout(toolbar)
+
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
+        self.tabs = QTabWidget()
+        self.group_model = SlowlogGroupModel(self)
+        self.entry_model = SlowlogEntryModel(self)
+        self.latency_model = LatencyEventModel(self)
+        self.tabs.addTab(create_report_table(self.group_model, 3, 160), "按命令汇总")
+        self.tabs.addTab(create_report_table(self.entry_model, 1, 500), "最近慢查询")
+
+        latency_page = QWidget()
+        latency_layout = QVBoxLayout(latency_page)
+        self.latency_label = QLabel("")
+        latency_layout.addWidget(self.latency_label)
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        self.latency_table = create_report_table(self.latency_model, 3, 200)
+        self.latency_table.selectionModel().currentRowChanged.connect(self._show_latency_history)
+        splitter.addWidget(self.latency_table)
+        self.history_table = QTableWidget(0, 2)
+        self.history_table.setHorizontalHeaderLabels(["时间", "延迟"])
+        self.history_table.horizontalHeader().setStretchLastSection(True)
+        self.history_table.verticalHeader().setVisible(False)
+        self.history_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        splitter.addWidget(self.history_table)
+        splitter.setSizes([650, 350])
+        latency_layout.addWidget(splitter)
+        self.tabs.addTab(latency_page, "延迟事件")
+        layout.addWidget(self.tabs)
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+
+    def is_connected(self) -> bool:
+        return self.client.client is not None
+
+    def refresh(self):
+        """启动一次后台读取；上一次还未完成时跳过"""
+        if self.worker is not None or not self.is_connected():
+            return
+        worker = SlowlogWorker(self.client, self.last_id, self.latency_supported, self)
+        worker.slowlog_ready.connect(lambda entries, latency: self._on_slowlog_ready(worker, entries, latency))
+        worker.finished.connect(worker.deleteLater)
+        self.worker = worker
+        worker.start()
+
+    def _on_slowlog_ready(self, worker, entries, latency):
+        if worker is not self.worker:
+            return
+        self.worker = None
+        now = datetime.now().strftime('%H:%M:%S')
+        if entries is None:
+            self.status_label.setText(f"读取 SLOWLOG 失败（{now}）")
+            return
+        if entries:
+            if self.last_id is not None and entries[0].id > self.last_id + 1:
+                self.missed += entries[0].id - self.last_id - 1
+            self.last_id = entries[-1].id
+            self.stats.extend(entries)
+            self.recent.extend(entries)
+            self.group_model.set_rows(self.stats.groups())
+            self.entry_model.set_rows(list(self.recent))
+        status = (f"已汇总 {self.stats.entries} 条慢查询，总耗时 {format_duration(self.stats.total)}，"
+                  f"本次新增 {len(entries)} 条，最近刷新 {now}")
+        if self.missed:
+            status += f"；{self.missed} 条在读取前已被覆盖，可缩短刷新间隔或调大 slowlog-max-len"
+        self.status_label.setText(status)
+
+        if self.latency_supported and latency is None:
+            # 服务器不支持或禁用了 LATENCY 命令，之后不再请求
+            self.latency_supported = False
+            self.latency_label.setText("服务器不支持 LATENCY 命令")
+        elif latency is not None:
+            self.latency_model.set_rows(latency)
+            self.latency_label.setText(
+                "" if latency else "没有延迟事件（需要将 latency-monitor-threshold 设置为大于 0）")
+            self._show_latency_history(self.latency_table.currentIndex())
+
+    def _show_latency_history(self, index, previous=None):
+        if not index.isValid() or index.row() >= len(self.latency_model.rows):
+            self.history_table.setRowCount(0)
+            return
+        history = self.latency_model.rows[index.row()].history
+        self.history_table.setRowCount(len(history))
+        for row, (timestamp, latency) in enumerate(reversed(history)):
+            self.history_table.setItem(row, 0, QTableWidgetItem(_format_time(timestamp)))
+            self.history_table.setItem(row, 1, QTableWidgetItem(_format_ms(latency)))
+
+    def clear_stats(self):
+        """清空汇总数据；last_id 保留，已读过的记录不会被重新统计"""
+        self.stats.clear()
+        self.recent.clear()
+        self.missed = 0
+        self.group_model.set_rows([])
+        self.entry_model.set_rows([])
+        self.status_label.setText("")
+
+    def export_csv(self):
+        """导出当前标签页的表格"""
+        index = self.tabs.currentIndex()
+        model, name = [(self.group_model, "slowlog_summary.csv"),
+                       (self.entry_model, "slowlog.csv"),
+                       (self.latency_model, "latency.csv")][index]
+        path, _ = QFileDialog.getSaveFileName(self, "导出CSV", name, "CSV 文件 (*.csv)")
+        if not path:
+            return
+        try:
+            model.export_csv(path)
+        except OSError as e:
+            QMessageBox.warning(self, "错误", f"导出失败: {str(e)}")
+
+    def _update_timer(self):
+        if self.auto_refresh_check.isChecked() and self.isVisible():
+            self._timer.start(self.interval_input.value() * 1000)
+        else:
+            self._timer.stop()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._update_timer()
+        self.refresh()
+
+    def _stop(self):
+        self._timer.stop()
+        if self.worker is not None:
+            self.worker.wait(3000)
+
+    def reject(self):
+        self._stop()
+        super().reject()
+
+    def closeEvent(self, event):
+        """关闭时停止自动刷新"""
+        self._stop()
+        super().closeEvent(event)
+
+    def shutdown(self):
+        """不再使用该面板时调用：停止刷新并断开连接"""
+        self._stop()
+        self.client.close_pools()
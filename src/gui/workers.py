@@ -0,0 +1,733 @@
+from PyQt6.QtCore import QThread, pyqtSignal
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import csv
+import os
+import time
+
+from src.redis_client import SLOW_PIPELINE_SECONDS, KeyMetadata
+from src.utils.value_cache import CachedValue
+from src.utils.rdb_parser import RdbParser, RdbError
+from src.utils.dump_format import DumpWriter, DumpReader, DumpFormatError
+from src.utils.bulk_loader import RowReader
+
+
+class KeyLoadWorker(QThread):
+    """后台线程：通过 SCAN 分批加载键，并以信号形式把结果送回界面线程"""
+
+    keys_loaded = pyqtSignal(list)            # 一批新加载的键
+    progress = pyqtSignal(int, int, int)      # 已加载数量, 数据库键总数, 当前游标
+    load_finished = pyqtSignal(bool)          # 是否被取消
+
+    # 合并若干次 SCAN 结果后再发信号，避免信号过多拖慢界面
+    EMIT_BATCH_SIZE = 5000
+    EMIT_INTERVAL = 0.2
+
+    def __init__(self, redis_client, pattern: str = '*', count: int = None, parent=None):
+        super().__init__(parent)
+        self.redis_client = redis_client
+        self.pattern = pattern
+        self.count = count
+        self._cancelled = False
+
+    def cancel(self):
+        """请求取消加载，线程会在当前批次结束后退出"""
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def run(self):
+        total = self.redis_client.get_db_size()
+        pending = []
+        last_emit = time.monotonic()
+        keys_seen = 0
+        cursor = 0
+        scan_args = {'count': self.count} if self.count else {}
+        for batch in self.redis_client.scan_keys(self.pattern, **scan_args):
+            if self._cancelled:
+                break
+            pending.extend(batch.keys)
+            keys_seen, cursor = batch.keys_seen, batch.cursor
+            now = time.monotonic()
+            if len(pending) >= self.EMIT_BATCH_SIZE or now - last_emit >= self.EMIT_INTERVAL:
+                if pending:
+                    self.keys_loaded.emit(pending)
+                    pending = []
+                self.progress.emit(keys_seen, total, cursor)
+                last_emit = now
+
+        if pending and not self._cancelled:
+            self.keys_loaded.emit(pending)
+        self.progress.emit(keys_seen, total, cursor)
+        self.load_finished.emit(self._cancelled)
+
+
+class KeyFilterWorker(QThread):
+    """后台线程：在键索引快照上执行子串查询"""
+
+    filter_ready = pyqtSignal(str, object)    # 查询文本, 匹配的键 id 数组
+
+    def __init__(self, snapshot, text: str, parent=None):
+        super().__init__(parent)
+        self.snapshot = snapshot
+        self.text = text
+
+    def run(self):
+        self.filter_ready.emit(self.text, self.snapshot.search(self.text))
+
+
+class KeyspaceWatcher(QThread):
+    """
+    后台线程：订阅 __keyevent@<db>__:* 键事件通知
+
+    短时间内同一个键的多次事件只保留最后一次，合并后按固定间隔批量发出，
+    避免高频写入的数据库把界面线程淹没。
+    """
+
+    keys_changed = pyqtSignal(list, list)     # 新增（或仍存在）的键, 被删除的键
+    watch_failed = pyqtSignal(str)
+
+    # 表示键已不存在的事件
+    REMOVAL_EVENTS = {'del', 'expired', 'evicted', 'rename_from', 'move_from'}
+    FLUSH_INTERVAL = 0.5
+
+    def __init__(self, redis_client, db: int, parent=None):
+        super().__init__(parent)
+        self.redis_client = redis_client
+        self.db = db
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        # 按 bytes 接收，逐条解码：单个非 UTF-8 的键名不会中断订阅
+        pubsub = self.redis_client.create_pubsub(raw=True)
+        if pubsub is None:
+            self.watch_failed.emit("没有可用的Redis连接")
+            return
+        prefix = f"__keyevent@{self.db}__:"
+        pending = {}  # 键 -> 是否存在
+        last_flush = time.monotonic()
+        try:
+            pubsub.psubscribe(prefix + '*')
+            while not self._cancelled:
+                message = pubsub.get_message(timeout=0.1)
+                if message and message['type'] == 'pmessage':
+                    try:
+                        event = message['channel'][len(prefix):].decode('utf-8')
+                        key = message['data'].decode('utf-8')
+                    except (UnicodeDecodeError, AttributeError):
+                        # 键名不是合法 UTF-8，键列表中无法显示，跳过这条事件
+                        key = None
+                    if key is not None:
+                        pending[key] = event not in self.REMOVAL_EVENTS
+                now = time.monotonic()
+                if pending and now - last_flush >= self.FLUSH_INTERVAL:
+                    self._flush(pending)
+                    pending = {}
+                    last_flush = now
+        except Exception as e:
+            if not self._cancelled:
+                self.watch_failed.emit(str(e))
+        finally:
+            try:
+                pubsub.close()
+            except Exception:
+                pass
+
+    def _flush(self, pending):
+        added = [key for key, exists in pending.items() if exists]
+        removed = [key for key, exists in pending.items() if not exists]
+        self.keys_changed.emit(added, removed)
+
+
+class MetadataWorker(QThread):
+    """后台线程：用一个管道获取一批键的类型/TTL/大小"""
+
+    metadata_ready = pyqtSignal(dict)         # 节点 id -> KeyMetadata
+
+    def __init__(self, redis_client, entries, parent=None):
+        super().__init__(parent)
+        self.redis_client = redis_client
+        self.entries = entries  # [(节点 id, 键名)]
+
+    def run(self):
+        metadata = self.redis_client.get_keys_metadata([key for _, key in self.entries])
+        self.metadata_ready.emit({node: metadata[key] for node, key in self.entries if key in metadata})
+
+
+class KeyspaceInfoWorker(QThread):
+    """后台线程：获取 INFO keyspace 中各数据库的键统计"""
+
+    info_ready = pyqtSignal(dict)             # 数据库编号 -> {'keys', 'expires', 'avg_ttl'}
+
+    def __init__(self, redis_client, parent=None):
+        super().__init__(parent)
+        self.redis_client = redis_client
+
+    def run(self):
+        self.info_ready.emit(self.redis_client.get_keyspace_info())
+
+
+class BulkDeleteWorker(QThread):
+    """后台线程：批量删除选中的键，以及按文件夹前缀在服务器端流式删除"""
+
+    keys_deleted = pyqtSignal(list, int)      # 本批删除的键, 累计删除数量
+    delete_finished = pyqtSignal(int, bool)   # 删除数量, 是否被取消
+
+    def __init__(self, redis_client, keys, patterns, pause: float = 0.0, parent=None):
+        super().__init__(parent)
+        self.redis_client = redis_client
+        self.keys = keys
+        self.patterns = patterns
+        self.pause = pause
+        self._cancelled = False
+        self._deleted = 0
+
+    def cancel(self):
+        self._cancelled = True
+
+    def _on_chunk(self, keys, deleted):
+        self.keys_deleted.emit(list(keys), self._deleted + deleted)
+
+    def run(self):
+        should_cancel = lambda: self._cancelled
+        if self.keys:
+            self._deleted += self.redis_client.delete_keys(
+                self.keys, pause=self.pause,
+                progress_callback=self._on_chunk, should_cancel=should_cancel)
+        for pattern in self.patterns:
+            if self._cancelled:
+                break
+            self._deleted += self.redis_client.delete_by_pattern(
+                pattern, pause=self.pause,
+                progress_callback=self._on_chunk, should_cancel=should_cancel)
+        self.delete_finished.emit(self._deleted, self._cancelled)
+
+
+class StringDownloadWorker(QThread):
+    """后台线程：按 GETRANGE 分块把大字符串写入文件对象"""
+
+    progress = pyqtSignal(object, object)       # 已写入字节数, 总字节数
+    download_finished = pyqtSignal(object, bool)  # 写入字节数（失败为 -1）, 是否被取消
+
+    def __init__(self, redis_client, key: str, output, parent=None):
+        super().__init__(parent)
+        self.redis_client = redis_client
+        self.key = key
+        self.output = output
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        written = self.redis_client.stream_string(
+            self.key, self.output,
+            progress_callback=lambda done, total: self.progress.emit(done, total),
+            should_cancel=lambda: self._cancelled)
+        self.download_finished.emit(written, self._cancelled)
+
+
+class BulkWriteWorker(QThread):
+    """后台线程：分块写入集合类型的值并原子替换目标键"""
+
+    progress = pyqtSignal(int, int)           # 已写入元素数, 元素总数
+    write_finished = pyqtSignal(bool, bool)   # 是否成功, 是否被取消
+
+    def __init__(self, redis_client, key: str, key_type: str, items, parent=None):
+        super().__init__(parent)
+        self.redis_client = redis_client
+        self.key = key
+        self.key_type = key_type
+        self.items = items
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        success = self.redis_client.write_collection(
+            self.key, self.key_type, self.items,
+            progress_callback=lambda written, total: self.progress.emit(written, total),
+            should_cancel=lambda: self._cancelled)
+        self.write_finished.emit(success, self._cancelled)
+
+
+class PrefetchWorker(QThread):
+    """
+    后台线程：预取选中键附近的同级键
+
+    先用一个管道获取这些键的元数据，再把不超过 max_value_bytes 的值读入
+    值缓存，累计估算大小超过 byte_budget 时停止。
+    """
+
+    metadata_ready = pyqtSignal(dict)         # 节点 id -> KeyMetadata
+
+    def __init__(self, redis_client, entries, byte_budget: int, max_value_bytes: int, parent=None):
+        super().__init__(parent)
+        self.redis_client = redis_client
+        self.entries = entries  # [(节点 id, 键名)]，按优先级排列
+        self.byte_budget = byte_budget
+        self.max_value_bytes = max_value_bytes
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        client = self.redis_client
+        metadata = client.get_keys_metadata([key for _, key in self.entries])
+        if self._cancelled:
+            return
+        self.metadata_ready.emit({node: metadata[key] for node, key in self.entries if key in metadata})
+
+        used = 0
+        for _, key in self.entries:
+            if self._cancelled or used >= self.byte_budget:
+                break
+            meta = metadata.get(key)
+            if meta is None or not self._worth_fetching(meta):
+                continue
+            if client.get_cached_value(key) is not None:
+                continue
+            version = client.cache_version()
+            if meta.key_type == 'string':
+                value = client.get_value(key)
+                if value is None:
+                    continue
+                entry = CachedValue('string', meta.ttl, value)
+            else:
+                page = client.get_value_page(key, meta.key_type, raw=True)
+                if page is None:
+                    continue
+                entry = CachedValue(meta.key_type, meta.ttl, page.items, page.cursor, page.total)
+            client.cache_value(key, entry, version)
+            used += entry.size
+
+    def _worth_fetching(self, meta) -> bool:
+        """只预取字符串和集合类型，跳过超过大小阈值的值"""
+        if meta.key_type not in ('string', 'hash', 'list', 'set', 'zset'):
+            return False
+        if meta.size is None:
+            return False
+        if meta.size_in_bytes or meta.key_type == 'string':
+            return meta.size <= self.max_value_bytes
+        # 只有元素数量时，集合类型只会读取第一页
+        return True
+
+
+class KeyDetailWorker(QThread):
+    """
+    后台线程：通过一个管道获取选中键的类型、TTL、长度和第一页值
+
+    request_id 随结果一起送回，界面据此丢弃已被更新的请求取代的结果。
+    """
+
+    detail_ready = pyqtSignal(int, str, object)   # 请求编号, 键名, KeyDetail（失败为 None）
+
+    def __init__(self, redis_client, key: str, request_id: int, string_limit: int, parent=None):
+        super().__init__(parent)
+        self.redis_client = redis_client
+        self.key = key
+        self.request_id = request_id
+        self.string_limit = string_limit
+
+    def run(self):
+        detail = self.redis_client.get_key_detail(self.key, string_limit=self.string_limit)
+        self.detail_ready.emit(self.request_id, self.key, detail)
+
+
+class MemoryAnalysisWorker(QThread):
+    """
+    后台线程：SCAN 遍历键空间，批量获取类型、TTL 和 MEMORY USAGE 并按前缀汇总
+
+    每批之间休眠 pause 秒，管道耗时超过 SLOW_PIPELINE_SECONDS 时再额外休眠同样时长，
+    避免分析线上实例时挤占正常流量。统计结果按 EMIT_INTERVAL 节流后以快照形式发出。
+    """
+
+    progress = pyqtSignal(int, int)            # 已分析的键数量, 数据库键总数
+    stats_updated = pyqtSignal(object)         # PrefixStatsSnapshot
+    analysis_finished = pyqtSignal(bool, str)  # 是否被取消, 错误信息（成功为空）
+
+    EMIT_INTERVAL = 0.5
+
+    def __init__(self, redis_client, stats, pattern: str = '*', samples: int = None,
+                 batch_size: int = 500, pause: float = 0.0, parent=None):
+        super().__init__(parent)
+        self.redis_client = redis_client
+        self.stats = stats
+        self.pattern = pattern
+        self.samples = samples
+        self.batch_size = batch_size
+        self.pause = pause
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        client = self.redis_client
+        total = client.get_db_size()
+        analyzed = 0
+        last_emit = time.monotonic()
+        for batch in client.scan_keys(self.pattern, count=self.batch_size):
+            if self._cancelled:
+                break
+            if not batch.keys:
+                continue
+            started = time.monotonic()
+            metadata = client.get_keys_metadata(batch.keys, samples=self.samples)
+            elapsed = time.monotonic() - started
+            for key, meta in metadata.items():
+                if not meta.size_in_bytes:
+                    self.stats_updated.emit(self.stats.snapshot())
+                    self.analysis_finished.emit(False, "服务器不支持 MEMORY USAGE（或没有权限），无法统计内存")
+                    return
+                self.stats.add(key, meta.key_type, meta.size or 0, meta.ttl)
+            analyzed += len(batch.keys)
+
+            now = time.monotonic()
+            if now - last_emit >= self.EMIT_INTERVAL:
+                self.progress.emit(analyzed, total)
+                self.stats_updated.emit(self.stats.snapshot())
+                last_emit = now
+            delay = self.pause + (elapsed if elapsed > SLOW_PIPELINE_SECONDS else 0)
+            if delay > 0:
+                time.sleep(delay)
+
+        self.progress.emit(analyzed, total)
+        self.stats_updated.emit(self.stats.snapshot())
+        self.analysis_finished.emit(self._cancelled, "")
+
+
+class RdbAnalysisWorker(QThread):
+    """
+    后台线程：流式解析 RDB 文件并按前缀汇总，统计结果节流后以快照形式发出
+
+    前 max_tree_keys 个键连同类型/TTL/大小按数据库分批发出，用于构建键树；
+    之后的键只计入统计，内存占用不随文件大小增长。
+    """
+
+    progress = pyqtSignal(object, object)      # 已解析字节数, 文件大小（可能超过 32 位整数）
+    file_info = pyqtSignal(int, dict)          # RDB 版本, 辅助字段
+    stats_updated = pyqtSignal(object)         # PrefixStatsSnapshot
+    keys_parsed = pyqtSignal(int, list)        # 数据库编号, [(键名, KeyMetadata)]
+    analysis_finished = pyqtSignal(bool, str)  # 是否被取消, 错误信息（成功为空）
+
+    EMIT_INTERVAL = 0.5
+    # 每解析多少个键检查一次是否需要发信号/取消
+    CHECK_EVERY = 1000
+
+    def __init__(self, path: str, stats, max_tree_keys: int = 0, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.stats = stats
+        self.max_tree_keys = max_tree_keys
+        self.tree_keys = 0    # 已发出用于键树的键数量
+        self._pending = {}    # 数据库编号 -> 尚未发出的 [(键名, KeyMetadata)]
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        try:
+            with RdbParser(self.path) as parser:
+                self._parse(parser)
+        except (OSError, ValueError, RdbError) as e:
+            self._flush_keys()
+            self.stats_updated.emit(self.stats.snapshot())
+            self.analysis_finished.emit(False, f"解析 RDB 文件失败: {str(e)}")
+            return
+        self._flush_keys()
+        self.stats_updated.emit(self.stats.snapshot())
+        self.analysis_finished.emit(self._cancelled, "")
+
+    def _flush_keys(self):
+        for db, entries in self._pending.items():
+            if entries:
+                self.keys_parsed.emit(db, entries)
+        self._pending = {}
+
+    def _parse(self, parser):
+        stats = self.stats
+        snapshot_ms = None
+        last_emit = time.monotonic()
+        for count, entry in enumerate(parser.entries(), 1):
+            if snapshot_ms is None:
+                # 辅助字段位于所有键之前
+                self.file_info.emit(parser.version, dict(parser.aux))
+                snapshot_ms = parser.snapshot_time_ms()
+            ttl = -1
+            if entry.expire_ms is not None:
+                # 向上取整，快照时仍存活的键不会显示为 0
+                ttl = max(0, -(-(entry.expire_ms - snapshot_ms) // 1000))
+            key = entry.key.decode('utf-8', errors='backslashreplace')
+            stats.add(key, entry.key_type, entry.size, ttl)
+            if self.tree_keys < self.max_tree_keys:
+                self.tree_keys += 1
+                self._pending.setdefault(entry.db, []).append(
+                    (key, KeyMetadata(entry.key_type, ttl, entry.size)))
+            if count % self.CHECK_EVERY:
+                continue
+            if self._cancelled:
+                return
+            now = time.monotonic()
+            if now - last_emit >= self.EMIT_INTERVAL:
+                self.progress.emit(parser.position, parser.size)
+                self._flush_keys()
+                self.stats_updated.emit(stats.snapshot())
+                last_emit = now
+        if snapshot_ms is None:
+            self.file_info.emit(parser.version, dict(parser.aux))
+        self.progress.emit(parser.size, parser.size)
+
+
+class KeyExportWorker(QThread):
+    """
+    后台线程：把键导出为 DumpWriter 格式的压缩文件
+
+    按 SCAN 批次（或选中的键）切块，交给 THREADS 个线程并行执行 DUMP + PTTL 管道
+    （各自从共享连接池取连接），结果按完成顺序写入文件。同时在途的批次数有上限，
+    内存中最多只保留这几批数据。
+    """
+
+    progress = pyqtSignal(int, int, object, float)     # 已导出键数, 失败键数, 已写入字节数, 进度（未知为 -1）
+    transfer_finished = pyqtSignal(int, int, list, bool, str)  # 成功数量, 失败数量, 失败的 (键, 原因), 是否取消, 错误信息
+
+    THREADS = 4
+    BATCH_SIZE = 500
+    EMIT_INTERVAL = 0.2
+    # 最多保留的失败记录数量
+    MAX_FAILURES = 1000
+
+    def __init__(self, redis_client, path: str, keys, patterns, estimated: int = 0, parent=None):
+        super().__init__(parent)
+        self.redis_client = redis_client
+        self.path = path
+        self.keys = keys
+        self.patterns = patterns
+        self.estimated = estimated  # 预计的键数量，用于显示进度，0 表示未知
+        self._cancelled = False
+        self.failures = []
+        self.failed = 0
+
+    def cancel(self):
+        self._cancelled = True
+
+    def _batches(self):
+        for i in range(0, len(self.keys), self.BATCH_SIZE):
+            yield self.keys[i:i + self.BATCH_SIZE]
+        for pattern in self.patterns:
+            for batch in self.redis_client.scan_keys(pattern, count=self.BATCH_SIZE, raw=True):
+                if batch.keys:
+                    yield batch.keys
+
+    def run(self):
+        try:
+            writer = DumpWriter(self.path)
+        except OSError as e:
+            self.transfer_finished.emit(0, 0, [], False, f"无法创建文件: {str(e)}")
+            return
+        error = ""
+        self._last_emit = time.monotonic()
+        try:
+            with ThreadPoolExecutor(max_workers=self.THREADS) as pool:
+                pending = set()
+                for batch in self._batches():
+                    if self._cancelled:
+                        break
+                    pending.add(pool.submit(self.redis_client.dump_keys, batch))
+                    if len(pending) >= self.THREADS * 2:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        self._write(writer, done)
+                self._write(writer, pending)
+        except OSError as e:
+            error = f"写入文件失败: {str(e)}"
+        finally:
+            complete = not error and not self._cancelled
+            writer.close(complete=complete)
+            if not complete:
+                # 不完整的文件无法导入，直接删除
+                try:
+                    os.remove(self.path)
+                except OSError:
+                    pass
+        self.progress.emit(writer.count, self.failed, writer.bytes_written, 1.0)
+        self.transfer_finished.emit(writer.count, self.failed, self.failures, self._cancelled, error)
+
+    def _write(self, writer, futures):
+        for future in futures:
+            records, failures = future.result()
+            for key, pttl, payload in records:
+                writer.write(key if isinstance(key, bytes) else key.encode('utf-8'), pttl, payload)
+            self.failed += len(failures)
+            self.failures.extend(failures[:self.MAX_FAILURES - len(self.failures)])
+        now = time.monotonic()
+        if now - self._last_emit >= self.EMIT_INTERVAL:
+            fraction = min(writer.count / self.estimated, 1.0) if self.estimated else -1.0
+            self.progress.emit(writer.count, self.failed, writer.bytes_written, fraction)
+            self._last_emit = now
+
+
+class KeyImportWorker(QThread):
+    """后台线程：流式读取导出文件，按批用 RESTORE 管道写入当前数据库"""
+
+    progress = pyqtSignal(int, int, object, float)     # 已导入键数, 失败键数, 已读取字节数, 进度
+    transfer_finished = pyqtSignal(int, int, list, bool, str)  # 成功数量, 失败数量, 失败的 (键, 原因), 是否取消, 错误信息
+
+    BATCH_SIZE = 500
+    # 单个管道携带的 DUMP 数据超过该字节数时提前发送
+    BATCH_BYTES = 8 * 1024 * 1024
+    EMIT_INTERVAL = 0.2
+    # 最多保留的失败记录数量
+    MAX_FAILURES = 1000
+
+    def __init__(self, redis_client, path: str, replace: bool = False, parent=None):
+        super().__init__(parent)
+        self.redis_client = redis_client
+        self.path = path
+        self.replace = replace
+        self._cancelled = False
+        self.restored = 0
+        self.failures = []
+        self.failed = 0
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        error = ""
+        try:
+            with DumpReader(self.path) as reader:
+                self._import(reader)
+        except (OSError, DumpFormatError) as e:
+            error = str(e)
+        self.transfer_finished.emit(self.restored, self.failed, self.failures, self._cancelled, error)
+
+    def _import(self, reader):
+        batch = []
+        batch_bytes = 0
+        read_bytes = 0
+        last_emit = time.monotonic()
+        for record in reader.records():
+            batch.append(record)
+            batch_bytes += len(record[2])
+            if len(batch) < self.BATCH_SIZE and batch_bytes < self.BATCH_BYTES:
+                continue
+            if self._cancelled:
+                return
+            self._restore(batch)
+            read_bytes += batch_bytes
+            batch = []
+            batch_bytes = 0
+            now = time.monotonic()
+            if now - last_emit >= self.EMIT_INTERVAL:
+                self.progress.emit(self.restored, self.failed, read_bytes,
+                                   reader.position / reader.size if reader.size else -1.0)
+                last_emit = now
+        if batch and not self._cancelled:
+            self._restore(batch)
+            read_bytes += batch_bytes
+        self.progress.emit(self.restored, self.failed, read_bytes, 1.0)
+
+    def _restore(self, batch):
+        restored, failures = self.redis_client.restore_keys(batch, self.replace)
+        self.restored += restored
+        self.failed += len(failures)
+        self.failures.extend(failures[:self.MAX_FAILURES - len(self.failures)])
+
+
+class BulkLoadWorker(QThread):
+    """后台线程：用 BulkLoader 把 JSON Lines / CSV 文件按映射批量写入当前数据库"""
+
+    progress = pyqtSignal(int, int, int, float)    # 已读取行数, 已写入（试运行为有效）记录数, 错误行数, 进度
+    load_finished = pyqtSignal(object, bool, str)  # LoadReport（失败为 None）, 是否被取消, 错误信息
+
+    EMIT_INTERVAL = 0.2
+
+    def __init__(self, loader, path: str, file_format: str = None, parent=None):
+        super().__init__(parent)
+        self.loader = loader
+        self.path = path
+        self.file_format = file_format
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        try:
+            with RowReader(self.path, self.file_format) as reader:
+                report = self.loader.run(reader, self._emit_progress,
+                                         lambda: self._cancelled, self.EMIT_INTERVAL)
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            self.load_finished.emit(None, self._cancelled, f"读取文件失败: {str(e)}")
+            return
+        self.progress.emit(report.rows, report.written, report.error_count, 1.0)
+        self.load_finished.emit(report, self._cancelled, "")
+
+    def _emit_progress(self, report, fraction):
+        self.progress.emit(report.rows, report.written, report.error_count, fraction)
+
+
+class InfoPoller(QThread):
+    """
+    后台线程：按固定间隔对一个服务器执行 INFO all（监控面板）
+
+    每个服务器使用独立的 RedisClient，不占用浏览数据用的连接。采样失败时
+    逐次加倍等待时间（最长 MAX_BACKOFF 秒），恢复后回到正常间隔。
+    """
+
+    info_ready = pyqtSignal(float, dict)      # 采样时间（time.monotonic()）, INFO 结果
+    poll_failed = pyqtSignal(str)             # 错误信息
+
+    MAX_BACKOFF = 30.0
+    # 等待期间检查是否被取消的粒度（毫秒）
+    SLEEP_STEP_MS = 100
+
+    def __init__(self, redis_client, interval: float = 1.0, parent=None):
+        super().__init__(parent)
+        self.redis_client = redis_client
+        self.interval = interval  # 可在界面中随时修改
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        delay = self.interval
+        while not self._cancelled:
+            started = time.monotonic()
+            info = self.redis_client.get_server_info()
+            if info is not None:
+                self.info_ready.emit(started, info)
+                delay = self.interval
+            else:
+                self.poll_failed.emit("无法获取 INFO")
+                delay = min(max(delay, self.interval) * 2, self.MAX_BACKOFF)
+            deadline = started + delay
+            while not self._cancelled:
+                remaining_ms = int((deadline - time.monotonic()) * 1000)
+                if remaining_ms <= 0:
+                    break
+                self.msleep(min(remaining_ms, self.SLEEP_STEP_MS))
+
+
+class SlowlogWorker(QThread):
+    """后台线程：增量读取 SLOWLOG，并读取 LATENCY LATEST/HISTORY"""
+
+    slowlog_ready = pyqtSignal(object, object)  # 新的 SlowlogEntry 列表, LatencyEvent 列表（失败或未请求为 None）
+
+    def __init__(self, redis_client, last_id=None, include_latency: bool = True, parent=None):
+        super().__init__(parent)
+        self.redis_client = redis_client
+        self.last_id = last_id
+        self.include_latency = include_latency
+
+    def run(self):
+        entries = self.redis_client.get_slowlog_since(self.last_id)
+        latency = self.redis_client.get_latency_events() if self.include_latency else None
+        self.slowlog_ready.emit(entries, latency)
@@ -1,12 +1,165 @@
 import redis
+from redis.client import NEVER_DECODE, Pipeline
+import copy
 import logging
-from typing import Union, Dict, List, Any
-import base64
+from dataclasses import dataclass
+from typing import Union, Dict, List, Any, Iterator, Optional, Iterable, Callable, Tuple
+import time
+import uuid
+
+from src.utils.value_cache import ValueCache, CachedValue
+from src.utils.decoding import decode_item, decode_batch, decode_pairs, decode_mapping
+
+# SCAN 每次迭代建议返回的键数量
+DEFAULT_SCAN_COUNT = 1000
+# 无法读取 databases 配置时假定的数据库数量（Redis 默认值）
+DEFAULT_DATABASES = 16
+# 各类型对应的长度命令
+LENGTH_COMMANDS = {
+    'string': 'STRLEN',
+    'hash': 'HLEN',
+    'list': 'LLEN',
+    'set': 'SCARD',
+    'zset': 'ZCARD',
+    'stream': 'XLEN',
+}
+# 批量删除：每个管道处理的键数量、单条 UNLINK 携带的键数量
+DELETE_CHUNK_SIZE = 1000
+UNLINK_BATCH_SIZE = 100
+# 单个管道耗时超过该值（秒）时认为服务器繁忙，额外休眠同样时长
+SLOW_PIPELINE_SECONDS = 0.05
+# 集合类型分页加载时每页的元素数量，不超过该数量的值一次性加载
+VALUE_PAGE_SIZE = 1000
+# 大字符串按 GETRANGE 分块读取时每块的字节数
+STRING_CHUNK_SIZE = 4 * 1024 * 1024
+# 连接池默认参数：每个 (服务器, 数据库) 的最大连接数、取连接的等待秒数、健康检查间隔（秒）
+DEFAULT_MAX_CONNECTIONS = 16
+POOL_TIMEOUT = 20
+DEFAULT_HEALTH_CHECK_INTERVAL = 30
+# 批量写入集合：单条命令携带的元素数量、每个管道包含的命令数量
+WRITE_CHUNK_SIZE = 1000
+WRITE_PIPELINE_COMMANDS = 10
+# 批量写入时临时键的过期时间（毫秒），每个管道都会续期；程序中途退出时临时键自动清除
+WRITE_TEMP_KEY_TTL_MS = 10 * 60 * 1000
+# glob 模式中的特殊字符
+GLOB_SPECIAL_CHARS = '*?[]\\'
+# 增量读取 SLOWLOG：首次之后每次请求的条数、单次最多读取的条数
+SLOWLOG_FETCH_SIZE = 128
+SLOWLOG_FETCH_MAX = 10000
+
+
+def escape_pattern(text: str) -> str:
+    """转义 glob 特殊字符，使文本按字面匹配"""
+    return ''.join('\\' + ch if ch in GLOB_SPECIAL_CHARS else ch for ch in text)
+
+
+def to_match_pattern(text: str) -> str:
+    """把搜索框文本转换为 SCAN MATCH 模式：含通配符时原样使用，否则按"包含"匹配"""
+    if not text:
+        return '*'
+    if any(ch in text for ch in '*?['):
+        return text
+    return f"*{escape_pattern(text)}*"
+
+
+@dataclass
+class ScanBatch:
+    """SCAN 迭代返回的一批键及进度信息"""
+    keys: List[str]
+    cursor: int      # 下一次迭代使用的游标，0 表示遍历结束
+    keys_seen: int   # 截至本批累计返回的键数量（可能包含少量重复）
+
+    @property
+    def finished(self) -> bool:
+        return self.cursor == 0
+
+
+@dataclass
+class KeyMetadata:
+    """键的类型、TTL 和大致大小"""
+    key_type: str
+    ttl: int                 # 剩余秒数，-1 表示永不过期，-2 表示键不存在
+    size: Optional[int]      # MEMORY USAGE 字节数，或不支持时的元素数量/字符串长度
+    size_in_bytes: bool = True
+
+
+@dataclass
+class ValuePage:
+    """集合类型值的一页数据"""
+    items: Any      # hash 为 dict，list/set 为 list，zset 为 [(member, score)]
+    cursor: int     # 下一页的游标（HSCAN/SSCAN）或偏移量（LRANGE/ZRANGE），0 表示已加载完
+    total: int      # 元素总数
+
+    @property
+    def finished(self) -> bool:
+        return self.cursor == 0
+
+
+@dataclass
+class KeyDetail:
+    """一次往返获取的键详情（类型、TTL、长度和第一页值）"""
+    key_type: str            # 'none' 表示键不存在
+    ttl: int                 # 剩余秒数，-1 表示永不过期
+    length: int              # 字符串字节数或集合元素数量
+    value: Any               # 字符串为解码后的文本，集合类型为未解码的第一页
+    cursor: int = 0          # 集合类型下一页的游标，0 表示已加载完
+    truncated: bool = False  # 字符串超过长度限制，value 只是开头部分的原始字节
+
+    def cache_entry(self) -> CachedValue:
+        return CachedValue(self.key_type, self.ttl, self.value, self.cursor, self.length)
+
+
+@dataclass
+class SlowlogEntry:
+    """一条 SLOWLOG 记录（参数可能已被服务器截断）"""
+    id: int
+    timestamp: int       # Unix 时间戳（秒）
+    duration: int        # 执行耗时（微秒）
+    args: List[str]
+    client: str = ''
+    client_name: str = ''
+
+
+@dataclass
+class LatencyEvent:
+    """LATENCY LATEST 中的一个事件及其 LATENCY HISTORY"""
+    name: str
+    timestamp: int       # 最近一次超过阈值的时间
+    latest: int          # 最近一次的延迟（毫秒）
+    max_latency: int     # 记录中的最大延迟（毫秒）
+    history: List[Tuple[int, int]]  # [(时间戳, 延迟毫秒)]
+
+
+class RawPipeline(Pipeline):
+    """不解码响应的管道（不适用于 MULTI/EXEC，EXEC 的结果仍按连接设置解码）"""
+
+    def execute_command(self, *args, **options):
+        options.setdefault(NEVER_DECODE, True)
+        return super().execute_command(*args, **options)
+
+
+class RawRedis(redis.Redis):
+    """
+    与文本客户端共享连接池、但返回原始字节的客户端
+
+    连接池按 decode_responses=True 创建，这里为每条命令加上 NEVER_DECODE，
+    读取响应时跳过解码。
+    """
+
+    def execute_command(self, *args, **options):
+        options.setdefault(NEVER_DECODE, True)
+        return super().execute_command(*args, **options)
+
+    def pipeline(self, transaction=True, shard_hint=None):
+        return RawPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
 
 class RedisClient:
     """Redis客户端连接工具类"""
     
-    def __init__(self):
+    def __init__(self, max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 health_check_interval: int = DEFAULT_HEALTH_CHECK_INTERVAL,
+                 socket_keepalive: bool = True):
         # 配置日志
         logging.basicConfig(
             level=logging.INFO,
@@ -15,6 +168,19 @@ class RedisClient:
         self.logger = logging.getLogger(__name__)
         self.client = None
         self.binary_client = None
+        self.connection_info = {}  # 当前连接参数（host/port/password/db）
+        self._scan_type_supported = None  # 服务器是否支持 SCAN ... TYPE（Redis >= 6.0）
+        self._memory_usage_supported = None  # 服务器是否允许 MEMORY USAGE
+        self._unlink_supported = None  # 服务器是否支持 UNLINK（Redis >= 4.0）
+        self.value_cache = ValueCache()  # 最近查看过的键值，经本客户端写入的键会失效
+        # 每个 (host, port, password, db) 一个连接池，文本客户端和二进制客户端共用，
+        # 后台线程也从同一个池中取空闲连接
+        self._pools: Dict[tuple, redis.ConnectionPool] = {}
+        self.pool_options = {
+            'max_connections': max_connections,
+            'health_check_interval': health_check_interval,
+            'socket_keepalive': socket_keepalive,
+        }
     
     def connect(self, host: str = 'localhost', 
                 port: int = 6379,
@@ -25,64 +191,369 @@ class RedisClient:
         """
         try:
             # 如果已经存在连接，先关闭
-            if self.client:
-                self.client.close()
-            
-            # 创建两个客户端连接
-            # 一个用于二进制数据（不自动解码）
-            self.binary_client = redis.Redis(
-                host=host,
-                port=port,
-                password=password if password else None,
-                db=db,
-                decode_responses=False,  # 不自动解码
-                socket_timeout=5,
-                socket_connect_timeout=5
-            )
+            self.close_pools()
             
-            # 一个用于文本数据（自动解码）
-            self.client = redis.Redis(
-                host=host,
-                port=port,
-                password=password if password else None,
-                db=db,
-                decode_responses=True,  # 自动解码
-                socket_timeout=5,
-                socket_connect_timeout=5
-            )
+            self.binary_client, self.client = self._create_clients(host, port, password, db)
             
             # 测试连接
             self.client.ping()
+            self.connection_info = {'host': host, 'port': port, 'password': password, 'db': db}
+            self._scan_type_supported = None
+            self._memory_usage_supported = None
+            self._unlink_supported = None
             self.logger.info(f"Successfully connected to Redis at {host}:{port}")
             return True
         except Exception as e:
             self.logger.error(f"Failed to connect to Redis: {str(e)}")
+            self.close_pools()
             self.client = None
             self.binary_client = None
             return False
 
+    def _get_pool(self, host: str, port: int, password: str, db: int) -> redis.ConnectionPool:
+        """获取（必要时创建）指定数据库的连接池"""
+        pool_key = (host, port, password, db)
+        pool = self._pools.get(pool_key)
+        if pool is None:
+            # 连接数达到上限时等待空闲连接，而不是直接报错
+            pool = redis.BlockingConnectionPool(
+                host=host,
+                port=port,
+                password=password if password else None,
+                db=db,
+                decode_responses=True,
+                socket_timeout=5,
+                socket_connect_timeout=5,
+                timeout=POOL_TIMEOUT,
+                **self.pool_options
+            )
+            self._pools[pool_key] = pool
+        return pool
+
+    def _create_clients(self, host: str, port: int, password: str, db: int):
+        """创建共用同一个连接池的二进制客户端和文本客户端"""
+        pool = self._get_pool(host, port, password, db)
+        # 一个用于二进制数据（不自动解码），一个用于文本数据（自动解码）
+        return RawRedis(connection_pool=pool), redis.Redis(connection_pool=pool)
+
+    def close_pools(self):
+        """断开所有缓存的连接池"""
+        for pool in self._pools.values():
+            try:
+                pool.disconnect()
+            except Exception as e:
+                self.logger.warning(f"Error closing connection pool: {str(e)}")
+        self._pools.clear()
+
     def select_db(self, db: int) -> bool:
         """选择数据库"""
         try:
             if not self.client:
                 self.logger.error("No Redis connection available")
                 return False
-            self.client.select(db)
+            # SELECT 只会作用于连接池中的某一个连接，后台线程取到的其他连接仍停留在旧库，
+            # 因此切换到该库自己的连接池（已缓存时无需重新建立连接）
+            info = dict(self.connection_info, db=db)
+            is_new = (info['host'], info['port'], info['password'], db) not in self._pools
+            binary_client, client = self._create_clients(**info)
+            if is_new:
+                client.ping()
+            self.binary_client, self.client = binary_client, client
+            self.connection_info = info
             return True
         except Exception as e:
             self.logger.error(f"Error selecting database {db}: {str(e)}")
             return False
 
+    def snapshot(self) -> 'RedisClient':
+        """
+        返回固定在当前服务器和数据库上的客户端副本，供后台任务在启动时获取
+
+        副本与本客户端共用连接池和值缓存；之后本客户端 select_db/connect 只替换自己的
+        client 属性，不会影响副本，任务中途切换数据库不会把读写转移到新库。
+        """
+        clone = copy.copy(self)
+        clone.connection_info = dict(self.connection_info)
+        return clone
+
+    def _cache_key(self, key: str):
+        info = self.connection_info
+        return (info.get('host'), info.get('port'), info.get('db'), key)
+
+    def get_cached_value(self, key: str, max_age: float = None) -> Optional[CachedValue]:
+        """读取键值缓存"""
+        return self.value_cache.get(self._cache_key(key), max_age)
+
+    def cache_version(self) -> int:
+        """值缓存的版本号，读取值之前获取并传给 cache_value"""
+        return self.value_cache.version()
+
+    def cache_value(self, key: str, entry: CachedValue, version: int = None):
+        """写入键值缓存；读取后键已被失效（修改）时不写入"""
+        self.value_cache.put(self._cache_key(key), entry, version)
+
+    def invalidate_cached(self, keys: Iterable[str]):
+        """
+        使键值缓存失效
+
+        写操作在执行前后各调用一次：执行前删除缓存，执行后再递增版本号，
+        写入过程中开始的读取不会把旧值写回缓存。
+        """
+        for key in keys:
+            self.value_cache.invalidate(self._cache_key(key))
+
+    def _invalidate_db(self, all_dbs: bool = False):
+        host, port, db, _ = self._cache_key(None)
+        self.value_cache.invalidate_where(
+            lambda k: k[0] == host and k[1] == port and (all_dbs or k[2] == db))
+
     def get_all_keys(self, pattern: str = '*') -> List[str]:
-        """获取所有键"""
+        """获取所有键（基于 SCAN，不会阻塞服务器）"""
+        keys = []
+        for batch in self.scan_keys(pattern):
+            keys.extend(batch.keys)
+        # SCAN 可能返回重复的键，去重并保持顺序
+        return list(dict.fromkeys(keys))
+
+    def scan_keys(self, pattern: str = '*',
+                  count: int = DEFAULT_SCAN_COUNT,
+                  key_type: str = None,
+                  cursor: int = 0,
+                  raw: bool = False) -> Iterator[ScanBatch]:
+        """
+        使用 SCAN 游标分批遍历键
+
+        :param pattern: MATCH 匹配模式
+        :param count: 每次迭代的 COUNT 提示值
+        :param key_type: 只返回指定类型的键（服务器不支持 TYPE 过滤时在客户端过滤）
+        :param cursor: 起始游标，可传入上次中断时 ScanBatch.cursor 继续遍历
+        :param raw: 返回未解码的键名（bytes），键名不是合法 UTF-8 时也能遍历
+        :return: 逐批产出 ScanBatch，最后一批的 cursor 为 0
+        """
+        if not self.client:
+            self.logger.error("No Redis connection available")
+            return
+
+        scanner = self.binary_client if raw else self.client
+        server_filter = bool(key_type) and self.supports_scan_type()
+        keys_seen = 0
+        while True:
+            try:
+                if server_filter:
+                    cursor, keys = scanner.scan(cursor=cursor, match=pattern,
+                                                count=count, _type=key_type)
+                else:
+                    cursor, keys = scanner.scan(cursor=cursor, match=pattern, count=count)
+                    if key_type and keys:
+                        keys = self._filter_keys_by_type(keys, key_type)
+            except Exception as e:
+                self.logger.error(f"Error scanning keys at cursor {cursor}: {str(e)}")
+                return
+
+            keys_seen += len(keys)
+            yield ScanBatch(keys=keys, cursor=int(cursor), keys_seen=keys_seen)
+            if cursor == 0:
+                break
+
+    def supports_scan_type(self) -> bool:
+        """检测服务器是否支持 SCAN 的 TYPE 选项"""
+        if self._scan_type_supported is None:
+            try:
+                version = self.client.info('server').get('redis_version', '0')
+                major = int(str(version).split('.')[0])
+                self._scan_type_supported = major >= 6
+            except Exception as e:
+                self.logger.warning(f"Unable to detect server version: {str(e)}")
+                self._scan_type_supported = False
+        return self._scan_type_supported
+
+    def _filter_keys_by_type(self, keys: List[str], key_type: str) -> List[str]:
+        """通过管道批量查询 TYPE，在客户端过滤键"""
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipe.type(key)
+        types = pipe.execute()
+        return [key for key, t in zip(keys, types) if t == key_type]
+
+    def get_db_size(self) -> int:
+        """获取当前数据库的键数量"""
         try:
             if not self.client:
-                self.logger.error("No Redis connection available")
+                return 0
+            return self.client.dbsize()
+        except Exception as e:
+            self.logger.error(f"Error getting database size: {str(e)}")
+            return 0
+
+    def get_keyspace_info(self) -> Dict[int, Dict[str, int]]:
+        """通过一次 INFO keyspace 获取各数据库的 keys/expires/avg_ttl"""
+        try:
+            if not self.client:
+                return {}
+            result = {}
+            for name, stats in self.client.info('keyspace').items():
+                if name.startswith('db') and isinstance(stats, dict):
+                    result[int(name[2:])] = {
+                        'keys': int(stats.get('keys', 0)),
+                        'expires': int(stats.get('expires', 0)),
+                        'avg_ttl': int(stats.get('avg_ttl', 0)),
+                    }
+            return result
+        except Exception as e:
+            self.logger.error(f"Error getting keyspace info: {str(e)}")
+            return {}
+
+    def get_server_info(self) -> Optional[Dict[str, Any]]:
+        """一次 INFO all 获取所有分区的统计信息（监控面板采样），失败返回 None"""
+        try:
+            if not self.client:
+                return None
+            return self.client.info('all')
+        except Exception as e:
+            self.logger.error(f"Error getting server info: {str(e)}")
+            return None
+
+    def get_slowlog_since(self, last_id: Optional[int] = None) -> Optional[List[SlowlogEntry]]:
+        """
+        增量读取 SLOWLOG：只返回 ID 大于 last_id 的记录（按时间从旧到新）
+
+        SLOWLOG GET 从最新的记录开始返回，请求的条数内全是新记录时加大条数重新请求，
+        直到遇到已读过的记录（或达到 SLOWLOG_FETCH_MAX）。last_id 为 None 时读取全部。
+        最新记录的 ID 小于 last_id 说明服务器已重启，此时同样读取全部。
+
+        :return: 失败返回 None
+        """
+        try:
+            if not self.binary_client:
+                return None
+            count = SLOWLOG_FETCH_MAX if last_id is None else SLOWLOG_FETCH_SIZE
+            while True:
+                raw = self.binary_client.execute_command('SLOWLOG', 'GET', count)
+                entries = [self._parse_slowlog_entry(item) for item in raw]
+                if last_id is not None and entries and entries[0].id < last_id:
+                    last_id = None
+                new = [entry for entry in entries if last_id is None or entry.id > last_id]
+                if len(raw) < count or len(new) < len(entries) or count >= SLOWLOG_FETCH_MAX:
+                    break
+                count = min(count * 4, SLOWLOG_FETCH_MAX)
+            new.reverse()
+            return new
+        except Exception as e:
+            self.logger.error(f"Error reading slowlog: {str(e)}")
+            return None
+
+    @staticmethod
+    def _parse_slowlog_entry(item) -> SlowlogEntry:
+        def text(value):
+            return value.decode('utf-8', errors='backslashreplace') if isinstance(value, bytes) else str(value)
+
+        # Redis 4.0 起每条记录带有客户端地址和名称
+        client = text(item[4]) if len(item) > 4 else ''
+        client_name = text(item[5]) if len(item) > 5 else ''
+        return SlowlogEntry(int(item[0]), int(item[1]), int(item[2]),
+                            [text(arg) for arg in item[3]], client, client_name)
+
+    def get_latency_events(self) -> Optional[List[LatencyEvent]]:
+        """LATENCY LATEST 及各事件的 LATENCY HISTORY（两次往返），失败返回 None"""
+        try:
+            if not self.client:
+                return None
+            latest = self.client.execute_command('LATENCY', 'LATEST')
+            if not latest:
                 return []
-            return [key for key in self.client.keys(pattern)]
+            pipe = self.client.pipeline(transaction=False)
+            for item in latest:
+                pipe.execute_command('LATENCY', 'HISTORY', item[0])
+            histories = pipe.execute(raise_on_error=False)
+            events = []
+            for item, history in zip(latest, histories):
+                if isinstance(history, Exception):
+                    history = []
+                events.append(LatencyEvent(str(item[0]), int(item[1]), int(item[2]), int(item[3]),
+                                           [(int(ts), int(ms)) for ts, ms in history]))
+            return events
+        except Exception as e:
+            self.logger.error(f"Error reading latency events: {str(e)}")
+            return None
+
+    def get_database_count(self) -> int:
+        """通过 CONFIG GET databases 获取数据库数量，失败时根据 INFO keyspace 推断"""
+        try:
+            if not self.client:
+                return 0
+            value = self.client.config_get('databases').get('databases')
+            if value:
+                return int(value)
+        except Exception as e:
+            self.logger.warning(f"CONFIG GET databases failed, falling back to INFO keyspace: {str(e)}")
+        keyspace = self.get_keyspace_info()
+        return max(DEFAULT_DATABASES, max(keyspace, default=-1) + 1)
+
+    def get_keys_metadata(self, keys: List[str], samples: int = None) -> Dict[str, KeyMetadata]:
+        """
+        通过一个管道批量获取多个键的类型、TTL 和大小
+
+        优先使用 MEMORY USAGE 估算字节数；服务器不支持（或无权限）时
+        再用一个管道按类型查询 STRLEN/HLEN/LLEN/SCARD/ZCARD 等长度。
+
+        :param samples: MEMORY USAGE 的 SAMPLES 参数（集合类型抽样的元素数量，
+                        0 表示全部），None 时使用服务器默认值
+        """
+        try:
+            if not self.client or not keys:
+                return {}
+            use_memory = self._memory_usage_supported is not False
+            pipe = self.client.pipeline(transaction=False)
+            for key in keys:
+                pipe.type(key)
+                pipe.pttl(key)
+                if use_memory:
+                    pipe.memory_usage(key, samples=samples)
+            results = pipe.execute(raise_on_error=False)
+
+            step = 3 if use_memory else 2
+            metadata = {}
+            need_length = []
+            for i, key in enumerate(keys):
+                key_type, pttl = results[i * step], results[i * step + 1]
+                if isinstance(key_type, Exception) or key_type == 'none':
+                    continue
+                # 向上取整，剩余不足 1 秒的键不显示为 0（永不过期之外的 0 会被误读）
+                ttl = -(-pttl // 1000) if isinstance(pttl, int) and pttl > 0 else pttl
+                size = results[i * step + 2] if use_memory else None
+                if isinstance(size, Exception):
+                    if self._memory_usage_supported is None:
+                        self.logger.warning(f"MEMORY USAGE unavailable, falling back to lengths: {size}")
+                    self._memory_usage_supported = False
+                    size = None
+                elif use_memory:
+                    self._memory_usage_supported = True
+                metadata[key] = KeyMetadata(key_type, ttl if isinstance(ttl, int) else -1, size)
+                if size is None:
+                    need_length.append(key)
+
+            if need_length:
+                self._fill_lengths(need_length, metadata)
+            return metadata
         except Exception as e:
-            self.logger.error(f"Error getting keys: {str(e)}")
-            return []
+            self.logger.error(f"Error getting metadata for {len(keys)} keys: {str(e)}")
+            return {}
+
+    def _fill_lengths(self, keys: List[str], metadata: Dict[str, KeyMetadata]):
+        """按类型查询元素数量/字符串长度作为大小"""
+        pipe = self.client.pipeline(transaction=False)
+        queried = []
+        for key in keys:
+            command = LENGTH_COMMANDS.get(metadata[key].key_type)
+            if command:
+                pipe.execute_command(command, key)
+                queried.append(key)
+        if not queried:
+            return
+        for key, length in zip(queried, pipe.execute(raise_on_error=False)):
+            if isinstance(length, int):
+                metadata[key].size = length
+                metadata[key].size_in_bytes = False
 
     def get_string(self, key: str) -> str:
         """获取字符串值"""
@@ -95,18 +566,71 @@ class RedisClient:
             binary_value = self.binary_client.get(key)
             if binary_value is None:
                 return None
-                
-            try:
-                # 尝试 UTF-8 解码
-                return binary_value.decode('utf-8')
-            except UnicodeDecodeError:
-                # 如果解码失败，返回 Base64 编码的字符串
-                return f"[Binary Data (Base64)]: {base64.b64encode(binary_value).decode('ascii')}"
+            # 尝试 UTF-8 解码，失败时返回 Base64 编码的字符串
+            return decode_item(binary_value)
                 
         except Exception as e:
             self.logger.error(f"Error getting key {key}: {str(e)}")
             return None
 
+    def get_string_length(self, key: str) -> int:
+        """获取字符串值的字节数（STRLEN），失败时返回 -1"""
+        try:
+            if not self.client:
+                self.logger.error("No Redis connection available")
+                return -1
+            return int(self.client.strlen(key))
+        except Exception as e:
+            self.logger.error(f"Error getting length of key {key}: {str(e)}")
+            return -1
+
+    def get_string_range(self, key: str, start: int, end: int) -> Optional[bytes]:
+        """读取字符串值 [start, end] 区间的原始字节（GETRANGE）"""
+        try:
+            if not self.binary_client:
+                self.logger.error("No Redis connection available")
+                return None
+            return self.binary_client.getrange(key, start, end)
+        except Exception as e:
+            self.logger.error(f"Error reading range of key {key}: {str(e)}")
+            return None
+
+    def stream_string(self, key: str, output,
+                      chunk_size: int = STRING_CHUNK_SIZE,
+                      progress_callback: Callable[[int, int], None] = None,
+                      should_cancel: Callable[[], bool] = None) -> int:
+        """
+        按 GETRANGE 分块把字符串值写入文件对象，内存中最多只保留一块
+
+        读取过程中值被其他客户端修改时得到的内容可能不一致。
+
+        :param output: 可写的二进制文件对象
+        :param progress_callback: 每块写入后回调 (已写入字节数, 总字节数)
+        :param should_cancel: 返回 True 时在下一块开始前停止
+        :return: 写入的字节数，失败时返回 -1
+        """
+        try:
+            if not self.binary_client:
+                self.logger.error("No Redis connection available")
+                return -1
+            total = self.binary_client.strlen(key)
+            written = 0
+            while written < total:
+                if should_cancel and should_cancel():
+                    break
+                chunk = self.binary_client.getrange(key, written, written + chunk_size - 1)
+                if not chunk:
+                    # 值在读取过程中被截短或删除
+                    break
+                output.write(chunk)
+                written += len(chunk)
+                if progress_callback:
+                    progress_callback(written, total)
+            return written
+        except Exception as e:
+            self.logger.error(f"Error streaming key {key}: {str(e)}")
+            return -1
+
     def get_hash_field(self, key: str, field: str) -> str:
         """获取哈希字段值"""
         try:
@@ -116,11 +640,7 @@ class RedisClient:
             binary_value = self.binary_client.hget(key, field)
             if binary_value is None:
                 return None
-                
-            try:
-                return binary_value.decode('utf-8')
-            except UnicodeDecodeError:
-                return f"[Binary Data (Base64)]: {base64.b64encode(binary_value).decode('ascii')}"
+            return decode_item(binary_value)
         except Exception as e:
             self.logger.error(f"Error getting hash field {field} for key {key}: {str(e)}")
             return None
@@ -138,36 +658,8 @@ class RedisClient:
                 
             if key_type == 'string':
                 return self.get_string(key)
-            elif key_type == 'hash':
-                # 获取所有哈希字段
-                binary_hash = self.binary_client.hgetall(key)
-                result = {}
-                for field, value in binary_hash.items():
-                    try:
-                        field_str = field.decode('utf-8')
-                        try:
-                            value_str = value.decode('utf-8')
-                        except UnicodeDecodeError:
-                            value_str = f"[Binary Data (Base64)]: {base64.b64encode(value).decode('ascii')}"
-                        result[field_str] = value_str
-                    except UnicodeDecodeError:
-                        # 如果字段名也无法解码，使用其Base64编码
-                        field_str = f"[Binary Field (Base64)]: {base64.b64encode(field).decode('ascii')}"
-                        value_str = f"[Binary Data (Base64)]: {base64.b64encode(value).decode('ascii')}"
-                        result[field_str] = value_str
-                return result
-            elif key_type == 'list':
-                # 获取列表数据
-                binary_list = self.binary_client.lrange(key, 0, -1)
-                return [self._decode_value(item) for item in binary_list]
-            elif key_type == 'set':
-                # 获取集合数据
-                binary_set = self.binary_client.smembers(key)
-                return [self._decode_value(item) for item in binary_set]
-            elif key_type == 'zset':
-                # 获取有序集合数据
-                binary_zset = self.binary_client.zrange(key, 0, -1, withscores=True)
-                return [(self._decode_value(item[0]), item[1]) for item in binary_zset]
+            elif key_type in ('hash', 'list', 'set', 'zset'):
+                return self._get_full_collection(key, key_type)
             else:
                 self.logger.warning(f"Unsupported Redis type: {key_type} for key: {key}")
                 return None
@@ -175,23 +667,158 @@ class RedisClient:
             self.logger.error(f"Error getting value for key {key}: {str(e)}")
             return None
 
-    def _decode_value(self, value: bytes) -> str:
-        """解码二进制值"""
+    def _get_full_collection(self, key: str, key_type: str, raw: bool = False) -> Any:
+        """一次性获取整个集合类型的值；raw 为 True 时返回未解码的字节"""
+        if key_type == 'hash':
+            # 获取所有哈希字段
+            data = self.binary_client.hgetall(key)
+        elif key_type == 'list':
+            # 获取列表数据
+            data = self.binary_client.lrange(key, 0, -1)
+        elif key_type == 'set':
+            # 获取集合数据
+            data = list(self.binary_client.smembers(key))
+        elif key_type == 'zset':
+            # 获取有序集合数据
+            data = self.binary_client.zrange(key, 0, -1, withscores=True)
+        else:
+            return None
+        return data if raw else self._decode_items(key_type, data)
+
+    def _decode_items(self, key_type: str, data) -> Any:
+        """按类型批量解码集合类型的数据"""
+        if key_type == 'hash':
+            return decode_mapping(data)
+        if key_type == 'zset':
+            return decode_pairs(data)
+        return decode_batch(data)
+
+    def get_value_size(self, key: str, key_type: str) -> int:
+        """用 STRLEN/HLEN/LLEN/SCARD/ZCARD 获取值的长度"""
+        try:
+            command = LENGTH_COMMANDS.get(key_type)
+            if not self.client or not command:
+                return 0
+            return int(self.client.execute_command(command, key))
+        except Exception as e:
+            self.logger.error(f"Error getting size of key {key}: {str(e)}")
+            return 0
+
+    def get_value_page(self, key: str, key_type: str,
+                       cursor: int = 0,
+                       count: int = VALUE_PAGE_SIZE,
+                       total: int = None,
+                       raw: bool = False) -> Optional[ValuePage]:
+        """
+        分页获取集合类型的值
+
+        hash/set 使用 HSCAN/SSCAN 游标，list/zset 使用按偏移的 LRANGE/ZRANGE 窗口。
+        首页会先查询长度，不超过 count 的小集合直接一次性加载。
+
+        :param cursor: 上一页返回的 ValuePage.cursor，首页为 0
+        :param total: 已知的元素数量，为 None 时查询
+        :param raw: 返回未解码的字节（hash 为 {bytes: bytes}，zset 为 (bytes, 分数)），
+                    由调用方在显示时再解码
+        """
+        try:
+            if not self.binary_client:
+                self.logger.error("No Redis connection available")
+                return None
+            if total is None:
+                total = self.get_value_size(key, key_type)
+            if cursor == 0 and total <= count:
+                return ValuePage(self._get_full_collection(key, key_type, raw), 0, total)
+
+            if key_type == 'hash':
+                next_cursor, data = self.binary_client.hscan(key, cursor, count=count)
+            elif key_type == 'set':
+                next_cursor, data = self.binary_client.sscan(key, cursor, count=count)
+            elif key_type == 'list':
+                data = self.binary_client.lrange(key, cursor, cursor + count - 1)
+                next_cursor = cursor + len(data) if data and cursor + len(data) < total else 0
+            elif key_type == 'zset':
+                data = self.binary_client.zrange(key, cursor, cursor + count - 1, withscores=True)
+                next_cursor = cursor + len(data) if data and cursor + len(data) < total else 0
+            else:
+                self.logger.warning(f"Paging not supported for type: {key_type} of key: {key}")
+                return None
+            items = data if raw else self._decode_items(key_type, data)
+            return ValuePage(items, int(next_cursor), total)
+        except Exception as e:
+            self.logger.error(f"Error getting page of key {key} at cursor {cursor}: {str(e)}")
+            return None
+
+    def get_key_detail(self, key: str,
+                       count: int = VALUE_PAGE_SIZE,
+                       string_limit: int = STRING_CHUNK_SIZE) -> Optional[KeyDetail]:
+        """
+        通过一个管道获取键的类型、TTL、长度和第一页值
+
+        类型事先未知，管道中同时发送所有类型的长度和首页命令，与实际类型不符的
+        命令返回 WRONGTYPE 错误后被忽略，因此只需一次往返。首页与 get_value_page
+        的首页一致：hash/set 为 HSCAN/SSCAN 游标 0，list/zset 为前 count 个元素。
+
+        :param string_limit: 字符串最多读取的字节数，超过时 truncated 为 True，
+                             value 为开头部分的原始字节
+        :return: 键详情，不支持的类型 value 为 None；出错时返回 None
+        """
         try:
-            return value.decode('utf-8')
-        except UnicodeDecodeError:
-            return f"[Binary Data (Base64)]: {base64.b64encode(value).decode('ascii')}"
+            if not self.binary_client:
+                self.logger.error("No Redis connection available")
+                return None
+            pipe = self.binary_client.pipeline(transaction=False)
+            pipe.type(key)
+            pipe.pttl(key)
+            for command in LENGTH_COMMANDS.values():
+                pipe.execute_command(command, key)
+            pipe.getrange(key, 0, string_limit - 1)
+            pipe.hscan(key, 0, count=count)
+            pipe.lrange(key, 0, count - 1)
+            pipe.sscan(key, 0, count=count)
+            pipe.zrange(key, 0, count - 1, withscores=True)
+            results = pipe.execute(raise_on_error=False)
+
+            key_type, pttl = results[0], results[1]
+            if isinstance(key_type, Exception):
+                raise key_type
+            key_type = key_type.decode()
+            lengths = dict(zip(LENGTH_COMMANDS, results[2:2 + len(LENGTH_COMMANDS)]))
+            string_value, hash_page, list_page, set_page, zset_page = results[2 + len(LENGTH_COMMANDS):]
+            # 向上取整，与键列表中显示的 TTL 一致
+            ttl = -(-pttl // 1000) if isinstance(pttl, int) and pttl > 0 else pttl
+            ttl = ttl if isinstance(ttl, int) else -1
+            length = lengths.get(key_type)
+            length = length if isinstance(length, int) else 0
+
+            if key_type == 'string':
+                if length > string_limit:
+                    return KeyDetail(key_type, ttl, length, string_value, truncated=True)
+                return KeyDetail(key_type, ttl, length, decode_item(string_value))
+            if key_type in ('hash', 'set'):
+                cursor, items = hash_page if key_type == 'hash' else set_page
+                return KeyDetail(key_type, ttl, length, items, int(cursor))
+            if key_type in ('list', 'zset'):
+                items = list_page if key_type == 'list' else zset_page
+                cursor = len(items) if items and len(items) < length else 0
+                return KeyDetail(key_type, ttl, length, items, cursor)
+            return KeyDetail(key_type, ttl, length, None)
+        except Exception as e:
+            self.logger.error(f"Error getting details of key {key}: {str(e)}")
+            return None
 
     def set_string(self, key: str, value: str, ttl: int = None) -> bool:
         """设置字符串值"""
         try:
             if not self.client:
                 return False
+            self.invalidate_cached([key])
             self.client.set(key, value, ex=ttl)
             return True
         except Exception as e:
             self.logger.error(f"Error setting string key {key}: {str(e)}")
             return False
+        finally:
+            self.invalidate_cached([key])
 
     def get_type(self, key: str) -> str:
         """获取键的类型"""
@@ -213,10 +840,167 @@ class RedisClient:
             if not self.client:
                 self.logger.error("No Redis connection available")
                 return False
+            self.invalidate_cached([key])
             return bool(self.client.delete(key))
         except Exception as e:
             self.logger.error(f"Error deleting key {key}: {str(e)}")
             return False
+        finally:
+            self.invalidate_cached([key])
+
+    def delete_keys(self, keys: Iterable[str],
+                    chunk_size: int = DELETE_CHUNK_SIZE,
+                    pause: float = 0.0,
+                    progress_callback: Callable[[List[str], int], None] = None,
+                    should_cancel: Callable[[], bool] = None) -> int:
+        """
+        分块批量删除键
+
+        每块键通过一个管道发送若干条 UNLINK（服务器不支持时使用 DEL），
+        每块之间休眠 pause 秒；服务器响应变慢时自动放慢节奏。
+
+        :param progress_callback: 每块完成后回调 (本块的键, 累计删除数量)
+        :param should_cancel: 返回 True 时在下一块开始前停止
+        :return: 实际删除的键数量
+        """
+        if not self.client:
+            self.logger.error("No Redis connection available")
+            return 0
+        # 整个删除过程固定在开始时的数据库上
+        job = self.snapshot()
+        deleted = 0
+        chunk = []
+        for key in keys:
+            chunk.append(key)
+            if len(chunk) >= chunk_size:
+                if should_cancel and should_cancel():
+                    return deleted
+                deleted += self._unlink_chunk(job, chunk, pause)
+                if progress_callback:
+                    progress_callback(chunk, deleted)
+                chunk = []
+        if chunk and not (should_cancel and should_cancel()):
+            deleted += self._unlink_chunk(job, chunk, pause)
+            if progress_callback:
+                progress_callback(chunk, deleted)
+        return deleted
+
+    def delete_by_pattern(self, pattern: str,
+                          chunk_size: int = DELETE_CHUNK_SIZE,
+                          pause: float = 0.0,
+                          progress_callback: Callable[[List[str], int], None] = None,
+                          should_cancel: Callable[[], bool] = None) -> int:
+        """
+        在服务器端流式删除匹配模式的键：SCAN MATCH 得到一批就 UNLINK 一批，
+        客户端无需持有完整的键列表
+        """
+        # SCAN 和 UNLINK 使用同一个固定的客户端，中途切换数据库不会删到其他库的键
+        job = self.snapshot()
+        deleted = 0
+        for batch in job.scan_keys(pattern, count=chunk_size):
+            if should_cancel and should_cancel():
+                break
+            if not batch.keys:
+                continue
+            deleted += self._unlink_chunk(job, batch.keys, pause)
+            if progress_callback:
+                progress_callback(batch.keys, deleted)
+        return deleted
+
+    def _unlink_chunk(self, job: 'RedisClient', keys: List[str], pause: float) -> int:
+        """通过 job（snapshot() 得到的客户端）用一个管道删除一块键，并按服务器负载休眠"""
+        started = time.monotonic()
+        job.invalidate_cached(keys)
+        try:
+            pipe = job.client.pipeline(transaction=False)
+            for i in range(0, len(keys), UNLINK_BATCH_SIZE):
+                if self._unlink_supported is False:
+                    pipe.delete(*keys[i:i + UNLINK_BATCH_SIZE])
+                else:
+                    pipe.unlink(*keys[i:i + UNLINK_BATCH_SIZE])
+            results = pipe.execute(raise_on_error=False)
+            if any(isinstance(r, redis.ResponseError) and 'unknown command' in str(r).lower()
+                   for r in results):
+                # Redis 4.0 之前没有 UNLINK
+                self._unlink_supported = False
+                return self._unlink_chunk(job, keys, pause)
+            deleted = sum(r for r in results if isinstance(r, int))
+        except Exception as e:
+            self.logger.error(f"Error deleting {len(keys)} keys: {str(e)}")
+            deleted = 0
+        finally:
+            job.invalidate_cached(keys)
+        elapsed = time.monotonic() - started
+        delay = pause + (elapsed if elapsed > SLOW_PIPELINE_SECONDS else 0)
+        if delay > 0:
+            time.sleep(delay)
+        return deleted
+
+    def dump_keys(self, keys: List[Union[str, bytes]]) -> Tuple[List[Tuple[Union[str, bytes], int, bytes]],
+                                                                 List[Tuple[str, str]]]:
+        """
+        通过一个管道获取一批键的 DUMP 序列化数据和剩余毫秒数
+
+        :return: ([(键名, 剩余毫秒数（0 表示永不过期）, DUMP 数据)], [(键名, 错误信息)])，
+                 已不存在的键被跳过；管道或连接出错时整批记为失败
+        """
+        names = [key.decode('utf-8', errors='replace') if isinstance(key, bytes) else key
+                 for key in keys]
+        try:
+            if not keys:
+                return [], []
+            if not self.binary_client:
+                self.logger.error("No Redis connection available")
+                return [], [(name, "未连接") for name in names]
+            pipe = self.binary_client.pipeline(transaction=False)
+            for key in keys:
+                pipe.dump(key)
+                pipe.pttl(key)
+            results = pipe.execute(raise_on_error=False)
+            records = []
+            failures = []
+            for i, key in enumerate(keys):
+                payload, pttl = results[2 * i], results[2 * i + 1]
+                if isinstance(payload, Exception):
+                    self.logger.warning(f"Error dumping key {names[i]}: {str(payload)}")
+                    failures.append((names[i], str(payload)))
+                    continue
+                if payload is None:
+                    continue
+                records.append((key, pttl if isinstance(pttl, int) and pttl > 0 else 0, payload))
+            return records, failures
+        except Exception as e:
+            self.logger.error(f"Error dumping {len(keys)} keys: {str(e)}")
+            return [], [(name, str(e)) for name in names]
+
+    def restore_keys(self, records: List[Tuple[bytes, int, bytes]],
+                     replace: bool = False) -> Tuple[int, List[Tuple[str, str]]]:
+        """
+        通过一个管道用 RESTORE 写入一批 DUMP 记录
+
+        :param records: [(键名, 剩余毫秒数（0 表示永不过期）, DUMP 数据)]
+        :param replace: 是否覆盖已存在的键，否则已存在的键报错跳过
+        :return: (成功数量, [(键名, 错误信息)])
+        """
+        keys = [key.decode('utf-8', errors='replace') if isinstance(key, bytes) else key
+                for key, _, _ in records]
+        try:
+            if not self.binary_client:
+                self.logger.error("No Redis connection available")
+                return 0, [(key, "未连接") for key in keys]
+            self.invalidate_cached(keys)
+            pipe = self.binary_client.pipeline(transaction=False)
+            for key, pttl, payload in records:
+                pipe.restore(key, pttl, payload, replace=replace)
+            results = pipe.execute(raise_on_error=False)
+            failures = [(key, str(result)) for key, result in zip(keys, results)
+                        if isinstance(result, Exception)]
+            return len(records) - len(failures), failures
+        except Exception as e:
+            self.logger.error(f"Error restoring {len(records)} keys: {str(e)}")
+            return 0, [(key, str(e)) for key in keys]
+        finally:
+            self.invalidate_cached(keys)
 
     def flush_db(self) -> bool:
         """清空当前数据库"""
@@ -224,11 +1008,14 @@ class RedisClient:
             if not self.client:
                 self.logger.error("No Redis connection available")
                 return False
+            self._invalidate_db()
             self.client.flushdb()
             return True
         except Exception as e:
             self.logger.error(f"Error flushing current database: {str(e)}")
             return False
+        finally:
+            self._invalidate_db()
 
     def flush_all(self) -> bool:
         """清空所有数据库"""
@@ -236,11 +1023,14 @@ class RedisClient:
             if not self.client:
                 self.logger.error("No Redis connection available")
                 return False
+            self._invalidate_db(all_dbs=True)
             self.client.flushall()
             return True
         except Exception as e:
             self.logger.error(f"Error flushing all databases: {str(e)}")
-            return False 
+            return False
+        finally:
+            self._invalidate_db(all_dbs=True)
 
     def get_ttl(self, key: str) -> int:
         """获取键的TTL"""
@@ -257,6 +1047,7 @@ class RedisClient:
         try:
             if not self.client:
                 return False
+            self.invalidate_cached([key])
             if ttl < 0:
                 self.client.persist(key)  # 移除过期时间
             else:
@@ -265,55 +1056,254 @@ class RedisClient:
         except Exception as e:
             self.logger.error(f"Error setting TTL for key {key}: {str(e)}")
             return False
+        finally:
+            self.invalidate_cached([key])
 
     def set_hash(self, key: str, mapping: dict) -> bool:
         """设置哈希值"""
+        return self.write_collection(key, 'hash', mapping)
+
+    def set_list(self, key: str, items: list) -> bool:
+        """设置列表值"""
+        return self.write_collection(key, 'list', items)
+
+    def set_set(self, key: str, items: list) -> bool:
+        """设置集合值"""
+        return self.write_collection(key, 'set', items)
+
+    def set_zset(self, key: str, items: list) -> bool:
+        """设置有序集合值"""
+        return self.write_collection(key, 'zset', items)
+
+    def write_collection(self, key: str, key_type: str, items,
+                         chunk_size: int = WRITE_CHUNK_SIZE,
+                         progress_callback: Callable[[int, int], None] = None,
+                         should_cancel: Callable[[], bool] = None) -> bool:
+        """
+        整体替换集合类型的值
+
+        元素按 chunk_size 分成多条命令，经管道写入一个临时键，全部写完后
+        RENAME 覆盖目标键并恢复原来的 TTL。写入过程中目标键保持旧值，
+        失败或取消时删除临时键；临时键带有过期时间，程序中途退出也不会遗留。
+
+        :param items: hash 为 dict，zset 为 (成员, 分数) 列表，list/set 为元素列表
+        :param progress_callback: 每个管道执行后回调 (已写入元素数, 元素总数)
+        :param should_cancel: 返回 True 时在下一个管道开始前停止
+        :return: 是否写入成功（取消时返回 False）
+        """
+        if not self.client:
+            return False
+        temp_key = f"{key}:__redis_gui_tmp_{uuid.uuid4().hex}"
+        self.invalidate_cached([key])
         try:
-            if not self.client:
-                return False
-            self.client.delete(key)  # 先删除旧值
-            if mapping:
-                self.client.hset(key, mapping=mapping)
+            elements = list(items.items()) if key_type == 'hash' else list(items)
+            total = len(elements)
+            pttl = self.client.pttl(key)
+            pipe = self.client.pipeline(transaction=False)
+            for start in range(0, total, chunk_size):
+                chunk = elements[start:start + chunk_size]
+                if not self._queue_add(pipe, temp_key, key_type, chunk):
+                    self.logger.warning(f"Bulk write not supported for type: {key_type} of key: {key}")
+                    return False
+                if len(pipe) >= WRITE_PIPELINE_COMMANDS:
+                    if should_cancel and should_cancel():
+                        pipe.reset()
+                        self.client.delete(temp_key)
+                        return False
+                    pipe.pexpire(temp_key, WRITE_TEMP_KEY_TTL_MS)
+                    pipe.execute()
+                    if progress_callback:
+                        progress_callback(min(start + chunk_size, total), total)
+            if len(pipe):
+                pipe.pexpire(temp_key, WRITE_TEMP_KEY_TTL_MS)
+                pipe.execute()
+                if progress_callback:
+                    progress_callback(total, total)
+
+            swap = self.client.pipeline(transaction=True)
+            if total:
+                # RENAME 会带上临时键的过期时间，恢复为原来的 TTL 或永不过期
+                swap.rename(temp_key, key)
+                if pttl > 0:
+                    swap.pexpire(key, pttl)
+                else:
+                    swap.persist(key)
+            else:
+                # 空集合在 Redis 中不存在
+                swap.delete(key)
+            swap.execute()
             return True
         except Exception as e:
-            self.logger.error(f"Error setting hash key {key}: {str(e)}")
+            self.logger.error(f"Error writing {key_type} key {key}: {str(e)}")
+            try:
+                self.client.delete(temp_key)
+            except Exception:
+                pass
             return False
+        finally:
+            self.invalidate_cached([key])
 
-    def set_list(self, key: str, items: list) -> bool:
-        """设置列表值"""
+    @staticmethod
+    def _queue_add(pipe, key: str, key_type: str, elements) -> bool:
+        """
+        在管道中加入向集合类型追加元素的命令
+
+        :param elements: hash 为 (字段, 值) 列表，zset 为 (成员, 分数) 列表，list/set 为元素列表
+        :return: 类型不支持时返回 False
+        """
+        if key_type == 'hash':
+            pipe.hset(key, mapping=dict(elements))
+        elif key_type == 'list':
+            pipe.rpush(key, *elements)
+        elif key_type == 'set':
+            pipe.sadd(key, *elements)
+        elif key_type == 'zset':
+            pipe.zadd(key, {member: score for member, score in elements})
+        else:
+            return False
+        return True
+
+    def write_records(self, records) -> Tuple[int, List[Tuple[Any, str]]]:
+        """
+        通过一个管道写入一批记录（批量导入）
+
+        字符串用 SET 覆盖，集合类型按 _queue_add 追加元素；记录带 TTL 时随后设置过期时间。
+
+        :param records: 具有 key、key_type、value、ttl 属性的记录，value 为字符串，
+                        或 _queue_add 接受的元素列表
+        :return: (成功写入的记录数, [(记录, 错误信息)])
+        """
+        try:
+            if not self.client:
+                self.logger.error("No Redis connection available")
+                return 0, [(record, "未连接") for record in records]
+            self.invalidate_cached(record.key for record in records)
+            pipe = self.client.pipeline(transaction=False)
+            spans = []
+            for record in records:
+                start = len(pipe)
+                if record.key_type == 'string':
+                    pipe.set(record.key, record.value, ex=record.ttl or None)
+                else:
+                    self._queue_add(pipe, record.key, record.key_type, record.value)
+                    if record.ttl:
+                        pipe.expire(record.key, record.ttl)
+                spans.append((start, len(pipe)))
+            results = pipe.execute(raise_on_error=False)
+            failures = []
+            for record, (start, end) in zip(records, spans):
+                error = next((r for r in results[start:end] if isinstance(r, Exception)), None)
+                if error is not None:
+                    failures.append((record, str(error)))
+            return len(records) - len(failures), failures
+        except Exception as e:
+            self.logger.error(f"Error writing {len(records)} records: {str(e)}")
+            return 0, [(record, str(e)) for record in records]
+        finally:
+            self.invalidate_cached(record.key for record in records)
+
+    def apply_delta(self, key: str, key_type: str, delta, ttl: int = None) -> bool:
+        """
+        在一个 MULTI/EXEC 事务中写入集合类型的增量修改
+
+        :param delta: value_diff.ValueDelta
+        :param ttl: 需要同时修改的 TTL，None 表示不修改，负数表示移除过期时间
+        """
         try:
             if not self.client:
                 return False
-            self.client.delete(key)  # 先删除旧值
-            if items:
-                self.client.rpush(key, *items)
+            self.invalidate_cached([key])
+            pipe = self.client.pipeline(transaction=True)
+            if key_type == 'hash':
+                if delta.removals:
+                    pipe.hdel(key, *delta.removals)
+                if delta.updates:
+                    pipe.hset(key, mapping=delta.updates)
+            elif key_type == 'set':
+                if delta.removals:
+                    pipe.srem(key, *delta.removals)
+                if delta.updates:
+                    pipe.sadd(key, *delta.updates)
+            elif key_type == 'zset':
+                if delta.removals:
+                    pipe.zrem(key, *delta.removals)
+                if delta.updates:
+                    pipe.zadd(key, delta.updates)
+            elif key_type == 'list':
+                self._queue_list_delta(pipe, key, delta)
+            else:
+                self.logger.warning(f"Delta save not supported for type: {key_type} of key: {key}")
+                return False
+            if ttl is not None:
+                if ttl < 0:
+                    pipe.persist(key)
+                else:
+                    pipe.expire(key, ttl)
+            pipe.execute()
             return True
         except Exception as e:
-            self.logger.error(f"Error setting list key {key}: {str(e)}")
+            self.logger.error(f"Error applying changes to key {key}: {str(e)}")
             return False
+        finally:
+            self.invalidate_cached([key])
 
-    def set_set(self, key: str, items: list) -> bool:
-        """设置集合值"""
+    def _queue_list_delta(self, pipe, key: str, delta):
+        """
+        列表增量：先按原索引 LSET 修改的元素，再删除元素，最后 RPUSH 新元素
+
+        删除的元素先用 LSET 替换为唯一标记，再通过 LREM 一次移除，避免逐个删除导致
+        后续索引偏移。不依赖执行时的列表长度，其他客户端在保存前追加的元素不会被删掉。
+        """
+        for index, value in delta.updates.items():
+            pipe.lset(key, index, value)
+        if delta.removals:
+            marker = f"__redis_gui_removed_{uuid.uuid4().hex}__"
+            for index in sorted(delta.removals):
+                pipe.lset(key, index, marker)
+            pipe.lrem(key, 0, marker)
+        if delta.appends:
+            pipe.rpush(key, *delta.appends)
+
+    def keyspace_events_enabled(self) -> bool:
+        """检查服务器是否开启了键事件通知（notify-keyspace-events 包含 E 以及 A 或 g$lshzxe）"""
         try:
             if not self.client:
                 return False
-            self.client.delete(key)  # 先删除旧值
-            if items:
-                self.client.sadd(key, *items)
-            return True
+            flags = self.client.config_get('notify-keyspace-events').get('notify-keyspace-events', '')
+            return 'E' in flags and ('A' in flags or all(ch in flags for ch in 'g$lshzxe'))
         except Exception as e:
-            self.logger.error(f"Error setting set key {key}: {str(e)}")
+            self.logger.error(f"Error reading notify-keyspace-events: {str(e)}")
             return False
 
-    def set_zset(self, key: str, items: list) -> bool:
-        """设置有序集合值"""
+    def enable_keyspace_events(self) -> bool:
+        """在保留原有配置的基础上开启键事件通知"""
         try:
             if not self.client:
                 return False
-            self.client.delete(key)  # 先删除旧值
-            if items:
-                self.client.zadd(key, {member: score for member, score in items})
+            flags = self.client.config_get('notify-keyspace-events').get('notify-keyspace-events', '')
+            for ch in 'EA':
+                if ch not in flags:
+                    flags += ch
+            self.client.config_set('notify-keyspace-events', flags)
             return True
         except Exception as e:
-            self.logger.error(f"Error setting sorted set key {key}: {str(e)}")
-            return False 
\ No newline at end of file
+            self.logger.error(f"Error enabling keyspace notifications: {str(e)}")
+            return False
+
+    def create_pubsub(self, raw: bool = False):
+        """
+        创建订阅对象，订阅期间独占一个连接
+
+        :param raw: 消息的频道和内容不解码（bytes），由调用方逐条解码
+        """
+        if not self.client:
+            self.logger.error("No Redis connection available")
+            return None
+        if not raw:
+            return self.client.pubsub(ignore_subscribe_messages=True)
+        # 共享的连接池按 decode_responses=True 创建，订阅又独占一个连接，
+        # 因此单独建立一个不解码的连接（pubsub.close() 时断开）
+        pool = self.client.connection_pool
+        raw_pool = redis.ConnectionPool(connection_class=pool.connection_class, max_connections=1,
+                                        **dict(pool.connection_kwargs, decode_responses=False))
+        return redis.Redis(connection_pool=raw_pool).pubsub(ignore_subscribe_messages=True)
@@ -0,0 +1,299 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import csv
+import json
+import os
+import time
+import zlib
+
+# 文件格式
+JSONL = 'jsonl'
+CSV = 'csv'
+# 支持导入的数据类型
+LOAD_TYPES = ('string', 'hash', 'list', 'set', 'zset')
+# 默认每个管道写入的记录数、并行写入的连接数
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_THREADS = 4
+# 每个连接最多排队的批次数，超过时读取文件的线程等待（背压）
+MAX_PENDING_BATCHES = 2
+# 报告中最多保留的错误明细数量
+MAX_REPORTED_ERRORS = 10000
+
+
+class RowError(ValueError):
+    """单行数据无法按映射转换为记录"""
+
+
+@dataclass
+class LoadRecord:
+    """一行数据转换得到的写入记录"""
+    line: int
+    key: str
+    key_type: str
+    value: Any          # 字符串，或 RedisClient._queue_add 接受的元素列表
+    ttl: Optional[int]  # 秒，None 表示不设置
+
+
+def _text(value) -> str:
+    """把 JSON 中的值转换为写入 Redis 的文本"""
+    if isinstance(value, str):
+        return value
+    if value is None:
+        raise RowError("值为空")
+    if isinstance(value, (dict, list, bool)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+@dataclass
+class LoadMapping:
+    """
+    列到键的映射
+
+    key_template 使用 str.format 语法引用列，例如 "user:{id}"（JSON 嵌套对象可写作
+    "{user[id]}"）。同一个键可以对应多行：字符串以最后一行为准，集合类型逐行追加元素。
+
+    - string: value_field 列为值，为空时整行以 JSON 保存
+    - hash:   fields 中的列为字段，为空时使用所有列
+    - list/set: value_field 列为元素
+    - zset:   value_field 列为成员，score_field 列为分数
+    - TTL:    ttl_field 列（秒）优先，否则使用固定的 ttl
+    """
+    key_template: str
+    key_type: str = 'string'
+    value_field: str = ''
+    fields: Sequence[str] = ()
+    score_field: str = ''
+    ttl: Optional[int] = None
+    ttl_field: str = ''
+
+    def validate(self):
+        """检查映射本身是否完整，不完整时抛出 ValueError"""
+        if not self.key_template:
+            raise ValueError("键模板不能为空")
+        if self.key_type not in LOAD_TYPES:
+            raise ValueError(f"不支持的数据类型: {self.key_type}")
+        if self.key_type in ('list', 'set', 'zset') and not self.value_field:
+            raise ValueError("列表/集合/有序集合需要指定值字段")
+        if self.key_type == 'zset' and not self.score_field:
+            raise ValueError("有序集合需要指定分数字段")
+
+    def build(self, line: int, row: Dict[str, Any]) -> LoadRecord:
+        """把一行转换为记录，数据不符合映射时抛出 RowError"""
+        try:
+            key = self.key_template.format_map(row)
+        except KeyError as e:
+            raise RowError(f"缺少键模板中的字段 {e}")
+        except (IndexError, ValueError, TypeError, AttributeError) as e:
+            raise RowError(f"无法生成键名: {str(e)}")
+        if not key:
+            raise RowError("键名为空")
+
+        if self.key_type == 'string':
+            value = _text(self._field(row, self.value_field)) if self.value_field \
+                else json.dumps(row, ensure_ascii=False)
+        elif self.key_type == 'hash':
+            names = self.fields or list(row)
+            value = [(name, _text(self._field(row, name))) for name in names]
+            if not value:
+                raise RowError("没有可写入的字段")
+        elif self.key_type == 'zset':
+            score = self._field(row, self.score_field)
+            try:
+                score = float(score)
+            except (TypeError, ValueError):
+                raise RowError(f"分数不是数字: {score!r}")
+            value = [(_text(self._field(row, self.value_field)), score)]
+        else:
+            value = [_text(self._field(row, self.value_field))]
+
+        return LoadRecord(line, key, self.key_type, value, self._ttl(row))
+
+    @staticmethod
+    def _field(row: Dict[str, Any], name: str):
+        if name not in row:
+            raise RowError(f"缺少字段 {name}")
+        return row[name]
+
+    def _ttl(self, row: Dict[str, Any]) -> Optional[int]:
+        if not self.ttl_field:
+            return self.ttl or None
+        raw = row.get(self.ttl_field)
+        if raw is None or raw == '':
+            return self.ttl or None
+        try:
+            ttl = int(float(raw))
+        except (TypeError, ValueError):
+            raise RowError(f"TTL 不是数字: {raw!r}")
+        if ttl <= 0:
+            raise RowError(f"TTL 必须大于 0: {raw!r}")
+        return ttl
+
+
+class RowReader:
+    """
+    流式读取 JSON Lines / CSV 文件，逐行返回 (行号, 列 -> 值)
+
+    无法解析的行以 RowError 的形式返回（而不是抛出），由调用方记入错误报告。
+    """
+
+    def __init__(self, path: str, file_format: str = None):
+        self.path = path
+        self.format = file_format or (CSV if path.lower().endswith('.csv') else JSONL)
+        self.size = os.path.getsize(path)
+        self._file = open(path, 'r', encoding='utf-8-sig', newline='')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def position(self) -> int:
+        """已读取的字节数（按缓冲区粒度，用于显示进度）"""
+        return self._file.buffer.tell()
+
+    def close(self):
+        self._file.close()
+
+    def __iter__(self) -> Iterator[Tuple[int, Any]]:
+        if self.format == CSV:
+            reader = csv.DictReader(self._file)
+            for row in reader:
+                if None in row:
+                    yield reader.line_num, RowError("列数多于表头")
+                else:
+                    yield reader.line_num, row
+            return
+        for line_no, line in enumerate(self._file, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_no, RowError(f"JSON 格式错误: {e.msg}")
+                continue
+            if not isinstance(row, dict):
+                yield line_no, RowError("每行必须是一个 JSON 对象")
+                continue
+            yield line_no, row
+
+
+@dataclass
+class LoadReport:
+    """导入结果统计和错误明细"""
+    rows: int = 0
+    written: int = 0
+    error_count: int = 0
+    errors: List[Tuple[int, str, str]] = field(default_factory=list)  # (行号, 键名, 原因)
+    keys_by_type: Dict[str, int] = field(default_factory=dict)        # 试运行时各类型的记录数
+    elapsed: float = 0.0
+
+    def add_error(self, line: int, key: str, message: str):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line, key, message))
+
+    def save_csv(self, path: str):
+        with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(["行号", "键", "原因"])
+            writer.writerows(self.errors)
+
+
+class BulkLoader:
+    """
+    把 RowReader 读取的行按映射批量写入 Redis
+
+    记录按键名哈希分配给 threads 个写入线程（各自从共享连接池取连接），同一个键
+    总是由同一个线程按顺序写入，列表元素的顺序与文件一致。每个线程排队的批次数
+    超过 MAX_PENDING_BATCHES 时读取线程等待最早的批次完成，内存中只保留少量批次。
+    dry_run 时只解析和校验，不写入。
+
+    redis_client 应为 RedisClient.snapshot() 的结果，导入过程中界面切换数据库不会影响写入的目标库。
+    """
+
+    def __init__(self, redis_client, mapping: LoadMapping,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 threads: int = DEFAULT_THREADS,
+                 dry_run: bool = False):
+        mapping.validate()
+        self.redis_client = redis_client
+        self.mapping = mapping
+        self.batch_size = max(1, batch_size)
+        self.threads = max(1, threads)
+        self.dry_run = dry_run
+
+    def run(self, reader: RowReader,
+            progress_callback: Callable[[LoadReport, float], None] = None,
+            should_cancel: Callable[[], bool] = None,
+            progress_interval: float = 0.2) -> LoadReport:
+        """
+        :param progress_callback: 定期回调 (当前统计, 已读取的比例)
+        :param should_cancel: 返回 True 时停止读取并丢弃未提交的记录，已提交的批次仍会写完
+        """
+        report = LoadReport()
+        started = last_progress = time.monotonic()
+        executors = [ThreadPoolExecutor(max_workers=1) for _ in range(self.threads)]
+        pending = [deque() for _ in range(self.threads)]
+        batches: List[List[LoadRecord]] = [[] for _ in range(self.threads)]
+        cancelled = False
+        try:
+            for line, row in reader:
+                if should_cancel and should_cancel():
+                    cancelled = True
+                    break
+                report.rows += 1
+                if isinstance(row, RowError):
+                    report.add_error(line, '', str(row))
+                    continue
+                try:
+                    record = self.mapping.build(line, row)
+                except RowError as e:
+                    report.add_error(line, '', str(e))
+                    continue
+
+                if self.dry_run:
+                    report.written += 1
+                    report.keys_by_type[record.key_type] = report.keys_by_type.get(record.key_type, 0) + 1
+                else:
+                    slot = zlib.crc32(record.key.encode('utf-8')) % self.threads
+                    batches[slot].append(record)
+                    if len(batches[slot]) >= self.batch_size:
+                        self._submit(executors[slot], pending[slot], batches[slot], report)
+                        batches[slot] = []
+
+                now = time.monotonic()
+                if progress_callback and now - last_progress >= progress_interval:
+                    report.elapsed = now - started
+                    progress_callback(report, reader.position / reader.size if reader.size else 1.0)
+                    last_progress = now
+
+            # 取消时丢弃尚未凑满的批次，只等待已提交的批次写完
+            if not cancelled:
+                for slot, batch in enumerate(batches):
+                    if batch:
+                        self._submit(executors[slot], pending[slot], batch, report)
+            for queue in pending:
+                while queue:
+                    self._collect(queue.popleft(), report)
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=True)
+        report.elapsed = time.monotonic() - started
+        return report
+
+    def _submit(self, executor, queue, batch, report):
+        if len(queue) >= MAX_PENDING_BATCHES:
+            self._collect(queue.popleft(), report)
+        queue.append(executor.submit(self.redis_client.write_records, batch))
+
+    @staticmethod
+    def _collect(future, report: LoadReport):
+        written, failures = future.result()
+        report.written += written
+        for record, message in failures:
+            report.add_error(record.line, record.key, message)
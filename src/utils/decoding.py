@@ -0,0 +1,94 @@
+import base64
+import binascii
+from typing import Callable, Dict, Iterable, List, Tuple
+
+# 无法按 UTF-8 解码的值显示为该前缀加 Base64
+BINARY_PREFIX = "[Binary Data (Base64)]: "
+
+
+def _binary_text(value: bytes) -> str:
+    return BINARY_PREFIX + base64.b64encode(value).decode('ascii')
+
+
+def decode_item(value: bytes) -> str:
+    """解码单个值，非 UTF-8 数据以带前缀的 Base64 表示"""
+    try:
+        return value.decode('utf-8')
+    except UnicodeDecodeError:
+        return _binary_text(value)
+
+
+def decode_batch(values: Iterable[bytes]) -> List[str]:
+    """
+    批量解码
+
+    先用 map(bytes.decode) 在 C 层一次性解码整批数据；只有整批中存在
+    非 UTF-8 的值时才退回逐个解码。
+    """
+    values = values if isinstance(values, list) else list(values)
+    try:
+        return list(map(bytes.decode, values))
+    except UnicodeDecodeError:
+        return [decode_item(value) for value in values]
+
+
+def decode_pairs(pairs: Iterable[Tuple[bytes, object]]) -> List[Tuple[str, object]]:
+    """批量解码 (成员, 分数) 列表的成员部分"""
+    pairs = pairs if isinstance(pairs, list) else list(pairs)
+    decode = bytes.decode
+    try:
+        return [(decode(member), score) for member, score in pairs]
+    except UnicodeDecodeError:
+        return [(decode_item(member), score) for member, score in pairs]
+
+
+def decode_mapping(mapping: Dict[bytes, bytes]) -> Dict[str, str]:
+    """批量解码哈希的字段和值"""
+    return dict(zip(decode_batch(mapping.keys()), decode_batch(mapping.values())))
+
+
+# ---- 显示方式：在界面显示时才对可见的值进行转换 ----
+
+def render_utf8(value: bytes) -> str:
+    return decode_item(value)
+
+
+def parse_utf8(text: str) -> bytes:
+    if text.startswith(BINARY_PREFIX):
+        try:
+            return base64.b64decode(text[len(BINARY_PREFIX):], validate=True)
+        except binascii.Error:
+            pass
+    return text.encode('utf-8')
+
+
+def render_hex(value: bytes) -> str:
+    return value.hex(' ')
+
+
+def parse_hex(text: str) -> bytes:
+    return bytes.fromhex(text)
+
+
+def render_base64(value: bytes) -> str:
+    return base64.b64encode(value).decode('ascii')
+
+
+def parse_base64(text: str) -> bytes:
+    return base64.b64decode(text, validate=True)
+
+
+class Renderer:
+    """把原始字节转换为显示文本，并把编辑后的文本转换回字节"""
+
+    def __init__(self, name: str, render: Callable[[bytes], str], parse: Callable[[str], bytes]):
+        self.name = name
+        self.render = render
+        self.parse = parse
+
+
+RENDERERS = {
+    'utf-8': Renderer("UTF-8", render_utf8, parse_utf8),
+    'hex': Renderer("十六进制", render_hex, parse_hex),
+    'base64': Renderer("Base64", render_base64, parse_base64),
+}
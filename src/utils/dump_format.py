@@ -0,0 +1,113 @@
+from typing import Iterator, Tuple
+import gzip
+import os
+import struct
+
+# 文件头：魔数 + 格式版本
+MAGIC = b'RGUIDUMP'
+FORMAT_VERSION = 1
+# gzip 压缩级别：DUMP 数据本身已较紧凑，使用最快的级别，避免压缩成为导出的瓶颈
+COMPRESS_LEVEL = 1
+
+# 每条记录：键名长度、键名、剩余毫秒数（0 表示永不过期）、DUMP 数据长度、DUMP 数据
+_KEY_HEADER = struct.Struct('>I')
+_VALUE_HEADER = struct.Struct('>qI')
+# 键名长度为该值表示文件结束，用于发现被截断的文件
+_END_MARKER = 0xFFFFFFFF
+
+
+class DumpFormatError(Exception):
+    """导出文件格式错误或已损坏"""
+
+
+class DumpWriter:
+    """
+    把 (键名, 剩余毫秒数, DUMP 数据) 记录流式写入 gzip 压缩文件
+
+    记录逐条写入压缩流，内存中不保留已写入的数据。close() 时写入结束标记，
+    没有结束标记的文件在导入时视为不完整。
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self.bytes_written = 0  # 未压缩的记录字节数
+        self._file = gzip.open(path, 'wb', compresslevel=COMPRESS_LEVEL)
+        self._file.write(MAGIC + bytes([FORMAT_VERSION]))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(complete=exc_type is None)
+
+    def write(self, key: bytes, pttl: int, payload: bytes):
+        # 每次写入都会进入压缩器，整条记录拼接后一次写入
+        record = b''.join((_KEY_HEADER.pack(len(key)), key,
+                           _VALUE_HEADER.pack(max(pttl, 0), len(payload)), payload))
+        self._file.write(record)
+        self.count += 1
+        self.bytes_written += len(record)
+
+    def close(self, complete: bool = True):
+        """关闭文件；complete 为 False 时（如导出被取消）不写结束标记"""
+        if self._file is None:
+            return
+        if complete:
+            self._file.write(_KEY_HEADER.pack(_END_MARKER))
+        self._file.close()
+        self._file = None
+
+
+class DumpReader:
+    """流式读取 DumpWriter 写入的文件，position 为已读取的压缩字节数（用于显示进度）"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.size = os.path.getsize(path)
+        self._raw = open(path, 'rb')
+        self._file = gzip.GzipFile(fileobj=self._raw, mode='rb')
+        try:
+            header = self._file.read(len(MAGIC) + 1)
+        except (OSError, EOFError) as e:
+            self.close()
+            raise DumpFormatError(f"无法读取文件: {str(e)}")
+        if header[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise DumpFormatError("不是本程序导出的文件")
+        if header[len(MAGIC)] != FORMAT_VERSION:
+            self.close()
+            raise DumpFormatError(f"不支持的文件版本 {header[len(MAGIC)]}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def position(self) -> int:
+        return self._raw.tell()
+
+    def close(self):
+        self._file.close()
+        self._raw.close()
+
+    def records(self) -> Iterator[Tuple[bytes, int, bytes]]:
+        """逐条返回 (键名, 剩余毫秒数, DUMP 数据)"""
+        try:
+            while True:
+                (key_length,) = _KEY_HEADER.unpack(self._read(_KEY_HEADER.size))
+                if key_length == _END_MARKER:
+                    return
+                key = self._read(key_length)
+                pttl, payload_length = _VALUE_HEADER.unpack(self._read(_VALUE_HEADER.size))
+                yield key, pttl, self._read(payload_length)
+        except (OSError, EOFError) as e:
+            raise DumpFormatError(f"文件已损坏: {str(e)}")
+
+    def _read(self, n: int) -> bytes:
+        data = self._file.read(n)
+        if len(data) != n:
+            raise DumpFormatError("文件不完整（导出可能未完成）")
+        return data
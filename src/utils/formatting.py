@@ -0,0 +1,38 @@
+def format_bytes(size) -> str:
+    """把字节数格式化为易读的字符串"""
+    if size is None:
+        return "-"
+    size = float(size)
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def format_ttl(ttl) -> str:
+    """格式化 TTL（秒）"""
+    if ttl is None:
+        return "-"
+    if ttl == -1:
+        return "永久"
+    if ttl < 0:
+        return "已过期"
+    if ttl < 60:
+        return f"{ttl}s"
+    if ttl < 3600:
+        return f"{ttl // 60}m{ttl % 60}s"
+    if ttl < 86400:
+        return f"{ttl // 3600}h{ttl % 3600 // 60}m"
+    return f"{ttl // 86400}d{ttl % 86400 // 3600}h"
+
+
+def format_duration(microseconds) -> str:
+    """格式化耗时（微秒）"""
+    if microseconds is None:
+        return "-"
+    if microseconds < 1000:
+        return f"{microseconds:.0f} µs"
+    if microseconds < 1000 * 1000:
+        return f"{microseconds / 1000:.1f} ms"
+    return f"{microseconds / 1000 / 1000:.2f} s"
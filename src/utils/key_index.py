@@ -0,0 +1,119 @@
+from array import array
+from bisect import bisect_right
+from typing import List, Tuple
+
+# 已删除的键超过索引中键数量的该比例时重建缓冲区，释放已删除键占用的内存
+COMPACT_RATIO = 0.25
+# 已删除的键少于该数量时不重建
+COMPACT_MIN_REMOVED = 1024
+
+
+class KeySearchSnapshot:
+    """
+    KeySearchIndex 的只读快照，可以安全地交给后台线程查询
+    """
+
+    def __init__(self, segments: Tuple[Tuple[str, array, array], ...], removed: frozenset):
+        self._segments = segments
+        self._removed = removed
+
+    def search(self, text: str) -> array:
+        """返回键名（忽略大小写）包含 text 的所有键 id"""
+        text = text.lower()
+        result = array('I')
+        removed = self._removed
+        for buffer, offsets, ids in self._segments:
+            size = len(offsets)
+            pos = buffer.find(text)
+            while pos >= 0:
+                i = bisect_right(offsets, pos) - 1
+                # 下一个键的起始位置（减去分隔符即本键的结束位置）
+                next_start = offsets[i + 1] if i + 1 < size else len(buffer) + 1
+                if pos + len(text) < next_start:
+                    if ids[i] not in removed:
+                        result.append(ids[i])
+                    pos = buffer.find(text, next_start)
+                else:
+                    # 匹配跨越了分隔符，从下一个位置继续
+                    pos = buffer.find(text, pos + 1)
+        return result
+
+
+class KeySearchIndex:
+    """
+    键名子串索引
+
+    小写后的键名以分隔符拼接为若干段大字符串，并记录每个键的起始偏移和键 id。
+    "包含"查询由 str.find 在 C 层扫描缓冲区，再通过二分偏移表把命中位置映射回键 id，
+    每个键最多命中一次。新加入的键先暂存，查询前再合并成新的段。
+    删除只做标记，标记的数量超过 COMPACT_RATIO 时去掉已删除的键重建缓冲区。
+    """
+
+    SEPARATOR = '\x00'
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._segments: List[Tuple[str, array, array]] = []
+        self._pending_keys: List[str] = []
+        self._pending_ids = array('I')
+        self._removed = set()  # 已删除的键 id（缓冲区只追加，查询时跳过）
+
+    def __len__(self) -> int:
+        return self._stored() - len(self._removed)
+
+    def _stored(self) -> int:
+        """缓冲区和暂存区中的记录数（包括已标记删除的）"""
+        return sum(len(ids) for _, _, ids in self._segments) + len(self._pending_ids)
+
+    def add(self, key_id: int, key: str):
+        if key_id in self._removed:
+            # 同一节点重新变为键，缓冲区中仍保留着原来的记录
+            self._removed.discard(key_id)
+            return
+        self._pending_keys.append(key.lower())
+        self._pending_ids.append(key_id)
+
+    def discard(self, key_id: int):
+        """标记键已删除"""
+        self._removed.add(key_id)
+        removed = len(self._removed)
+        if removed >= COMPACT_MIN_REMOVED and removed > self._stored() * COMPACT_RATIO:
+            self._compact()
+
+    def _compact(self):
+        """丢弃已删除键的记录，剩余的键放回暂存区，下次查询前合并为一个段"""
+        removed = self._removed
+        keys: List[str] = []
+        ids = array('I')
+        for buffer, offsets, segment_ids in self._segments:
+            size = len(offsets)
+            for i, key_id in enumerate(segment_ids):
+                if key_id not in removed:
+                    end = offsets[i + 1] - 1 if i + 1 < size else len(buffer)
+                    keys.append(buffer[offsets[i]:end])
+                    ids.append(key_id)
+        for key, key_id in zip(self._pending_keys, self._pending_ids):
+            if key_id not in removed:
+                keys.append(key)
+                ids.append(key_id)
+        # 已交给后台线程的快照仍引用旧的段，不受影响
+        self._segments = []
+        self._pending_keys = keys
+        self._pending_ids = ids
+        self._removed = set()
+
+    def snapshot(self) -> KeySearchSnapshot:
+        """合并暂存的键并生成只读快照"""
+        if self._pending_keys:
+            offsets = array('Q')
+            position = 0
+            for key in self._pending_keys:
+                offsets.append(position)
+                position += len(key) + 1
+            buffer = self.SEPARATOR.join(self._pending_keys)
+            self._segments.append((buffer, offsets, self._pending_ids))
+            self._pending_keys = []
+            self._pending_ids = array('I')
+        return KeySearchSnapshot(tuple(self._segments), frozenset(self._removed))
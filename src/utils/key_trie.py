@@ -0,0 +1,180 @@
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+import sys
+
+# 键名的层级分隔符
+DELIMITER = ':'
+# 根节点 id
+ROOT = 0
+
+
+class KeyTrie:
+    """
+    按分隔符切分键名的紧凑前缀树
+
+    每个节点用一个整数 id 表示，父节点、子树键数量、是否为真实键等属性
+    分别存放在 array / bytearray 中；节点名称经过 sys.intern 以共享重复的片段，
+    只有文件夹节点才会分配子节点字典。完整键名在需要时沿父节点拼接得到。
+    """
+
+    def __init__(self, delimiter: str = DELIMITER):
+        self.delimiter = delimiter
+        self.clear()
+
+    def clear(self):
+        """清空所有节点"""
+        self._parent = array('i', [-1])
+        self._counts = array('I', [0])     # 子树中真实键的数量
+        self._is_key = bytearray(1)        # 节点本身是否是一个真实存在的键
+        self._labels: List[str] = ['']
+        self._children: List[Optional[Dict[str, int]]] = [None]
+        self.key_count = 0
+
+    def __len__(self) -> int:
+        return self.key_count
+
+    def __contains__(self, key: str) -> bool:
+        node = self.find(key)
+        return node >= 0 and bool(self._is_key[node])
+
+    def add(self, key: str) -> Tuple[int, int]:
+        """
+        插入一个键
+
+        :return: (键对应的节点 id, 本次新建的最上层节点 id)；
+                 键已存在时返回 (-1, -1)，没有新建节点时第二项为 -1
+        """
+        children_of = self._children
+        counts = self._counts
+        node = ROOT
+        created = -1
+        path = [ROOT]
+        for part in key.split(self.delimiter):
+            children = children_of[node]
+            if children is None:
+                children = children_of[node] = {}
+            child = children.get(part)
+            if child is None:
+                child = self._new_node(node, part)
+                children[self._labels[child]] = child
+                if created < 0:
+                    created = child
+            node = child
+            path.append(node)
+
+        if self._is_key[node]:
+            return -1, -1
+        self._is_key[node] = 1
+        self.key_count += 1
+        for ancestor in path:
+            counts[ancestor] += 1
+        return node, created
+
+    def remove(self, key: str) -> Tuple[int, List[int]]:
+        """
+        删除一个键，并裁剪因此变空的文件夹节点
+
+        :return: (键对应的节点 id, 被裁剪掉的节点 id 列表（自下而上）)；
+                 键不存在时返回 (-1, [])
+        """
+        node = self.find(key)
+        if node < 0 or not self._is_key[node]:
+            return -1, []
+        self._is_key[node] = 0
+        self.key_count -= 1
+        ancestor = node
+        while ancestor >= 0:
+            self._counts[ancestor] -= 1
+            ancestor = self._parent[ancestor]
+
+        pruned = []
+        current = node
+        while current != ROOT and not self._children[current] and not self._is_key[current]:
+            parent = self._parent[current]
+            del self._children[parent][self._labels[current]]
+            pruned.append(current)
+            current = parent
+        if not self._children[current]:
+            # 只剩键本身的节点不再保留空的子节点字典
+            self._children[current] = None
+        return node, pruned
+
+    def release(self, nodes: List[int]):
+        """
+        释放 remove() 裁剪掉的节点占用的名称和子节点字典
+
+        节点 id 不会被复用（界面和后台线程的结果中可能仍持有旧 id），
+        每个被裁剪的节点只在几个数组中保留固定大小的槽位。
+        """
+        for node in nodes:
+            self._labels[node] = ''
+            self._children[node] = None
+
+    def _new_node(self, parent: int, label: str) -> int:
+        node = len(self._labels)
+        self._parent.append(parent)
+        self._counts.append(0)
+        self._is_key.append(0)
+        self._labels.append(sys.intern(label))
+        self._children.append(None)
+        return node
+
+    def find(self, key: str) -> int:
+        """查找键或前缀对应的节点 id，不存在时返回 -1"""
+        node = ROOT
+        for part in key.split(self.delimiter):
+            children = self._children[node]
+            if not children or part not in children:
+                return -1
+            node = children[part]
+        return node
+
+    def label(self, node: int) -> str:
+        return self._labels[node]
+
+    def parent(self, node: int) -> int:
+        return self._parent[node]
+
+    def key_count_of(self, node: int) -> int:
+        """节点子树中真实键的数量"""
+        return self._counts[node]
+
+    def is_key(self, node: int) -> bool:
+        return bool(self._is_key[node])
+
+    def has_children(self, node: int) -> bool:
+        return bool(self._children[node])
+
+    def child_count(self, node: int) -> int:
+        children = self._children[node]
+        return len(children) if children else 0
+
+    def children(self, node: int) -> Dict[str, int]:
+        """子节点字典 {名称: 节点 id}（未排序）"""
+        return self._children[node] or {}
+
+    def full_key(self, node: int) -> str:
+        """沿父节点拼接出完整键名"""
+        parts = []
+        while node > ROOT:
+            parts.append(self._labels[node])
+            node = self._parent[node]
+        return self.delimiter.join(reversed(parts))
+
+    def iter_keys(self, node: int = ROOT) -> Iterator[str]:
+        """遍历节点子树中的所有真实键"""
+        for _, key in self.iter_key_nodes(node):
+            yield key
+
+    def iter_key_nodes(self, node: int = ROOT) -> Iterator[Tuple[int, str]]:
+        """遍历节点子树中的所有真实键，产出 (节点 id, 完整键名)"""
+        delimiter = self.delimiter
+        stack = [(node, self.full_key(node))]
+        while stack:
+            current, path = stack.pop()
+            if self._is_key[current]:
+                yield current, path
+            children = self._children[current]
+            if children:
+                prefix = path + delimiter if current != ROOT else ''
+                stack.extend((child, prefix + label) for label, child in children.items())
@@ -0,0 +1,46 @@
+import mmap
+import shutil
+import tempfile
+from typing import Optional
+
+
+class LargeValueBuffer:
+    """
+    大值的磁盘缓冲区
+
+    下载阶段把分块数据顺序写入临时文件，完成后以只读 mmap 映射，
+    查看器按偏移读取需要显示的窗口，整个值不会常驻进程内存。
+    """
+
+    def __init__(self):
+        self._file = tempfile.TemporaryFile()
+        self._map: Optional[mmap.mmap] = None
+        self.size = 0
+
+    def write(self, data: bytes):
+        self._file.write(data)
+
+    def finish(self):
+        """下载完成后建立内存映射"""
+        self._file.flush()
+        self.size = self._file.tell()
+        if self.size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def read(self, offset: int, length: int) -> bytes:
+        """读取 [offset, offset + length) 的字节"""
+        if self._map is None:
+            return b''
+        return self._map[offset:offset + length]
+
+    def save_to(self, path: str):
+        """把缓冲区内容流式复制到文件"""
+        self._file.seek(0)
+        with open(path, 'wb') as output:
+            shutil.copyfileobj(self._file, output)
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
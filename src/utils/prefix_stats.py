@@ -0,0 +1,132 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import heapq
+
+from src.utils.key_trie import DELIMITER
+
+# 默认统计的前缀层级深度、保留的最大键数量
+DEFAULT_MAX_DEPTH = 3
+DEFAULT_TOP_N = 100
+# TTL 分桶：(名称, 剩余秒数上限)，永不过期的键单独计数
+TTL_BUCKETS = [
+    ("1小时内", 3600),
+    ("1天内", 86400),
+    ("7天内", 7 * 86400),
+    ("7天以上", None),
+]
+NO_EXPIRY = "永不过期"
+TTL_BUCKET_NAMES = [NO_EXPIRY] + [name for name, _ in TTL_BUCKETS]
+
+
+def ttl_bucket(ttl: Optional[int]) -> str:
+    """TTL（秒）所属的分桶名称"""
+    if ttl is None or ttl < 0:
+        return NO_EXPIRY
+    for name, limit in TTL_BUCKETS:
+        if limit is None or ttl < limit:
+            return name
+    return TTL_BUCKETS[-1][0]
+
+
+@dataclass
+class PrefixEntry:
+    """一个前缀下所有键的汇总"""
+    prefix: str
+    depth: int
+    keys: int = 0
+    bytes: int = 0
+    max_size: int = 0
+    types: Dict[str, int] = field(default_factory=dict)        # 类型 -> 键数量
+    ttl_buckets: Dict[str, int] = field(default_factory=dict)  # TTL 分桶 -> 键数量
+
+    @property
+    def avg_size(self) -> float:
+        return self.bytes / self.keys if self.keys else 0.0
+
+    def main_type(self) -> str:
+        """键数量最多的类型"""
+        return max(self.types, key=self.types.get) if self.types else ""
+
+    def copy(self) -> "PrefixEntry":
+        return PrefixEntry(self.prefix, self.depth, self.keys, self.bytes, self.max_size,
+                           dict(self.types), dict(self.ttl_buckets))
+
+
+@dataclass(order=True)
+class BigKey:
+    """占用内存最多的键之一"""
+    size: int
+    key: str = field(compare=False)
+    key_type: str = field(compare=False)
+    ttl: Optional[int] = field(default=None, compare=False)
+
+
+class PrefixStats:
+    """
+    按键名前缀汇总内存占用
+
+    前缀与键树的文件夹一致（按分隔符切分，去掉最后一段），只统计到 max_depth 层，
+    更深的键计入最深一层的前缀，因此内存占用只与前缀数量有关，与键的数量无关。
+    没有分隔符的键只计入总计。另用一个小顶堆保留最大的 top_n 个键。
+    """
+
+    def __init__(self, delimiter: str = DELIMITER,
+                 max_depth: int = DEFAULT_MAX_DEPTH,
+                 top_n: int = DEFAULT_TOP_N):
+        self.delimiter = delimiter
+        self.max_depth = max_depth
+        self.top_n = top_n
+        self.total = PrefixEntry("", 0)
+        self._prefixes: Dict[str, PrefixEntry] = {}
+        self._heap: List[BigKey] = []
+
+    def __len__(self) -> int:
+        return self.total.keys
+
+    def add(self, key: str, key_type: str, size: int, ttl: Optional[int] = None):
+        """统计一个键；size 为字节数，ttl 为剩余秒数（-1 或 None 表示永不过期）"""
+        bucket = ttl_bucket(ttl)
+        self._count(self.total, key_type, size, bucket)
+
+        parts = key.split(self.delimiter, self.max_depth)
+        depth = min(len(parts) - 1, self.max_depth)
+        prefix = ''
+        for level in range(depth):
+            prefix = prefix + self.delimiter + parts[level] if level else parts[0]
+            entry = self._prefixes.get(prefix)
+            if entry is None:
+                entry = self._prefixes[prefix] = PrefixEntry(prefix, level + 1)
+            self._count(entry, key_type, size, bucket)
+
+        if len(self._heap) < self.top_n:
+            heapq.heappush(self._heap, BigKey(size, key, key_type, ttl))
+        elif size > self._heap[0].size:
+            heapq.heapreplace(self._heap, BigKey(size, key, key_type, ttl))
+
+    @staticmethod
+    def _count(entry: PrefixEntry, key_type: str, size: int, bucket: str):
+        entry.keys += 1
+        entry.bytes += size
+        if size > entry.max_size:
+            entry.max_size = size
+        entry.types[key_type] = entry.types.get(key_type, 0) + 1
+        entry.ttl_buckets[bucket] = entry.ttl_buckets.get(bucket, 0) + 1
+
+    def prefixes(self) -> List[PrefixEntry]:
+        """所有前缀的汇总（副本，可在其他线程中使用）"""
+        return [entry.copy() for entry in self._prefixes.values()]
+
+    def top_keys(self) -> List[BigKey]:
+        """最大的键，按大小降序"""
+        return sorted(self._heap, reverse=True)
+
+    def snapshot(self) -> "PrefixStatsSnapshot":
+        return PrefixStatsSnapshot(self.total.copy(), self.prefixes(), self.top_keys())
+
+
+@dataclass
+class PrefixStatsSnapshot:
+    """某一时刻的统计结果，供界面线程显示"""
+    total: PrefixEntry
+    prefixes: List[PrefixEntry]
+    top_keys: List[BigKey]
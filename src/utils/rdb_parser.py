@@ -0,0 +1,381 @@
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional
+import mmap
+import os
+import struct
+
+# 特殊操作码
+OPCODE_SLOT_INFO = 0xF4
+OPCODE_FUNCTION2 = 0xF5
+OPCODE_FUNCTION_PRE_GA = 0xF6
+OPCODE_MODULE_AUX = 0xF7
+OPCODE_IDLE = 0xF8
+OPCODE_FREQ = 0xF9
+OPCODE_AUX = 0xFA
+OPCODE_RESIZEDB = 0xFB
+OPCODE_EXPIRETIME_MS = 0xFC
+OPCODE_EXPIRETIME = 0xFD
+OPCODE_SELECTDB = 0xFE
+OPCODE_EOF = 0xFF
+
+# 值类型编号 -> Redis 数据类型
+VALUE_TYPES = {
+    0: 'string',
+    1: 'list', 10: 'list', 14: 'list', 18: 'list',
+    2: 'set', 11: 'set', 20: 'set',
+    3: 'zset', 5: 'zset', 12: 'zset', 17: 'zset',
+    4: 'hash', 9: 'hash', 13: 'hash', 16: 'hash', 24: 'hash', 25: 'hash',
+    15: 'stream', 19: 'stream', 21: 'stream',
+    7: 'module',
+}
+# 整个值为一个字符串（ziplist/listpack/intset 等紧凑编码）的类型
+BLOB_TYPES = {0, 9, 10, 11, 12, 13, 16, 17, 20}
+
+# 长度编码中的特殊字符串编码
+ENCODING_INT8 = 0
+ENCODING_INT16 = 1
+ENCODING_INT32 = 2
+ENCODING_LZF = 3
+
+# 模块值中的操作码
+MODULE_OPCODE_EOF = 0
+MODULE_OPCODE_SINT = 1
+MODULE_OPCODE_UINT = 2
+MODULE_OPCODE_FLOAT = 3
+MODULE_OPCODE_DOUBLE = 4
+MODULE_OPCODE_STRING = 5
+
+# 流的消息 ID 在 PEL 中以 16 字节原始数据保存
+STREAM_ID_SIZE = 16
+
+
+class RdbError(Exception):
+    """RDB 文件格式错误或包含不支持的数据"""
+
+
+@dataclass
+class RdbEntry:
+    """RDB 文件中的一个键"""
+    db: int
+    key: bytes
+    key_type: str
+    size: int                  # 值序列化后占用的字节数
+    expire_ms: Optional[int]   # 过期时间（Unix 毫秒），None 表示永不过期
+
+
+def lzf_decompress(data: bytes, expected_length: int) -> bytes:
+    """解压 LZF 压缩的字符串（只用于键名和辅助字段，值不需要解压）"""
+    output = bytearray()
+    i = 0
+    size = len(data)
+    try:
+        while i < size:
+            ctrl = data[i]
+            i += 1
+            if ctrl < 32:
+                # 字面量：后面 ctrl + 1 个字节原样复制
+                if i + ctrl + 1 > size:
+                    raise RdbError("LZF 数据损坏")
+                output += data[i:i + ctrl + 1]
+                i += ctrl + 1
+                continue
+            length = ctrl >> 5
+            if length == 7:
+                length += data[i]
+                i += 1
+            ref = len(output) - ((ctrl & 0x1F) << 8) - data[i] - 1
+            i += 1
+            if ref < 0:
+                raise RdbError("LZF 数据损坏")
+            # 引用区间可能与输出重叠，逐字节复制
+            for _ in range(length + 2):
+                output.append(output[ref])
+                ref += 1
+    except IndexError:
+        # 压缩数据在控制字节之后被截断
+        raise RdbError("LZF 数据损坏")
+    if len(output) != expected_length:
+        raise RdbError("LZF 解压后的长度不符")
+    return bytes(output)
+
+
+class RdbParser:
+    """
+    流式 RDB 解析器
+
+    通过 mmap 按需读取文件，值只跳过不解码，任一时刻只持有当前键名，
+    因此内存占用与文件大小无关。支持到 Redis 7.4 的 RDB 格式（版本 12）。
+
+    用法::
+
+        with RdbParser(path) as parser:
+            for entry in parser.entries():
+                ...
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.size = os.path.getsize(path)
+        self.version = 0
+        self.aux: Dict[str, str] = {}  # 辅助字段，如 redis-ver、ctime、used-mem
+        self.position = 0
+        self._buf = None
+        self._file = open(path, 'rb')
+        try:
+            if self.size == 0:
+                raise RdbError("文件为空")
+            self._buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._buf is not None:
+            self._buf.close()
+            self._buf = None
+        self._file.close()
+
+    def snapshot_time_ms(self) -> int:
+        """生成快照的时间：优先使用 ctime 辅助字段，否则使用文件修改时间"""
+        ctime = self.aux.get('ctime')
+        if ctime and ctime.lstrip('-').isdigit():
+            return int(ctime) * 1000
+        return int(os.path.getmtime(self.path) * 1000)
+
+    # ---- 遍历 ----
+
+    def entries(self) -> Iterator[RdbEntry]:
+        """
+        按文件顺序逐个返回键；遇到 EOF 操作码结束
+
+        文件损坏时抛出 RdbError（解码过程中的 IndexError/struct.error 等也转换为 RdbError）
+        """
+        try:
+            yield from self._entries()
+        except (IndexError, struct.error, OverflowError, ValueError) as e:
+            raise RdbError(f"文件已损坏（偏移 {self.position}）: {str(e)}") from e
+
+    def _entries(self) -> Iterator[RdbEntry]:
+        self.position = 0
+        magic = self._read(9)
+        if magic[:5] != b'REDIS' or not magic[5:].isdigit():
+            raise RdbError("不是有效的 RDB 文件")
+        self.version = int(magic[5:])
+
+        db = 0
+        expire_ms = None
+        while True:
+            opcode = self._byte()
+            if opcode == OPCODE_EOF:
+                return
+            if opcode == OPCODE_SELECTDB:
+                db = self._length()
+            elif opcode == OPCODE_RESIZEDB:
+                self._length()
+                self._length()
+            elif opcode == OPCODE_AUX:
+                name = self._string().decode('utf-8', errors='replace')
+                self.aux[name] = self._string().decode('utf-8', errors='replace')
+            elif opcode == OPCODE_EXPIRETIME_MS:
+                expire_ms = struct.unpack('<q', self._read(8))[0]
+            elif opcode == OPCODE_EXPIRETIME:
+                expire_ms = struct.unpack('<i', self._read(4))[0] * 1000
+            elif opcode == OPCODE_FREQ:
+                self._skip(1)
+            elif opcode == OPCODE_IDLE:
+                self._length()
+            elif opcode == OPCODE_SLOT_INFO:
+                self._length()
+                self._length()
+                self._length()
+            elif opcode == OPCODE_FUNCTION2:
+                self._skip_string()
+            elif opcode == OPCODE_FUNCTION_PRE_GA:
+                raise RdbError("不支持 Redis 7.0 预发布版本保存的函数数据")
+            elif opcode == OPCODE_MODULE_AUX:
+                self._length()  # 模块 id
+                self._length()  # when_opcode
+                self._length()  # when
+                self._skip_module_payload()
+            elif opcode in VALUE_TYPES:
+                key = self._string()
+                start = self.position
+                self._skip_value(opcode)
+                yield RdbEntry(db, key, VALUE_TYPES[opcode], self.position - start, expire_ms)
+                expire_ms = None
+            else:
+                raise RdbError(f"不支持的操作码或值类型 {opcode}（偏移 {self.position - 1}）")
+
+    # ---- 基本读取 ----
+
+    def _read(self, n: int) -> bytes:
+        end = self.position + n
+        if end > self.size:
+            raise RdbError("文件意外结束")
+        data = self._buf[self.position:end]
+        self.position = end
+        return data
+
+    def _skip(self, n: int):
+        self.position += n
+        if self.position > self.size:
+            raise RdbError("文件意外结束")
+
+    def _byte(self) -> int:
+        if self.position >= self.size:
+            raise RdbError("文件意外结束")
+        value = self._buf[self.position]
+        self.position += 1
+        return value
+
+    def _length_or_encoding(self):
+        """读取长度；返回 (长度或特殊编码, 是否为特殊编码)"""
+        first = self._byte()
+        kind = first >> 6
+        if kind == 0:
+            return first & 0x3F, False
+        if kind == 1:
+            return ((first & 0x3F) << 8) | self._byte(), False
+        if kind == 3:
+            return first & 0x3F, True
+        if first == 0x80:
+            return struct.unpack('>I', self._read(4))[0], False
+        if first == 0x81:
+            return struct.unpack('>Q', self._read(8))[0], False
+        raise RdbError(f"无效的长度编码 {first:#x}（偏移 {self.position - 1}）")
+
+    def _length(self) -> int:
+        value, encoded = self._length_or_encoding()
+        if encoded:
+            raise RdbError(f"此处不应出现字符串编码（偏移 {self.position - 1}）")
+        return value
+
+    def _string(self) -> bytes:
+        """读取一个字符串（整数编码的字符串转换为十进制文本）"""
+        value, encoded = self._length_or_encoding()
+        if not encoded:
+            return self._read(value)
+        if value == ENCODING_INT8:
+            return str(struct.unpack('<b', self._read(1))[0]).encode()
+        if value == ENCODING_INT16:
+            return str(struct.unpack('<h', self._read(2))[0]).encode()
+        if value == ENCODING_INT32:
+            return str(struct.unpack('<i', self._read(4))[0]).encode()
+        if value == ENCODING_LZF:
+            compressed_length = self._length()
+            length = self._length()
+            return lzf_decompress(self._read(compressed_length), length)
+        raise RdbError(f"未知的字符串编码 {value}")
+
+    def _skip_string(self):
+        value, encoded = self._length_or_encoding()
+        if not encoded:
+            self._skip(value)
+        elif value == ENCODING_INT8:
+            self._skip(1)
+        elif value == ENCODING_INT16:
+            self._skip(2)
+        elif value == ENCODING_INT32:
+            self._skip(4)
+        elif value == ENCODING_LZF:
+            compressed_length = self._length()
+            self._length()
+            self._skip(compressed_length)
+        else:
+            raise RdbError(f"未知的字符串编码 {value}")
+
+    # ---- 跳过值 ----
+
+    def _skip_value(self, value_type: int):
+        if value_type in BLOB_TYPES:
+            self._skip_string()
+        elif value_type in (1, 2, 14):
+            # 链表 / 集合 / quicklist（每个节点是一个 ziplist）
+            for _ in range(self._length()):
+                self._skip_string()
+        elif value_type == 18:
+            # quicklist 2：每个节点带容器类型
+            for _ in range(self._length()):
+                self._length()
+                self._skip_string()
+        elif value_type == 3:
+            # 旧格式有序集合：分数以字符串保存，253/254/255 表示 nan/+inf/-inf
+            for _ in range(self._length()):
+                self._skip_string()
+                score_length = self._byte()
+                if score_length < 253:
+                    self._skip(score_length)
+        elif value_type == 5:
+            for _ in range(self._length()):
+                self._skip_string()
+                self._skip(8)
+        elif value_type == 4:
+            for _ in range(self._length() * 2):
+                self._skip_string()
+        elif value_type == 24:
+            # 带字段过期时间的哈希：最小过期时间，之后每个字段为 (ttl, 字段, 值)
+            self._skip(8)
+            for _ in range(self._length()):
+                self._length()
+                self._skip_string()
+                self._skip_string()
+        elif value_type == 25:
+            self._skip(8)
+            self._skip_string()
+        elif value_type in (15, 19, 21):
+            self._skip_stream(value_type)
+        elif value_type == 7:
+            self._length()  # 模块 id
+            self._skip_module_payload()
+        else:
+            raise RdbError(f"不支持的值类型 {value_type}")
+
+    def _skip_module_payload(self):
+        """跳过 MODULE_2 格式的模块数据（以操作码标注每个字段）"""
+        while True:
+            opcode = self._length()
+            if opcode == MODULE_OPCODE_EOF:
+                return
+            if opcode in (MODULE_OPCODE_SINT, MODULE_OPCODE_UINT):
+                self._length()
+            elif opcode == MODULE_OPCODE_FLOAT:
+                self._skip(4)
+            elif opcode == MODULE_OPCODE_DOUBLE:
+                self._skip(8)
+            elif opcode == MODULE_OPCODE_STRING:
+                self._skip_string()
+            else:
+                raise RdbError(f"未知的模块数据操作码 {opcode}")
+
+    def _skip_stream(self, value_type: int):
+        version = {15: 1, 19: 2, 21: 3}[value_type]
+        for _ in range(self._length()):
+            self._skip_string()  # 节点的主 ID
+            self._skip_string()  # listpack
+        self._length()  # 消息数量
+        self._length()  # last_id
+        self._length()
+        if version >= 2:
+            for _ in range(5):  # first_id, max_deleted_entry_id, entries_added
+                self._length()
+        for _ in range(self._length()):  # 消费组
+            self._skip_string()
+            self._length()  # last_id
+            self._length()
+            if version >= 2:
+                self._length()  # entries_read
+            for _ in range(self._length()):  # 消费组 PEL：ID、投递时间、投递次数
+                self._skip(STREAM_ID_SIZE + 8)
+                self._length()
+            for _ in range(self._length()):  # 消费者
+                self._skip_string()
+                self._skip(8)  # seen_time
+                if version >= 3:
+                    self._skip(8)  # active_time
+                self._skip(self._length() * STREAM_ID_SIZE)
@@ -0,0 +1,54 @@
+from array import array
+from typing import Iterator
+
+
+class RingBuffer:
+    """
+    定长环形缓冲区
+
+    数值存放在预先分配的 array 中，写满后覆盖最旧的数据，长时间运行内存也不会增长。
+    下标 0 为最旧的元素，-1 为最新的元素；支持 len() 和下标访问，可直接用于 bisect。
+    """
+
+    def __init__(self, capacity: int, typecode: str = 'd'):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._data = array(typecode, [0]) * capacity
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, value):
+        end = self._start + self._size
+        if self._size < self.capacity:
+            self._data[end % self.capacity] = value
+            self._size += 1
+        else:
+            self._data[self._start] = value
+            self._start = (self._start + 1) % self.capacity
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ring buffer index out of range")
+        return self._data[(self._start + index) % self.capacity]
+
+    def __iter__(self) -> Iterator:
+        end = self._start + self._size
+        if end <= self.capacity:
+            yield from self._data[self._start:end]
+        else:
+            yield from self._data[self._start:]
+            yield from self._data[:end - self.capacity]
+
+    def latest(self, default=None):
+        """最新的元素，为空时返回 default"""
+        return self[-1] if self._size else default
+
+    def clear(self):
+        self._start = 0
+        self._size = 0
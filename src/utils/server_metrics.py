@@ -0,0 +1,118 @@
+from typing import Dict, Optional, Tuple
+import math
+
+from src.utils.ring_buffer import RingBuffer
+
+# 默认保留的采样点数量（每秒采样时约 1 小时）
+DEFAULT_HISTORY_SIZE = 3600
+# 监控的指标：(名称, 显示名称, 单位)，单位决定界面上的格式化方式
+METRICS = (
+    ('ops_per_sec', "每秒操作数", 'rate'),
+    ('hit_ratio', "命中率", 'percent'),
+    ('used_memory', "已用内存", 'bytes'),
+    ('used_memory_peak', "内存峰值", 'bytes'),
+    ('fragmentation', "内存碎片率", 'ratio'),
+    ('connected_clients', "客户端连接数", 'count'),
+    ('evicted_per_sec', "每秒驱逐键数", 'rate'),
+    ('expired_per_sec', "每秒过期键数", 'rate'),
+    ('repl_lag', "复制偏移量延迟", 'bytes'),
+)
+# 需要按相邻两次采样的差值计算的累计计数器
+COUNTERS = ('total_commands_processed', 'keyspace_hits', 'keyspace_misses',
+            'evicted_keys', 'expired_keys')
+# 无法计算的值（首次采样的速率、没有从节点的延迟等）记为 NaN，图表中显示为断开
+MISSING = math.nan
+
+
+def _replication_lag(info: dict) -> float:
+    """主节点：主偏移量与最慢的从节点偏移量之差（字节）；其他情况无法计算"""
+    if info.get('role') != 'master':
+        return MISSING
+    offsets = [replica.get('offset', 0) for name, replica in info.items()
+               if name.startswith('slave') and isinstance(replica, dict)]
+    if not offsets:
+        return MISSING
+    return max(0, info.get('master_repl_offset', 0) - min(offsets))
+
+
+def derive_metrics(info: dict, previous: Optional[Dict[str, int]],
+                   elapsed: float) -> Tuple[Dict[str, float], Dict[str, int]]:
+    """
+    从一次 INFO 的结果计算各项指标
+
+    :param previous: 上一次采样的计数器（首次采样为 None）
+    :param elapsed: 距上一次采样的秒数
+    :return: (指标名称 -> 值, 本次采样的计数器)
+    """
+    counters = {name: int(info.get(name, 0)) for name in COUNTERS}
+    deltas = None
+    if previous is not None and elapsed > 0:
+        deltas = {name: counters[name] - previous[name] for name in COUNTERS}
+        # 计数器变小说明服务器重启或执行了 CONFIG RESETSTAT
+        if any(delta < 0 for delta in deltas.values()):
+            deltas = None
+
+    def rate(name):
+        return deltas[name] / elapsed if deltas is not None else MISSING
+
+    hit_ratio = MISSING
+    if deltas is not None:
+        lookups = deltas['keyspace_hits'] + deltas['keyspace_misses']
+        if lookups:
+            hit_ratio = deltas['keyspace_hits'] * 100 / lookups
+
+    values = {
+        'ops_per_sec': rate('total_commands_processed'),
+        'hit_ratio': hit_ratio,
+        'used_memory': float(info.get('used_memory', MISSING)),
+        'used_memory_peak': float(info.get('used_memory_peak', MISSING)),
+        'fragmentation': float(info.get('mem_fragmentation_ratio', MISSING)),
+        'connected_clients': float(info.get('connected_clients', MISSING)),
+        'evicted_per_sec': rate('evicted_keys'),
+        'expired_per_sec': rate('expired_keys'),
+        'repl_lag': _replication_lag(info),
+    }
+    return values, counters
+
+
+class MetricHistory:
+    """
+    一个服务器的指标历史
+
+    采样时间和每项指标各存放在一个 RingBuffer 中，容量固定；INFO 的原始结果
+    不会保留，只记录计算速率需要的计数器和少量概要信息。
+    """
+
+    def __init__(self, capacity: int = DEFAULT_HISTORY_SIZE):
+        self.times = RingBuffer(capacity)
+        self.series: Dict[str, RingBuffer] = {name: RingBuffer(capacity) for name, _, _ in METRICS}
+        self.summary: Dict[str, str] = {}  # 版本、角色、运行时间等
+        self._counters = None
+        self._last_time = None
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def add(self, timestamp: float, info: dict):
+        """记录一次采样，timestamp 为 time.monotonic() 的值"""
+        elapsed = timestamp - self._last_time if self._last_time is not None else 0.0
+        values, self._counters = derive_metrics(info, self._counters, elapsed)
+        self._last_time = timestamp
+        self.times.append(timestamp)
+        for name, value in values.items():
+            self.series[name].append(value)
+        self.summary = {
+            'version': str(info.get('redis_version', '')),
+            'role': str(info.get('role', '')),
+            'uptime': int(info.get('uptime_in_seconds', 0)),
+        }
+
+    def latest(self, name: str) -> float:
+        return self.series[name].latest(MISSING)
+
+    def clear(self):
+        self.times.clear()
+        for buffer in self.series.values():
+            buffer.clear()
+        self._counters = None
+        self._last_time = None
@@ -0,0 +1,149 @@
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+import random
+import re
+
+from src.utils.key_trie import DELIMITER
+
+# 键名中保留的层级数量（超出部分以通配符表示）
+DEFAULT_PREFIX_DEPTH = 3
+# 每个分组最多保留的耗时样本数，超过后按蓄水池抽样替换，次数和总耗时仍精确统计
+MAX_SAMPLES_PER_GROUP = 10000
+PLACEHOLDER = '*'
+# 视为 ID 的键名片段：纯数字、较长的十六进制串、UUID
+_ID_SEGMENT = re.compile(r'^(?:\d+|[0-9a-fA-F]{8,}|[0-9a-fA-F]{8}(?:-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12})$')
+# 服务器截断过长参数时追加的说明
+_TRUNCATED_SUFFIX = re.compile(r'\.\.\. \(\d+ more bytes\)$')
+
+# 不带键的命令
+NO_KEY_COMMANDS = frozenset({
+    'AUTH', 'BGREWRITEAOF', 'BGSAVE', 'DBSIZE', 'DISCARD', 'ECHO', 'EXEC', 'FLUSHALL',
+    'FLUSHDB', 'HELLO', 'INFO', 'KEYS', 'LASTSAVE', 'MONITOR', 'MULTI', 'PING', 'PSUBSCRIBE',
+    'PUBLISH', 'PUNSUBSCRIBE', 'QUIT', 'RANDOMKEY', 'READONLY', 'READWRITE', 'RESET', 'ROLE',
+    'SAVE', 'SCAN', 'SELECT', 'SHUTDOWN', 'SLAVEOF', 'REPLICAOF', 'SUBSCRIBE', 'SWAPDB',
+    'SYNC', 'PSYNC', 'TIME', 'UNSUBSCRIBE', 'UNWATCH', 'WAIT',
+})
+# 带子命令的命令：分组时包含子命令，值为第一个参数是键的子命令
+SUBCOMMAND_COMMANDS = {
+    'ACL': (), 'CLIENT': (), 'CLUSTER': (), 'COMMAND': (), 'CONFIG': (), 'FUNCTION': (),
+    'LATENCY': (), 'MODULE': (), 'PUBSUB': (), 'SCRIPT': (), 'SLOWLOG': (),
+    'DEBUG': ('OBJECT',),
+    'MEMORY': ('USAGE',),
+    'OBJECT': ('ENCODING', 'FREQ', 'IDLETIME', 'REFCOUNT'),
+    'XGROUP': ('CREATE', 'CREATECONSUMER', 'DELCONSUMER', 'DESTROY', 'SETID'),
+    'XINFO': ('CONSUMERS', 'GROUPS', 'STREAM'),
+}
+# 第 2 个参数为键的数量、之后为键的命令
+NUMKEYS_COMMANDS = frozenset({'EVAL', 'EVALSHA', 'EVAL_RO', 'EVALSHA_RO', 'FCALL', 'FCALL_RO'})
+
+
+def command_and_key(args: List[str]) -> Tuple[str, Optional[str]]:
+    """从 SLOWLOG 记录的参数中取出命令名（含子命令）和第一个键"""
+    if not args:
+        return '', None
+    command = args[0].upper()
+    if command in SUBCOMMAND_COMMANDS:
+        if len(args) < 2:
+            return command, None
+        sub = args[1].upper()
+        key = args[2] if sub in SUBCOMMAND_COMMANDS[command] and len(args) > 2 else None
+        return f"{command} {sub}", key
+    if command in NO_KEY_COMMANDS:
+        return command, None
+    if command in NUMKEYS_COMMANDS:
+        if len(args) > 3 and args[2].isdigit() and int(args[2]) > 0:
+            return command, args[3]
+        return command, None
+    return command, args[1] if len(args) > 1 else None
+
+
+def normalize_key(key: str, delimiter: str = DELIMITER, max_depth: int = DEFAULT_PREFIX_DEPTH) -> str:
+    """
+    把键名归一化为前缀：ID 类片段替换为通配符，只保留前 max_depth 层
+
+    例如 "user:1001:profile" -> "user:*:profile"，"session:9f86d081884c7d65" -> "session:*"
+    """
+    key = _TRUNCATED_SUFFIX.sub('', key)
+    parts = key.split(delimiter) if delimiter else [key]
+    normalized = [PLACEHOLDER if _ID_SEGMENT.match(part) else part for part in parts[:max_depth]]
+    if len(parts) > max_depth:
+        normalized.append(PLACEHOLDER)
+    return delimiter.join(normalized)
+
+
+def percentile(sorted_values, q: float) -> float:
+    """已排序数据的百分位数（最近秩法），q 取 0-100"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+
+@dataclass
+class SlowlogGroup:
+    """同一命令、同一键前缀的慢查询汇总"""
+    command: str
+    prefix: str
+    count: int = 0
+    total: int = 0          # 总耗时（微秒）
+    max_duration: int = 0
+    last_seen: int = 0      # 最近一次的时间戳
+    samples: array = field(default_factory=lambda: array('q'))
+    _sorted: Optional[List[int]] = field(default=None, repr=False)
+
+    def add(self, duration: int, timestamp: int):
+        self.count += 1
+        self.total += duration
+        self.max_duration = max(self.max_duration, duration)
+        self.last_seen = max(self.last_seen, timestamp)
+        if len(self.samples) < MAX_SAMPLES_PER_GROUP:
+            self.samples.append(duration)
+        else:
+            index = random.randrange(self.count)
+            if index < MAX_SAMPLES_PER_GROUP:
+                self.samples[index] = duration
+        self._sorted = None
+
+    @property
+    def average(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        if self._sorted is None:
+            self._sorted = sorted(self.samples)
+        return percentile(self._sorted, q)
+
+
+class SlowlogStats:
+    """按 (命令, 归一化的键前缀) 汇总 SLOWLOG 记录"""
+
+    def __init__(self, delimiter: str = DELIMITER, prefix_depth: int = DEFAULT_PREFIX_DEPTH):
+        self.delimiter = delimiter
+        self.prefix_depth = prefix_depth
+        self.entries = 0
+        self.total = 0
+        self._groups: Dict[Tuple[str, str], SlowlogGroup] = {}
+
+    def add(self, entry):
+        """entry 需具有 args、duration、timestamp 属性（RedisClient.SlowlogEntry）"""
+        command, key = command_and_key(entry.args)
+        prefix = normalize_key(key, self.delimiter, self.prefix_depth) if key is not None else ''
+        group = self._groups.get((command, prefix))
+        if group is None:
+            group = self._groups[(command, prefix)] = SlowlogGroup(command, prefix)
+        group.add(entry.duration, entry.timestamp)
+        self.entries += 1
+        self.total += entry.duration
+
+    def extend(self, entries: Iterable):
+        for entry in entries:
+            self.add(entry)
+
+    def groups(self) -> List[SlowlogGroup]:
+        return list(self._groups.values())
+
+    def clear(self):
+        self.entries = 0
+        self.total = 0
+        self._groups.clear()
@@ -0,0 +1,154 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional
+import sys
+import threading
+import time
+
+# 默认的缓存容量（字节）
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+# 记录失效版本号的缓存键数量上限，更早的记录合并为一个下限
+MAX_INVALIDATION_STAMPS = 10000
+
+
+@dataclass
+class CachedValue:
+    """
+    缓存的键值
+
+    集合类型只缓存第一页，cursor/total 与 ValuePage 的含义相同。
+    """
+    key_type: str
+    ttl: int
+    value: Any
+    cursor: int = 0
+    total: int = 0
+    size: int = 0
+    fetched_at: float = 0.0
+
+    def remaining_ttl(self) -> int:
+        """按缓存后经过的时间推算剩余 TTL"""
+        if self.ttl < 0:
+            return self.ttl
+        return max(0, self.ttl - int(time.monotonic() - self.fetched_at))
+
+
+def estimate_size(value: Any) -> int:
+    """粗略估算解码后值占用的内存"""
+    if isinstance(value, (str, bytes)):
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class ValueCache:
+    """
+    按总字节数限制容量的 LRU 值缓存
+
+    缓存键由调用方决定（通常为 (host, port, db, key)）。数据可能由后台线程写入，
+    所有操作都在锁内完成。
+
+    每次失效都会递增版本号。读取方在读 Redis 之前调用 version()，写入缓存时
+    传给 put()；期间该键被失效过（例如被写操作修改）时放弃写入，避免旧值回填。
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, CachedValue]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._version = 0
+        self._invalidated: "OrderedDict[Hashable, int]" = OrderedDict()  # 缓存键 -> 失效时的版本号
+        self._invalidated_floor = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, cache_key: Hashable, max_age: float = None) -> Optional[CachedValue]:
+        """
+        读取缓存，命中时移到最近使用的位置
+
+        :param max_age: 缓存超过该秒数视为过期，None 表示不限制
+        """
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return None
+            age = time.monotonic() - entry.fetched_at
+            expired = entry.ttl >= 0 and age >= entry.ttl
+            if expired or (max_age is not None and age > max_age):
+                self._remove(cache_key)
+                return None
+            self._entries.move_to_end(cache_key)
+            return entry
+
+    def version(self) -> int:
+        """当前版本号，读取值之前获取"""
+        with self._lock:
+            return self._version
+
+    def put(self, cache_key: Hashable, entry: CachedValue, version: int = None):
+        """
+        写入缓存，超出容量时淘汰最久未使用的条目；单个值超过容量时不缓存
+
+        :param version: 读取值之前的 version()，之后该键被失效过时不写入
+        """
+        if not entry.size:
+            entry.size = estimate_size(entry.value)
+        if not entry.fetched_at:
+            entry.fetched_at = time.monotonic()
+        with self._lock:
+            if version is not None and self._invalidated.get(cache_key, self._invalidated_floor) > version:
+                return
+            self._remove(cache_key)
+            if entry.size > self.max_bytes:
+                return
+            self._entries[cache_key] = entry
+            self._bytes += entry.size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def contains(self, cache_key: Hashable) -> bool:
+        with self._lock:
+            return cache_key in self._entries
+
+    def invalidate(self, cache_key: Hashable):
+        with self._lock:
+            self._remove(cache_key)
+            self._version += 1
+            self._invalidated[cache_key] = self._version
+            self._invalidated.move_to_end(cache_key)
+            if len(self._invalidated) > MAX_INVALIDATION_STAMPS:
+                _, self._invalidated_floor = self._invalidated.popitem(last=False)
+
+    def invalidate_where(self, predicate):
+        """删除缓存键满足条件的所有条目；进行中的读取一律不再写入"""
+        with self._lock:
+            for cache_key in [k for k in self._entries if predicate(k)]:
+                self._remove(cache_key)
+            self._invalidate_all()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._invalidate_all()
+
+    def _invalidate_all(self):
+        self._version += 1
+        self._invalidated.clear()
+        self._invalidated_floor = self._version
+
+    def _remove(self, cache_key: Hashable):
+        entry = self._entries.pop(cache_key, None)
+        if entry is not None:
+            self._bytes -= entry.size
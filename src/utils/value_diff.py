@@ -0,0 +1,61 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass
+class ValueDelta:
+    """
+    集合类型值的增量修改
+
+    hash: updates 为 {字段: 值}，removals 为字段列表
+    set:  updates 为新增成员列表，removals 为删除的成员列表
+    zset: updates 为 {成员: 分数}，removals 为删除的成员列表
+    list: updates 为 {原索引: 值}，removals 为删除的原索引列表，appends 为追加到末尾的值
+    """
+    updates: Any = None
+    removals: List[Any] = field(default_factory=list)
+    appends: List[Any] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.updates and not self.removals and not self.appends
+
+    def change_count(self) -> int:
+        return len(self.updates or ()) + len(self.removals) + len(self.appends)
+
+
+def diff_mapping(original: Dict[Any, Any], current: Iterable[Tuple[Any, Any]]) -> ValueDelta:
+    """比较哈希 / 有序集合：只考虑已加载的部分，未加载的元素不受影响"""
+    current = dict(current)
+    updates = {name: value for name, value in current.items()
+               if name not in original or original[name] != value}
+    removals = [name for name in original if name not in current]
+    return ValueDelta(updates=updates, removals=removals)
+
+
+def diff_members(original: Iterable[Any], current: Iterable[Any]) -> ValueDelta:
+    """比较集合成员"""
+    original = set(original)
+    current = set(current)
+    return ValueDelta(updates=list(current - original), removals=list(original - current))
+
+
+def diff_list(original: Dict[int, Any], current: Iterable[Tuple[Optional[int], Any]]) -> ValueDelta:
+    """
+    比较列表
+
+    :param original: 已加载元素 {原索引: 值}
+    :param current: 当前行 (原索引, 值)，新增的行原索引为 None
+    """
+    updates = {}
+    appends = []
+    kept = set()
+    for index, value in current:
+        if index is None:
+            appends.append(value)
+            continue
+        kept.add(index)
+        if original.get(index) != value:
+            updates[index] = value
+    removals = sorted(index for index in original if index not in kept)
+    return ValueDelta(updates=updates, removals=removals, appends=appends)
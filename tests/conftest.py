@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 添加项目根目录到Python路径，使测试可以导入 src 包
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
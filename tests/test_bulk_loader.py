@@ -0,0 +1,130 @@
+import json
+
+import pytest
+
+from src.utils.bulk_loader import BulkLoader, LoadMapping, RowError, RowReader
+
+
+def test_validate_rejects_incomplete_mappings():
+    with pytest.raises(ValueError):
+        LoadMapping('').validate()
+    with pytest.raises(ValueError):
+        LoadMapping('k', key_type='stream').validate()
+    with pytest.raises(ValueError):
+        LoadMapping('k', key_type='list').validate()
+    with pytest.raises(ValueError):
+        LoadMapping('k', key_type='zset', value_field='member').validate()
+
+
+def test_string_uses_value_field_or_whole_row():
+    row = {'id': 7, 'name': '张三', 'tags': ['a']}
+    record = LoadMapping('user:{id}', value_field='tags').build(3, row)
+    assert (record.line, record.key, record.key_type, record.value, record.ttl) == \
+        (3, 'user:7', 'string', '["a"]', None)
+    record = LoadMapping('user:{id}').build(1, row)
+    assert json.loads(record.value) == row
+    assert '张三' in record.value
+
+
+def test_hash_uses_selected_or_all_fields():
+    row = {'id': '1', 'name': 'a', 'age': 30}
+    assert LoadMapping('h:{id}', 'hash', fields=['name']).build(1, row).value == [('name', 'a')]
+    assert LoadMapping('h:{id}', 'hash').build(1, row).value == [('id', '1'), ('name', 'a'), ('age', '30')]
+
+
+def test_zset_and_list_elements():
+    row = {'id': 'x', 'member': 'm', 'score': '1.5'}
+    assert LoadMapping('z', 'zset', value_field='member', score_field='score').build(1, row).value == [('m', 1.5)]
+    assert LoadMapping('l', 'list', value_field='member').build(1, row).value == ['m']
+
+
+def test_nested_json_fields_in_key_template():
+    assert LoadMapping('user:{user[id]}').build(1, {'user': {'id': 9}}).key == 'user:9'
+
+
+@pytest.mark.parametrize('mapping, row', [
+    (LoadMapping('user:{id}'), {'name': 'a'}),                          # 键模板缺少字段
+    (LoadMapping('{id}'), {'id': ''}),                                  # 键名为空
+    (LoadMapping('k', 'list', value_field='v'), {'other': 1}),          # 缺少值字段
+    (LoadMapping('k', 'list', value_field='v'), {'v': None}),           # 值为空
+    (LoadMapping('k', 'zset', value_field='m', score_field='s'), {'m': 'a', 's': 'high'}),
+    (LoadMapping('k', ttl_field='ttl'), {'ttl': 'soon'}),
+    (LoadMapping('k', ttl_field='ttl'), {'ttl': -1}),
+])
+def test_bad_rows_raise_row_error(mapping, row):
+    with pytest.raises(RowError):
+        mapping.build(1, row)
+
+
+def test_ttl_field_takes_priority_over_fixed_ttl():
+    mapping = LoadMapping('k:{id}', ttl=60, ttl_field='ttl')
+    assert mapping.build(1, {'id': 1, 'ttl': '120'}).ttl == 120
+    assert mapping.build(1, {'id': 1, 'ttl': ''}).ttl == 60
+    assert mapping.build(1, {'id': 1}).ttl == 60
+    assert LoadMapping('k').build(1, {}).ttl is None
+
+
+def test_row_reader_reports_bad_lines(tmp_path):
+    path = tmp_path / 'rows.jsonl'
+    path.write_text('{"id": 1}\n\n{broken\n[1, 2]\n{"id": 2}\n', encoding='utf-8')
+    with RowReader(str(path)) as reader:
+        rows = list(reader)
+    assert rows[0] == (1, {'id': 1})
+    assert rows[-1] == (5, {'id': 2})
+    assert [(line, type(row)) for line, row in rows[1:3]] == [(3, RowError), (4, RowError)]
+
+
+def test_row_reader_csv(tmp_path):
+    path = tmp_path / 'rows.csv'
+    path.write_text('\ufeffid,name\n1,a\n2,b,extra\n', encoding='utf-8')
+    with RowReader(str(path)) as reader:
+        rows = list(reader)
+    assert rows[0] == (2, {'id': '1', 'name': 'a'})
+    assert rows[1][0] == 3 and isinstance(rows[1][1], RowError)
+
+
+class RecordingClient:
+    """记录 write_records 收到的批次，代替 RedisClient"""
+
+    def __init__(self):
+        self.batches = []
+
+    def write_records(self, records):
+        self.batches.append(list(records))
+        return len(records), []
+
+
+def write_rows(tmp_path, count):
+    path = tmp_path / 'rows.jsonl'
+    path.write_text(''.join(json.dumps({'id': i}) + '\n' for i in range(count)), encoding='utf-8')
+    return str(path)
+
+
+def test_dry_run_counts_records_without_writing(tmp_path):
+    client = RecordingClient()
+    loader = BulkLoader(client, LoadMapping('k:{id}'), batch_size=10, dry_run=True)
+    with RowReader(write_rows(tmp_path, 25)) as reader:
+        report = loader.run(reader)
+    assert (report.rows, report.written, report.keys_by_type) == (25, 25, {'string': 25})
+    assert client.batches == []
+
+
+def test_records_are_written_in_batches(tmp_path):
+    client = RecordingClient()
+    loader = BulkLoader(client, LoadMapping('k:{id}'), batch_size=10, threads=1)
+    with RowReader(write_rows(tmp_path, 25)) as reader:
+        report = loader.run(reader)
+    assert report.written == 25
+    assert [len(batch) for batch in client.batches] == [10, 10, 5]
+    assert [record.key for batch in client.batches for record in batch] == [f'k:{i}' for i in range(25)]
+
+
+def test_cancel_drops_unsubmitted_batches(tmp_path):
+    client = RecordingClient()
+    loader = BulkLoader(client, LoadMapping('k:{id}'), batch_size=10, threads=1)
+    checks = iter(range(100))
+    with RowReader(write_rows(tmp_path, 25)) as reader:
+        report = loader.run(reader, should_cancel=lambda: next(checks) >= 15)
+    assert report.rows == 15
+    assert report.written == 10
+    assert [len(batch) for batch in client.batches] == [10]
@@ -0,0 +1,84 @@
+import gzip
+
+import pytest
+
+from src.utils.dump_format import DumpFormatError, DumpReader, DumpWriter
+
+RECORDS = [
+    (b'user:1', 0, b'\x00\x05hello\x09\x00payload'),
+    (b'\xff\xfebinary', 1500, b''),
+    ('键'.encode('utf-8'), 2 ** 40, bytes(range(256)) * 10),
+]
+
+
+def write(path, records, complete=True):
+    writer = DumpWriter(str(path))
+    for record in records:
+        writer.write(*record)
+    writer.close(complete=complete)
+    return writer
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / 'keys.rdump.gz'
+    writer = write(path, RECORDS)
+    assert writer.count == 3
+    with DumpReader(str(path)) as reader:
+        assert list(reader.records()) == RECORDS
+        assert reader.position == path.stat().st_size
+
+
+def test_negative_ttl_is_stored_as_no_expiry(tmp_path):
+    path = tmp_path / 'keys.rdump.gz'
+    write(path, [(b'k', -1, b'v')])
+    with DumpReader(str(path)) as reader:
+        assert list(reader.records()) == [(b'k', 0, b'v')]
+
+
+def test_context_manager_skips_end_marker_on_error(tmp_path):
+    path = tmp_path / 'keys.rdump.gz'
+    with pytest.raises(RuntimeError):
+        with DumpWriter(str(path)) as writer:
+            writer.write(b'k', 0, b'v')
+            raise RuntimeError
+    with DumpReader(str(path)) as reader, pytest.raises(DumpFormatError):
+        list(reader.records())
+
+
+def test_incomplete_export_is_rejected(tmp_path):
+    path = tmp_path / 'keys.rdump.gz'
+    write(path, RECORDS, complete=False)
+    with DumpReader(str(path)) as reader:
+        records = reader.records()
+        assert next(records) == RECORDS[0]
+        with pytest.raises(DumpFormatError):
+            list(records)
+
+
+def test_truncated_file_is_rejected(tmp_path):
+    path = tmp_path / 'keys.rdump.gz'
+    write(path, RECORDS)
+    data = path.read_bytes()
+    path.write_bytes(data[:len(data) // 2])
+    with pytest.raises(DumpFormatError):
+        with DumpReader(str(path)) as reader:
+            list(reader.records())
+
+
+def test_other_files_are_rejected(tmp_path):
+    plain = tmp_path / 'plain.txt'
+    plain.write_bytes(b'not gzip at all')
+    with pytest.raises(DumpFormatError):
+        DumpReader(str(plain))
+
+    other = tmp_path / 'other.gz'
+    with gzip.open(str(other), 'wb') as f:
+        f.write(b'SOMETHING ELSE')
+    with pytest.raises(DumpFormatError):
+        DumpReader(str(other))
+
+    future = tmp_path / 'future.gz'
+    with gzip.open(str(future), 'wb') as f:
+        f.write(b'RGUIDUMP\x63')
+    with pytest.raises(DumpFormatError):
+        DumpReader(str(future))
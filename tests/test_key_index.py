@@ -0,0 +1,66 @@
+from src.utils import key_index
+from src.utils.key_index import KeySearchIndex
+
+
+def build(keys):
+    index = KeySearchIndex()
+    for key_id, key in enumerate(keys):
+        index.add(key_id, key)
+    return index
+
+
+def test_search_is_case_insensitive_substring_match():
+    index = build(['User:1', 'user:2', 'order:1', 'session:abc'])
+    assert sorted(index.snapshot().search('USER')) == [0, 1]
+    assert sorted(index.snapshot().search(':1')) == [0, 2]
+    assert list(index.snapshot().search('missing')) == []
+
+
+def test_each_key_matches_at_most_once():
+    index = build(['aaaa', 'a'])
+    assert sorted(index.snapshot().search('a')) == [0, 1]
+
+
+def test_matches_do_not_cross_key_boundaries():
+    index = build(['foo', 'bar'])
+    assert list(index.snapshot().search('foobar')) == []
+    assert list(index.snapshot().search('ob')) == []
+
+
+def test_keys_added_after_snapshot_go_into_new_segment():
+    index = build(['alpha'])
+    first = index.snapshot()
+    index.add(1, 'alphabet')
+    assert list(first.search('alpha')) == [0]
+    assert sorted(index.snapshot().search('alpha')) == [0, 1]
+    assert len(index) == 2
+
+
+def test_discard_and_re_add():
+    index = build(['a:1', 'a:2'])
+    index.snapshot()
+    index.discard(0)
+    assert list(index.snapshot().search('a:')) == [1]
+    assert len(index) == 1
+    index.add(0, 'a:1')
+    assert sorted(index.snapshot().search('a:')) == [0, 1]
+    assert len(index) == 2
+
+
+def test_compaction_drops_removed_keys(monkeypatch):
+    monkeypatch.setattr(key_index, 'COMPACT_MIN_REMOVED', 2)
+    index = build([f'key:{i}' for i in range(10)])
+    snapshot = index.snapshot()
+    index.add(10, 'key:10')  # 仍在暂存区
+    for key_id in (1, 2, 10):
+        index.discard(key_id)
+    # 已删除 3 个，超过 11 个的 25%，缓冲区已重建
+    assert index._removed == set()
+    assert len(index) == 8
+    assert sorted(index.snapshot().search('key:')) == [0, 3, 4, 5, 6, 7, 8, 9]
+    assert list(index.snapshot().search('key:1')) == []
+    # 旧快照不受重建影响
+    assert sorted(snapshot.search('key:1')) == [1]
+    # 重建后重新加入的键可以再次搜到
+    index.add(1, 'key:1')
+    assert list(index.snapshot().search('key:1')) == [1]
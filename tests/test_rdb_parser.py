@@ -0,0 +1,220 @@
+import shutil
+import socket
+import struct
+import subprocess
+import time
+
+import pytest
+
+from src.utils.rdb_parser import RdbError, RdbParser, lzf_decompress
+
+# ---- 构造 RDB 文件 ----
+
+
+def length(n: int) -> bytes:
+    if n < 1 << 6:
+        return bytes([n])
+    if n < 1 << 14:
+        return bytes([0x40 | (n >> 8), n & 0xFF])
+    return b'\x80' + struct.pack('>I', n)
+
+
+def string(data: bytes) -> bytes:
+    return length(len(data)) + data
+
+
+def int8_string(value: int) -> bytes:
+    return b'\xc0' + struct.pack('<b', value)
+
+
+def lzf_string(compressed: bytes, original_length: int) -> bytes:
+    return b'\xc3' + length(len(compressed)) + length(original_length) + compressed
+
+
+# "abc" 字面量后接一个长度为 9、回溯 3 字节的引用，解压为 "abc" * 4
+LZF_ABC = b'\x02abc\xe0\x00\x02'
+
+
+def ziplist(items) -> bytes:
+    entries = b''
+    previous = 0
+    for item in items:
+        entry = bytes([previous]) + bytes([len(item)]) + item
+        entries += entry
+        previous = len(entry)
+    total = 10 + len(entries) + 1
+    return struct.pack('<IIH', total, total - 1 - previous, len(items)) + entries + b'\xff'
+
+
+def listpack(items) -> bytes:
+    entries = b''
+    for item in items:
+        entry = bytes([0x80 | len(item)]) + item
+        entries += entry + bytes([len(entry)])
+    return struct.pack('<IH', 6 + len(entries) + 1, len(items)) + entries + b'\xff'
+
+
+def intset(values) -> bytes:
+    return struct.pack('<II', 2, len(values)) + b''.join(struct.pack('<h', v) for v in values)
+
+
+def rdb(*parts, version=b'0011') -> bytes:
+    return b'REDIS' + version + b''.join(parts) + b'\xff' + b'\x00' * 8
+
+
+def aux(name: bytes, value: bytes) -> bytes:
+    return b'\xfa' + string(name) + value
+
+
+def key(value_type: int, name: bytes, value: bytes) -> bytes:
+    return bytes([value_type]) + name + value
+
+
+def parse(tmp_path, data: bytes):
+    path = tmp_path / 'dump.rdb'
+    path.write_bytes(data)
+    with RdbParser(str(path)) as parser:
+        return parser, list(parser.entries())
+
+
+# ---- 测试 ----
+
+
+def test_lzf_decompress_handles_overlapping_back_references():
+    assert lzf_decompress(LZF_ABC, 12) == b'abc' * 4
+
+
+@pytest.mark.parametrize('data', [b'\x05ab', b'\x02abc\xe0', b'\x02abc\x20\x10', b'\x02abc\xe0\x00'])
+def test_lzf_decompress_rejects_corrupt_data(data):
+    with pytest.raises(RdbError):
+        lzf_decompress(data, 12)
+
+
+def test_compact_encodings(tmp_path):
+    values = {
+        b'str': (0, string(b'hello')),
+        b'ints': (11, string(intset([1, 2, 300]))),
+        b'zl:list': (10, string(ziplist([b'a', b'b']))),
+        b'zl:zset': (12, string(ziplist([b'm', b'1']))),
+        b'zl:hash': (13, string(ziplist([b'f', b'v']))),
+        b'lp:hash': (16, string(listpack([b'f', b'v']))),
+        b'lp:zset': (17, string(listpack([b'm', b'1']))),
+        b'lp:set': (20, string(listpack([b'x', b'y']))),
+        b'ql': (14, length(2) + string(ziplist([b'a'])) + string(ziplist([b'b']))),
+        b'ql2': (18, length(1) + length(2) + string(listpack([b'a', b'b']))),
+    }
+    parts = [aux(b'redis-ver', string(b'7.2.0')), aux(b'ctime', int8_string(100)),
+             b'\xfe' + length(0), b'\xfb' + length(len(values)) + length(0)]
+    parts += [key(value_type, string(name), value) for name, (value_type, value) in values.items()]
+    parser, entries = parse(tmp_path, rdb(*parts))
+
+    assert parser.version == 11
+    assert parser.aux == {'redis-ver': '7.2.0', 'ctime': '100'}
+    assert parser.snapshot_time_ms() == 100000
+    assert [e.key for e in entries] == list(values)
+    assert [e.key_type for e in entries] == ['string', 'set', 'list', 'zset', 'hash',
+                                             'hash', 'zset', 'set', 'list', 'list']
+    assert [e.size for e in entries] == [len(value) for _, value in values.values()]
+    assert all(e.db == 0 and e.expire_ms is None for e in entries)
+
+
+def test_lzf_compressed_key_and_value(tmp_path):
+    compressed_value = lzf_string(LZF_ABC, 12)
+    _, entries = parse(tmp_path, rdb(
+        aux(b'note', lzf_string(LZF_ABC, 12)),
+        key(0, lzf_string(LZF_ABC, 12), compressed_value),
+        key(0, int8_string(-5), string(b'v')),
+    ))
+    assert [e.key for e in entries] == [b'abc' * 4, b'-5']
+    assert entries[0].size == len(compressed_value)
+
+
+def test_expiry_opcodes_apply_to_the_next_key_only(tmp_path):
+    _, entries = parse(tmp_path, rdb(
+        b'\xfe' + length(0),
+        b'\xfc' + struct.pack('<q', 1700000000123) + key(0, string(b'ms'), string(b'v')),
+        b'\xfd' + struct.pack('<i', 1700000000) + key(0, string(b'seconds'), string(b'v')),
+        b'\xf8' + length(10) + key(0, string(b'idle'), string(b'v')),
+        b'\xfe' + length(3),
+        b'\xf9\x05' + key(0, string(b'freq'), string(b'v')),
+    ))
+    assert [(e.key, e.db, e.expire_ms) for e in entries] == [
+        (b'ms', 0, 1700000000123),
+        (b'seconds', 0, 1700000000000),
+        (b'idle', 0, None),
+        (b'freq', 3, None),
+    ]
+
+
+def test_truncated_file_raises_rdb_error(tmp_path):
+    data = rdb(
+        b'\xfc' + struct.pack('<q', 1),
+        key(0, lzf_string(LZF_ABC, 12), string(b'value')),
+        key(16, string(b'h'), string(listpack([b'f', b'v']))),
+    )
+    for end in range(1, len(data) - 8):
+        with pytest.raises(RdbError):
+            parse(tmp_path, data[:end])
+
+
+def test_corrupt_lzf_key_raises_rdb_error(tmp_path):
+    with pytest.raises(RdbError):
+        parse(tmp_path, rdb(key(0, lzf_string(b'\x02abc\xe0', 12), string(b'v'))))
+
+
+def test_unknown_opcode_raises_rdb_error(tmp_path):
+    with pytest.raises(RdbError):
+        parse(tmp_path, rdb(b'\x63'))
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.skipif(shutil.which('redis-server') is None, reason="需要 redis-server")
+def test_file_saved_by_redis_server(tmp_path):
+    redis = pytest.importorskip('redis')
+    port = _free_port()
+    server = subprocess.Popen(['redis-server', '--port', str(port), '--bind', '127.0.0.1',
+                               '--dir', str(tmp_path), '--save', '', '--appendonly', 'no'],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        client = redis.Redis(port=port)
+        for _ in range(50):
+            try:
+                client.ping()
+                break
+            except redis.ConnectionError:
+                time.sleep(0.1)
+        client.set('string', 'x' * 100)           # 可压缩的长字符串以 LZF 保存
+        client.set('counter', 12345)              # 整数编码
+        client.set('expiring', 'v', px=600000)
+        client.sadd('intset', 1, 2, 3)
+        client.sadd('set', *[f'member{i}' for i in range(200)])
+        client.hset('small_hash', mapping={'a': '1', 'b': '2'})
+        client.zadd('small_zset', {'a': 1, 'b': 2})
+        client.rpush('list', *range(10))
+        client.xadd('stream', {'field': 'value'})
+        client.select(2)
+        client.set('other_db', 'v')
+        client.save()
+        expected_expire = int(time.time() * 1000) + 600000
+        version = client.info('server')['redis_version']
+    finally:
+        server.terminate()
+        server.wait(10)
+
+    with RdbParser(str(tmp_path / 'dump.rdb')) as parser:
+        entries = {e.key: e for e in parser.entries()}
+        assert parser.aux['redis-ver'] == version
+    assert {key: e.key_type for key, e in entries.items()} == {
+        b'string': 'string', b'counter': 'string', b'expiring': 'string',
+        b'intset': 'set', b'set': 'set', b'small_hash': 'hash', b'small_zset': 'zset',
+        b'list': 'list', b'stream': 'stream', b'other_db': 'string',
+    }
+    assert entries[b'other_db'].db == 2
+    assert entries[b'string'].size < 100
+    assert abs(entries[b'expiring'].expire_ms - expected_expire) < 5000
+    assert all(e.expire_ms is None for key, e in entries.items() if key != b'expiring')
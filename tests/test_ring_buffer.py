@@ -0,0 +1,59 @@
+import bisect
+
+import pytest
+
+from src.utils.ring_buffer import RingBuffer
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        RingBuffer(0)
+
+
+def test_fills_before_wrapping():
+    buffer = RingBuffer(4)
+    assert len(buffer) == 0
+    assert buffer.latest() is None
+    assert buffer.latest(-1) == -1
+    for value in (1, 2, 3):
+        buffer.append(value)
+    assert list(buffer) == [1, 2, 3]
+    assert (buffer[0], buffer[-1], buffer.latest()) == (1, 3, 3)
+
+
+def test_overwrites_oldest_when_full():
+    buffer = RingBuffer(3, 'q')
+    for value in range(1, 8):
+        buffer.append(value)
+    assert len(buffer) == 3
+    assert list(buffer) == [5, 6, 7]
+    assert [buffer[i] for i in range(-3, 3)] == [5, 6, 7, 5, 6, 7]
+
+
+def test_index_out_of_range():
+    buffer = RingBuffer(2)
+    buffer.append(1.0)
+    with pytest.raises(IndexError):
+        buffer[1]
+    with pytest.raises(IndexError):
+        buffer[-2]
+
+
+def test_bisect_on_wrapped_timestamps():
+    buffer = RingBuffer(5)
+    for timestamp in range(10, 80, 10):
+        buffer.append(timestamp)
+    assert list(buffer) == [30, 40, 50, 60, 70]
+    assert bisect.bisect_left(buffer, 55) == 3
+    assert bisect.bisect_left(buffer, 10) == 0
+
+
+def test_clear():
+    buffer = RingBuffer(2)
+    buffer.append(1)
+    buffer.append(2)
+    buffer.append(3)
+    buffer.clear()
+    assert len(buffer) == 0 and list(buffer) == []
+    buffer.append(4)
+    assert list(buffer) == [4]
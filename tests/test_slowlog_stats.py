@@ -0,0 +1,76 @@
+import pytest
+
+from src.redis_client import SlowlogEntry
+from src.utils import slowlog_stats
+from src.utils.slowlog_stats import SlowlogStats, command_and_key, normalize_key, percentile
+
+
+@pytest.mark.parametrize('args, expected', [
+    ([], ('', None)),
+    (['get', 'user:1'], ('GET', 'user:1')),
+    (['PING'], ('PING', None)),
+    (['CONFIG', 'get', 'maxmemory'], ('CONFIG GET', None)),
+    (['MEMORY', 'usage', 'big:key'], ('MEMORY USAGE', 'big:key')),
+    (['OBJECT'], ('OBJECT', None)),
+    (['EVALSHA', 'abc', '1', 'lock:1', 'arg'], ('EVALSHA', 'lock:1')),
+    (['EVAL', 'return 1', '0'], ('EVAL', None)),
+])
+def test_command_and_key(args, expected):
+    assert command_and_key(args) == expected
+
+
+@pytest.mark.parametrize('key, expected', [
+    ('user:1001:profile', 'user:*:profile'),
+    ('session:9f86d081884c7d65', 'session:*'),
+    ('job:123e4567-e89b-12d3-a456-426614174000:state', 'job:*:state'),
+    ('a:b:c:d:e', 'a:b:c:*'),
+    ('cache:page:home', 'cache:page:home'),
+    ('user:42... (1000 more bytes)', 'user:*'),
+])
+def test_normalize_key(key, expected):
+    assert normalize_key(key) == expected
+
+
+def test_percentile_uses_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert percentile([7], 50) == 7
+    assert percentile([], 50) == 0.0
+
+
+def entry(entry_id, duration, *args, timestamp=1000):
+    return SlowlogEntry(entry_id, timestamp, duration, list(args))
+
+
+def test_groups_by_command_and_prefix():
+    stats = SlowlogStats()
+    stats.extend([
+        entry(1, 100, 'GET', 'user:1', timestamp=10),
+        entry(2, 300, 'GET', 'user:2', timestamp=30),
+        entry(3, 200, 'get', 'user:3', timestamp=20),
+        entry(4, 50, 'HGETALL', 'user:1'),
+        entry(5, 10, 'PING'),
+    ])
+    groups = {(g.command, g.prefix): g for g in stats.groups()}
+    assert set(groups) == {('GET', 'user:*'), ('HGETALL', 'user:*'), ('PING', '')}
+    get = groups[('GET', 'user:*')]
+    assert (get.count, get.total, get.max_duration, get.last_seen) == (3, 600, 300, 30)
+    assert get.average == 200
+    assert get.percentile(50) == 200
+    assert (stats.entries, stats.total) == (5, 660)
+
+    stats.clear()
+    assert stats.groups() == [] and stats.entries == 0
+
+
+def test_sampling_keeps_exact_count_and_total(monkeypatch):
+    monkeypatch.setattr(slowlog_stats, 'MAX_SAMPLES_PER_GROUP', 10)
+    stats = SlowlogStats()
+    stats.extend(entry(i, i, 'GET', 'k') for i in range(1, 101))
+    group = stats.groups()[0]
+    assert group.count == 100
+    assert group.total == sum(range(1, 101))
+    assert group.max_duration == 100
+    assert len(group.samples) == 10
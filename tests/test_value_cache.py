@@ -0,0 +1,72 @@
+from src.utils import value_cache
+from src.utils.value_cache import ValueCache, CachedValue
+
+
+def entry(value='v'):
+    return CachedValue('string', -1, value)
+
+
+def test_put_and_get():
+    cache = ValueCache()
+    cache.put('a', entry('1'))
+    assert cache.get('a').value == '1'
+    assert cache.get('b') is None
+
+
+def test_evicts_least_recently_used():
+    cache = ValueCache(max_bytes=300)
+    for key in 'abc':
+        cache.put(key, CachedValue('string', -1, 'x', size=100))
+    cache.get('a')
+    cache.put('d', CachedValue('string', -1, 'x', size=100))
+    assert [cache.contains(key) for key in 'abcd'] == [True, False, True, True]
+    assert cache.total_bytes == 300
+
+
+def test_put_without_version_always_writes():
+    cache = ValueCache()
+    cache.invalidate('a')
+    cache.put('a', entry())
+    assert cache.contains('a')
+
+
+def test_put_skips_value_read_before_invalidation():
+    cache = ValueCache()
+    version = cache.version()
+    cache.invalidate('a')
+    cache.put('a', entry('old'), version)
+    assert not cache.contains('a')
+    # 其他键不受影响
+    cache.put('b', entry(), version)
+    assert cache.contains('b')
+    # 失效之后开始的读取正常写入
+    cache.put('a', entry('new'), cache.version())
+    assert cache.get('a').value == 'new'
+
+
+def test_invalidate_where_and_clear_reject_pending_reads():
+    cache = ValueCache()
+    version = cache.version()
+    cache.invalidate_where(lambda key: False)
+    cache.put('a', entry(), version)
+    assert not cache.contains('a')
+
+    version = cache.version()
+    cache.clear()
+    cache.put('a', entry(), version)
+    assert not cache.contains('a')
+
+
+def test_old_invalidations_fold_into_floor(monkeypatch):
+    monkeypatch.setattr(value_cache, 'MAX_INVALIDATION_STAMPS', 2)
+    cache = ValueCache()
+    version = cache.version()
+    for key in 'abc':
+        cache.invalidate(key)
+    # 'a' 的记录已被合并，仍按最保守的版本号拒绝
+    cache.put('a', entry(), version)
+    cache.put('d', entry(), version)
+    assert not cache.contains('a')
+    assert not cache.contains('d')
+    cache.put('d', entry(), cache.version())
+    assert cache.contains('d')
@@ -0,0 +1,44 @@
+from src.utils.value_diff import ValueDelta, diff_list, diff_mapping, diff_members
+
+
+def test_diff_mapping_reports_changed_added_and_removed_fields():
+    delta = diff_mapping({'a': '1', 'b': '2', 'c': '3'}, [('a', '1'), ('b', '20'), ('d', '4')])
+    assert delta.updates == {'b': '20', 'd': '4'}
+    assert delta.removals == ['c']
+    assert delta.appends == []
+    assert delta.change_count() == 3
+
+
+def test_diff_mapping_compares_zset_scores():
+    delta = diff_mapping({'m': 1.0, 'n': 2.0}, [('m', 1.0), ('n', 2.5)])
+    assert delta.updates == {'n': 2.5}
+    assert delta.removals == []
+
+
+def test_unchanged_values_produce_an_empty_delta():
+    assert diff_mapping({'a': '1'}, [('a', '1')]).is_empty
+    assert diff_members(['x', 'y'], ['y', 'x']).is_empty
+    assert diff_list({0: 'a', 1: 'b'}, [(0, 'a'), (1, 'b')]).is_empty
+    assert ValueDelta().is_empty
+
+
+def test_diff_members():
+    delta = diff_members(['a', 'b', 'c'], ['b', 'c', 'd', 'e'])
+    assert sorted(delta.updates) == ['d', 'e']
+    assert delta.removals == ['a']
+
+
+def test_diff_list_tracks_original_indexes():
+    original = {0: 'a', 1: 'b', 2: 'c', 3: 'd'}
+    # 删除索引 1，修改索引 2，末尾追加两个新行
+    delta = diff_list(original, [(0, 'a'), (2, 'C'), (3, 'd'), (None, 'e'), (None, 'f')])
+    assert delta.updates == {2: 'C'}
+    assert delta.removals == [1]
+    assert delta.appends == ['e', 'f']
+    assert delta.change_count() == 4
+
+
+def test_diff_list_only_considers_loaded_page():
+    # 只加载了索引 100-101 的一页，未加载的元素不会被当作删除
+    delta = diff_list({100: 'x', 101: 'y'}, [(101, 'y'), (100, 'x')])
+    assert delta.is_empty